@@ -0,0 +1,51 @@
+'''
+Compares the size of a delta per point against the size of the whole match encoded by tennis.codec,
+and measures the number of deltas encoded and decoded per second, for a corpus of finished
+best-of-three matches with a keyframe every 100 points.
+
+Usage: python -m benchmarks.delta [number of matches]
+'''
+import random
+import sys
+import time
+
+import tennis
+from benchmarks import random_matches
+
+def main():
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+  generator = random.Random(0)
+  deltas = []
+  full = 0
+  encoding = 0.0
+  for i in range(number):
+    match = tennis.Match()
+    encoder = tennis.DeltaEncoder(keyframe_interval=100)
+    deltas.append([encoder.encode(match=match)])
+    while match.winner is None:
+      match.point(first_server=random_matches.first_server(generator, match))
+      start = time.perf_counter()
+      deltas[-1].append(encoder.encode(match=match))
+      encoding += time.perf_counter() - start
+      full += len(match.to_bytes())
+
+  decoding = 0.0
+  for match_deltas in deltas:
+    decoder = tennis.DeltaDecoder()
+    start = time.perf_counter()
+    for data in match_deltas:
+      decoder.decode(data=data)
+
+    decoding += time.perf_counter() - start
+
+  points = sum(len(match_deltas) - 1 for match_deltas in deltas)
+  sizes = [len(data) for match_deltas in deltas for data in match_deltas[1:] if data[0] != 1]
+  keyframes = sum(len(data) for match_deltas in deltas for data in match_deltas if data[0] == 1)
+  print('full match  {:6.2f} bytes/point'.format(full / points))
+  print('delta       {:6.2f} bytes/point ({} max)'.format(sum(sizes) / len(sizes), max(sizes)))
+  print('keyframes   {:6.2f} bytes/point'.format((sum(sizes) + keyframes) / points))
+  print('encode      {:8.0f} points/s'.format(points / encoding))
+  print('decode      {:8.0f} deltas/s'.format(sum(map(len, deltas)) / decoding))
+
+if __name__ == '__main__':
+  main()
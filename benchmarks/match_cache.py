@@ -0,0 +1,74 @@
+'''
+Measures the time per point of playing points in many live matches through a match cache whose
+capacity holds a tenth of them, where most points are played in a small set of busy matches, and
+prints the cache's counters and the median and 99th percentile latency of hits, misses and spills.
+
+Usage: python -m benchmarks.match_cache [number of matches]
+'''
+import os
+import random
+import sys
+import tempfile
+import time
+
+import tennis
+from benchmarks import random_matches
+
+'''
+:param list histogram: histogram of latencies kept by a MatchCache
+:param float fraction: fraction of the operations that are at least as fast as the percentile
+:return: the upper bound of the bucket of the percentile, in microseconds
+'''
+def percentile(histogram, fraction):
+  total = sum(histogram)
+  count = 0
+  for i, bucket in enumerate(histogram):
+    count += bucket
+    if count >= fraction * total:
+      return 2 ** i
+
+def main():
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+  generator = random.Random(0)
+  with tempfile.TemporaryDirectory() as directory:
+    store = tennis.MatchStore(path=os.path.join(directory, 'matches.db'))
+    with tennis.MatchCache(store=store, capacity=number // 10) as cache:
+      busy = number // 20
+      points = 0
+      start = time.perf_counter()
+      for i in range(20 * number):
+        match_id = str(generator.randrange(busy) if generator.random() < 0.9 else
+          generator.randrange(number))
+        match = cache.get(match_id=match_id)
+        if match is None or match.winner is None:
+          cache.point(
+            match_id=match_id,
+            first_server=random_matches.first_server(generator, match)
+          )
+          points += 1
+
+      elapsed = time.perf_counter() - start
+      print('{} points in {} matches: {:.1f} us/point'.format(
+        points,
+        number,
+        1e6 * elapsed / points
+      ))
+      print('{} hits, {} misses, {} spills, {} matches in memory'.format(
+        cache.hits,
+        cache.misses,
+        cache.spills,
+        len(cache)
+      ))
+      for name, histogram in (
+        ('hit', cache.hit_latencies),
+        ('miss', cache.miss_latencies),
+        ('spill', cache.spill_latencies)
+      ):
+        print('{:5} latency: p50 < {} us, p99 < {} us'.format(
+          name,
+          percentile(histogram, 0.5),
+          percentile(histogram, 0.99)
+        ))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,39 @@
+'''
+Measures the time per point of playing matches with 0, 1 and 10 observers subscribed, each of which
+does nothing with the events it is given.
+
+Usage: python -m benchmarks.match_observers [number of matches]
+'''
+import random
+import sys
+import time
+
+import tennis
+from benchmarks import random_matches
+
+'''
+:param event: event emitted by a match
+'''
+def observer(event):
+  pass
+
+def main():
+  sequences = random_matches.sequences(
+    random.Random(0),
+    int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+  )
+  points = sum(len(sequence) for sequence in sequences)
+  for observers in (0, 1, 10):
+    start = time.perf_counter()
+    for sequence in sequences:
+      match = tennis.Match()
+      for i in range(observers):
+        match.subscribe(observer=observer)
+
+      match.points(first_servers=sequence)
+
+    elapsed = time.perf_counter() - start
+    print('{:2} observers {:6.2f} us/point'.format(observers, 1e6 * elapsed / points))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,50 @@
+'''
+Compares the size and speed of pickling a five-set match with its compact encoding against pickling
+every nested set and game.
+
+Usage: python -m benchmarks.match_pickle
+'''
+import pickle
+import random
+import timeit
+
+import tennis
+from benchmarks import random_matches
+
+class DefaultPickleMatch(tennis.Match):
+  '''
+  Match that is pickled with the default protocol, as before matches had a compact encoding.
+  '''
+  __reduce__ = object.__reduce__
+
+'''
+:param type cls: Match or a subclass of it
+:return: a finished five-set match
+'''
+def five_set_match(cls):
+  match = cls(target_sets=3)
+  generator = random.Random(3)
+  while match.winner is None:
+    match.point(first_server=random_matches.first_server(generator, match))
+
+  return match
+
+def main():
+  for name, cls in (('default', DefaultPickleMatch), ('compact', tennis.Match)):
+    match = five_set_match(cls)
+    data = pickle.dumps(match)
+    number = 2000
+    dumps = timeit.timeit(lambda: pickle.dumps(match), number=number) / number
+    loads = timeit.timeit(lambda: pickle.loads(data), number=number) / number
+
+    print('{:8} {:6} bytes  dumps {:7.1f} us  loads {:7.1f} us  ({} sets, {} games)'.format(
+      name,
+      len(data),
+      dumps * 1e6,
+      loads * 1e6,
+      len(match.sets),
+      sum(len(zet.games) for zet in match.sets)
+    ))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,25 @@
+'''
+Reports the throughput of replaying a corpus of finished matches from shared memory with 1, 2, 4 and
+8 worker processes.
+
+Usage: python -m benchmarks.match_replay [number of matches]
+'''
+import random
+import sys
+import time
+
+import tennis
+from benchmarks import random_matches
+
+def main():
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+  sequences = random_matches.sequences(random.Random(0), number)
+  with tennis.Corpus(sequences=sequences) as matches:
+    for workers in (1, 2, 4, 8):
+      start = time.perf_counter()
+      matches.replay(workers=workers)
+      elapsed = time.perf_counter() - start
+      print('{} workers  {:9.0f} matches/s'.format(workers, number / elapsed))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,68 @@
+'''
+Measures the throughput of importing matches into a match store with each batch size, and the time
+to query the matches won by the first server with and without decoding them.
+
+Usage: python -m benchmarks.match_store [number of matches]
+'''
+import os
+import random
+import sys
+import tempfile
+import time
+
+import tennis
+from benchmarks import random_matches
+
+'''
+:param random.Random generator: random number generator
+:param int number: number of matches
+:return: a list of a (match id, match) tuple for each match, of which every tenth is live
+'''
+def matches(generator, number):
+  result = []
+  for i in range(number):
+    match = tennis.Match()
+    while match.winner is None and (i % 10 or generator.random() < 0.99):
+      match.point(first_server=random_matches.first_server(generator, match))
+
+    result.append((str(i), match))
+
+  return result
+
+def main():
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+  corpus = matches(random.Random(0), number)
+  with tempfile.TemporaryDirectory() as directory:
+    for batch_size in (1, 100, 1000, 10000):
+      path = os.path.join(directory, str(batch_size))
+      imported = corpus if batch_size >= 100 else corpus[:2000]
+      with tennis.MatchStore(path=path, batch_size=batch_size) as store:
+        start = time.perf_counter()
+        store.put_many(matches=imported)
+        store.flush()
+        elapsed = time.perf_counter() - start
+
+      print('batch size {:5} {:10.0f} matches/s, {:.1f} MB'.format(
+        batch_size,
+        len(imported) / elapsed,
+        os.path.getsize(path) / 1e6
+      ))
+
+    with tennis.MatchStore(path=path) as store:
+      start = time.perf_counter()
+      stored = store.query(winner=True)
+      elapsed = time.perf_counter() - start
+      print('queried {} of {} matches in {:.3f} s'.format(len(stored), len(store), elapsed))
+
+      start = time.perf_counter()
+      sets = sum(len(stored_match.match.sets) for stored_match in stored)
+      elapsed = time.perf_counter() - start
+      print('decoded {} matches with {} sets in {:.3f} s'.format(len(stored), sets, elapsed))
+
+      start = time.perf_counter()
+      count = store.count(live=True)
+      elapsed = time.perf_counter() - start
+      print('counted {} live matches in {:.4f} s'.format(count, elapsed))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,69 @@
+'''
+Compares the size and decoding speed of arithmetic-coded points against points packed as one bit
+each and compressed with zlib and lzma, for a corpus of finished best-of-three matches coded one
+match at a time. Decoding includes replaying the points into a match in every case.
+
+Usage: python -m benchmarks.point_coding [number of matches]
+'''
+import lzma
+import random
+import sys
+import time
+import zlib
+
+import tennis
+from benchmarks import random_matches
+
+'''
+:param list sequence: a boolean for each point
+:return: the number of points as two bytes followed by the points packed as a bit array
+'''
+def pack(sequence):
+  return len(sequence).to_bytes(2, 'little') + sum(
+    1 << i for i, first_server in enumerate(sequence) if first_server
+  ).to_bytes((len(sequence) + 7) // 8, 'little')
+
+'''
+:param bytes data: points packed by pack
+:return: a match with the points replayed into it
+'''
+def unpack(data):
+  length = int.from_bytes(data[:2], 'little')
+  bits = int.from_bytes(data[2:], 'little')
+  match = tennis.Match()
+  match.points(first_servers=(bool(bits >> i & 1) for i in range(length)))
+  return match
+
+def main():
+  sequences = random_matches.sequences(
+    random.Random(0),
+    int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+  )
+  points = sum(len(sequence) for sequence in sequences)
+  codecs = (
+    ('packed bits', pack, unpack),
+    ('zlib', lambda s: zlib.compress(pack(s), 9), lambda d: unpack(zlib.decompress(d))),
+    ('lzma', lambda s: lzma.compress(pack(s)), lambda d: unpack(lzma.decompress(d))),
+    (
+      'arithmetic',
+      lambda s: tennis.encode_points(first_servers=s),
+      lambda d: tennis.decode_points(data=d)
+    )
+  )
+  for name, encode, decode in codecs:
+    data = [encode(sequence) for sequence in sequences]
+    start = time.perf_counter()
+    for item in data:
+      decode(item)
+
+    elapsed = time.perf_counter() - start
+    size = sum(len(item) for item in data)
+    print('{:12} {:7.2f} bytes/match  {:5.3f} bits/point  decode {:7.1f} us/match'.format(
+      name,
+      size / len(sequences),
+      8 * size / points,
+      1e6 * elapsed / len(sequences)
+    ))
+
+if __name__ == '__main__':
+  main()
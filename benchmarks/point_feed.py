@@ -0,0 +1,51 @@
+'''
+Compares the time per point of scoring a corpus of matches directly against ingesting each match
+from three redundant feeds through a PointFeed, where each feed delivers every point with up to
+eight points of reordering, so that two of every three events are duplicates.
+
+Usage: python -m benchmarks.point_feed [number of matches]
+'''
+import random
+import sys
+import time
+
+import tennis
+from benchmarks import random_matches
+
+def main():
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+  generator = random.Random(0)
+  sequences = random_matches.sequences(generator, number)
+  feeds = []
+  for sequence in sequences:
+    events = []
+    for j in range(3):
+      events.extend(sorted(
+        enumerate(sequence),
+        key=lambda event: (event[0] + generator.randrange(8), generator.random())
+      ))
+
+    events.sort(key=lambda event: (event[0] + generator.randrange(8), generator.random()))
+    feeds.append(events)
+
+  points = sum(len(sequence) for sequence in sequences)
+  start = time.perf_counter()
+  for sequence in sequences:
+    tennis.Match().points(first_servers=sequence)
+
+  scoring = time.perf_counter() - start
+  start = time.perf_counter()
+  for events in feeds:
+    feed = tennis.PointFeed(window=16)
+    feed.points(events=events)
+
+  ingesting = time.perf_counter() - start
+  print('scoring    {:5.2f} us/point'.format(1e6 * scoring / points))
+  print('ingesting  {:5.2f} us/point, {:5.2f} us/event for {} events per point'.format(
+    1e6 * ingesting / points,
+    1e6 * ingesting / sum(len(events) for events in feeds),
+    sum(len(events) for events in feeds) // points
+  ))
+
+if __name__ == '__main__':
+  main()
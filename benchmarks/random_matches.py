@@ -0,0 +1,34 @@
+'''
+Random points and matches shared by the benchmarks, in which the server wins each point with
+probability 0.64, whoever serves.
+'''
+import tennis
+
+'''
+:param random.Random generator: random number generator
+:param Match match: match that the point is played in, or None for a match that has not started
+:return: True if the first server wins the match's next point, and False otherwise
+'''
+def first_server(generator, match):
+  first_server_to_serve = match is None or match.first_server_to_serve()
+  return generator.random() < (0.64 if first_server_to_serve else 0.36)
+
+'''
+:param random.Random generator: random number generator
+:param int number: number of matches
+:param kwargs: arguments of tennis.Match for every match
+:return: a list with the points of each of the input number of finished matches, as booleans that
+         are True if the first server won the point
+'''
+def sequences(generator, number, **kwargs):
+  result = []
+  for i in range(number):
+    match = tennis.Match(**kwargs)
+    sequence = []
+    while match.winner is None:
+      sequence.append(first_server(generator, match))
+      match.point(first_server=sequence[-1])
+
+    result.append(sequence)
+
+  return result
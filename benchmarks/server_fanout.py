@@ -0,0 +1,133 @@
+'''
+Measures the throughput of a live-scoring server on a Unix socket with thousands of matches and
+tens of thousands of subscriptions, with the server and every client on one event loop. A scorer
+plays the points of every match interleaved, and each subscriber reads until it has the final score
+of every match it is subscribed to. Updates that a subscriber has not read yet are conflated, so
+subscribers receive fewer updates than points played in their matches.
+
+Usage: python -m benchmarks.server_fanout [matches] [subscribers] [subscriptions per subscriber]
+'''
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+import tennis
+import tennis.server
+from benchmarks import random_matches
+
+'''
+:param int number: number of matches
+:return: a list with the points of each of the input number of finished matches, as S if the server
+         won the point and R otherwise, and a list with the final scoreline of each match
+'''
+def corpus(number):
+  sequences = []
+  scorelines = []
+  for first_servers in random_matches.sequences(random.Random(0), number):
+    match = tennis.Match()
+    sequence = []
+    for first_server in first_servers:
+      sequence.append('S' if first_server == match.first_server_to_serve() else 'R')
+      match.point(first_server=first_server)
+
+    sequences.append(sequence)
+    scorelines.append(match.scoreline())
+
+  return sequences, scorelines
+
+'''
+:param str path: path of the server's Unix socket
+:param list match_ids: ids of the matches to subscribe to
+:param dict finals: dictionary that maps the id of each match to its final score message
+:param ready: callable to call once the subscriptions have been made
+:param asyncio.Semaphore connecting: semaphore that limits the number of connections made at once,
+                                     which must not exceed the server's backlog
+:param asyncio.Event start: event to wait for before waiting for the final scores
+:return: a tuple of the number of score messages read and the time the last one was read
+'''
+async def subscriber(path, match_ids, finals, ready, connecting, start):
+  async with connecting:
+    reader, writer = await asyncio.open_unix_connection(path)
+
+  writer.write(''.join('subscribe {}\n'.format(match_id) for match_id in match_ids).encode())
+  for match_id in match_ids:
+    await reader.readline()
+
+  ready()
+  await start.wait()
+  waiting = {finals[match_id] for match_id in match_ids}
+  messages = 0
+  while waiting:
+    waiting.discard(await reader.readline())
+    messages += 1
+
+  writer.close()
+  return messages, time.perf_counter()
+
+async def run(matches, subscribers, subscriptions):
+  sequences, scorelines = corpus(matches)
+  finals = {
+    str(i): 'score {} {}\n'.format(i, scoreline).encode() for i, scoreline in enumerate(scorelines)
+  }
+  generator = random.Random(1)
+  server = tennis.server.Server()
+  with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, 'socket')
+    listener = await server.start(path=path)
+    start = asyncio.Event()
+    connecting = asyncio.Semaphore(1000)
+    ready = []
+    match_ids = [
+      [str(j) for j in generator.sample(range(matches), subscriptions)] for i in range(subscribers)
+    ]
+    tasks = [
+      asyncio.get_running_loop().create_task(
+        subscriber(path, ids, finals, lambda: ready.append(None), connecting, start)
+      )
+      for ids in match_ids
+    ]
+    while len(ready) < subscribers:
+      await asyncio.sleep(0.01)
+
+    reader, writer = await asyncio.open_unix_connection(path)
+    commands = [
+      'point {} {}\n'.format(i, sequence[j])
+      for j in range(max(len(sequence) for sequence in sequences))
+      for i, sequence in enumerate(sequences) if j < len(sequence)
+    ]
+    start.set()
+    began = time.perf_counter()
+    for i in range(0, len(commands), 1000):
+      writer.write(''.join(commands[i:i + 1000]).encode())
+      await writer.drain()
+
+    results = await asyncio.gather(*tasks)
+    elapsed = max(end for messages, end in results) - began
+    writer.close()
+    while server.connections:
+      await asyncio.sleep(0.01)
+
+    listener.close()
+
+  received = sum(messages for messages, end in results)
+  published = sum(len(sequences[int(match_id)]) for ids in match_ids for match_id in ids)
+  print('{} matches, {} subscribers, {} subscriptions'.format(
+    matches,
+    subscribers,
+    subscribers * subscriptions
+  ))
+  print('{:.0f} points/s, {:.0f} updates received/s, {:.1%} of updates conflated'.format(
+    len(commands) / elapsed,
+    received / elapsed,
+    1 - received / published
+  ))
+
+def main():
+  arguments = [int(argument) for argument in sys.argv[1:]]
+  asyncio.run(run(*(arguments + [2000, 1000, 20][len(arguments):])))
+
+if __name__ == '__main__':
+  main()
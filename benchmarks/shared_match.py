@@ -0,0 +1,104 @@
+'''
+Measures the points per second of one writer thread, and the reads per second and slowest read of
+32 reader threads that each read the scoreline of the match being played every millisecond, with a
+lock shared by the writer and readers, with a SharedMatch committing every point, and with a
+SharedMatch committing batches of points.
+
+Usage: python -m benchmarks.shared_match [seconds per run]
+'''
+import random
+import sys
+import threading
+import time
+
+import tennis
+from benchmarks import random_matches
+
+'''
+:param list corpus: points of each match
+:param int readers: number of reader threads
+:param float seconds: duration of the run
+:param int batch: number of points per commit, or None to share a match under a lock
+:return: a tuple of the number of points played and the number of scorelines read per second, and
+         the longest time taken by a read
+'''
+def run(corpus, readers, seconds, batch):
+  lock = threading.Lock()
+  current = [tennis.Match() if batch is None else tennis.SharedMatch()]
+  stop = threading.Event()
+  reads = [0] * readers
+  latencies = [0] * readers
+
+  def read(index):
+    count = 0
+    slowest = 0
+    while not stop.is_set():
+      start = time.perf_counter()
+      if batch is None:
+        with lock:
+          current[0].scoreline()
+      else:
+        current[0].snapshot().scoreline
+
+      slowest = max(slowest, time.perf_counter() - start)
+      count += 1
+      time.sleep(0.001)
+
+    reads[index] = count
+    latencies[index] = slowest
+
+  threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+  for thread in threads:
+    thread.start()
+
+  points = 0
+  start = time.perf_counter()
+  while time.perf_counter() - start < seconds:
+    for sequence in corpus:
+      if batch is None:
+        with lock:
+          current[0] = tennis.Match()
+
+        for first_server in sequence:
+          with lock:
+            current[0].point(first_server=first_server)
+      else:
+        shared = tennis.SharedMatch()
+        current[0] = shared
+        for i in range(0, len(sequence), batch):
+          if batch == 1:
+            shared.point(first_server=sequence[i])
+          else:
+            shared.points(first_servers=sequence[i:i + batch])
+
+      points += len(sequence)
+      if time.perf_counter() - start >= seconds:
+        break
+
+  elapsed = time.perf_counter() - start
+  stop.set()
+  for thread in threads:
+    thread.join()
+
+  return points / elapsed, sum(reads) / elapsed, max(latencies, default=0)
+
+def main():
+  seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2
+  corpus = random_matches.sequences(random.Random(0), 100)
+  for name, batch in (
+    ('lock', None),
+    ('SharedMatch, 1 point per commit', 1),
+    ('SharedMatch, 16 points per commit', 16)
+  ):
+    for readers in (0, 32):
+      points, reads, latency = run(corpus, readers, seconds, batch)
+      print('{:34} {:2} readers: {:7.0f} points/s, {:5.0f} reads/s, slowest read {:5.0f} us'.format(
+        name,
+        readers,
+        points,
+        reads,
+        1e6 * latency
+      ))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,71 @@
+'''
+Measures the time per point of scoring a feed of points on an event loop by handing each point to a
+thread with run_in_executor, and by stream with points arriving in bursts of several sizes.
+
+Usage: python -m benchmarks.streaming [number of matches]
+'''
+import asyncio
+import random
+import sys
+import time
+
+import tennis
+from benchmarks import random_matches
+
+'''
+:param list sequence: points of a match
+:param int burst: number of points that arrive together
+:return: an asynchronous iterator of the points, which suspends after each burst
+'''
+async def feed(sequence, burst):
+  for i, first_server in enumerate(sequence, 1):
+    yield first_server
+    if i % burst == 0:
+      await asyncio.sleep(0)
+
+'''
+:param list corpus: points of each match
+:return: the number of seconds taken to score the corpus with a thread hop per point
+'''
+async def executor(corpus):
+  loop = asyncio.get_running_loop()
+  start = time.perf_counter()
+  for sequence in corpus:
+    match = tennis.Match()
+    async for first_server in feed(sequence, 1):
+      await loop.run_in_executor(None, lambda: match.point(first_server=first_server))
+
+  return time.perf_counter() - start
+
+'''
+:param list corpus: points of each match
+:param int burst: number of points that arrive together
+:return: a tuple of the number of seconds taken to score the corpus with stream and the number of
+         updates yielded
+'''
+async def streamed(corpus, burst):
+  updates = 0
+  start = time.perf_counter()
+  for sequence in corpus:
+    async for update in tennis.stream(match=tennis.Match(), feed=feed(sequence, burst)):
+      updates += 1
+
+  return time.perf_counter() - start, updates
+
+def main():
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+  corpus = random_matches.sequences(random.Random(0), number)
+  points = sum(len(sequence) for sequence in corpus)
+  print('thread hop per point   {:6.1f} us/point'.format(
+    1e6 * asyncio.run(executor(corpus)) / points
+  ))
+  for burst in (1, 4, 16, 64):
+    elapsed, updates = asyncio.run(streamed(corpus, burst))
+    print('stream, bursts of {:3}  {:6.1f} us/point, {:.1f} points/update'.format(
+      burst,
+      1e6 * elapsed / points,
+      points / updates
+    ))
+
+if __name__ == '__main__':
+  main()
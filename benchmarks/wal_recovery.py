@@ -0,0 +1,77 @@
+'''
+Measures the time per point of logging points with each sync policy, and the time to recover live
+matches from a write-ahead log, before and after compacting it.
+
+Usage: python -m benchmarks.wal_recovery [number of live matches]
+'''
+import os
+import random
+import sys
+import tempfile
+import time
+
+import tennis
+from benchmarks import random_matches
+
+'''
+:param random.Random generator: random number generator
+:param WriteAheadLog log: log to play the points in
+:param str match_id: id of the match
+:param int points: maximum number of points to play, which are played until the match is over
+'''
+def play(generator, log, match_id, points):
+  for i in range(points):
+    match = log.matches.get(match_id)
+    if match is not None and match.winner is not None:
+      return
+
+    log.point(match_id=match_id, first_server=random_matches.first_server(generator, match))
+
+def main():
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+  generator = random.Random(0)
+  with tempfile.TemporaryDirectory() as directory:
+    for name, kwargs in (
+      ('every point', {'sync_points': 1}),
+      ('every 100 points', {'sync_points': 100}),
+      ('every 10 ms', {'sync_points': None, 'sync_seconds': 0.01})
+    ):
+      path = os.path.join(directory, name)
+      with tennis.WriteAheadLog(path=path, **kwargs) as log:
+        start = time.perf_counter()
+        for i in range(20):
+          play(generator, log, str(i), 100)
+
+        elapsed = time.perf_counter() - start
+
+      print('sync {:16} {:8.1f} us/point, {} syncs including the one on closing'.format(
+        name,
+        1e6 * elapsed / log.points,
+        log.syncs
+      ))
+
+    path = os.path.join(directory, 'live')
+    with tennis.WriteAheadLog(path=path, sync_points=None) as log:
+      for i in range(number):
+        play(generator, log, str(i), generator.randrange(300))
+
+    size = os.path.getsize(path)
+    with tennis.WriteAheadLog(path=path, sync_points=None) as log:
+      print('recovered {} matches, {} points replayed from a {:.1f} MB log in {:.2f} s'.format(
+        len(log.matches),
+        log.recovered_points,
+        size / 1e6,
+        log.recovery_seconds
+      ))
+      log.compact()
+
+    size = os.path.getsize(path)
+    with tennis.WriteAheadLog(path=path, sync_points=None) as log:
+      print('recovered {} matches from a {:.1f} MB compacted log in {:.2f} s'.format(
+        len(log.matches),
+        size / 1e6,
+        log.recovery_seconds
+      ))
+
+if __name__ == '__main__':
+  main()
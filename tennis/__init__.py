@@ -1,4 +1,23 @@
+import tennis.codec
+import tennis.events
+from tennis.delta import DeltaDecoder, DeltaEncoder
 from tennis.game import Game
+from tennis.io import PointReader
 from tennis.match import Match
+from tennis.match_cache import MatchCache
+from tennis.match_format import MatchFormat
+from tennis.match_history import MatchHistory
+from tennis.match_store import MatchStore, StoredMatch
+from tennis.point_coding import decode_points, encode_points
+from tennis.point_feed import PointFeed
+from tennis.point_states import point_state, read_point_states, write_point_states
+from tennis.reader import read_match, read_matches
+from tennis.replay import Corpus
+from tennis.score_index import ScoreIndex
+from tennis.score_trie import ScoreTrie
 from tennis.set import Set
+from tennis.set_format import SetFormat
+from tennis.shared_match import MatchSnapshot, SharedMatch
+from tennis.streaming import ScoreUpdate, stream
 from tennis.tiebreak import Tiebreak
+from tennis.wal import WriteAheadLog
@@ -0,0 +1,417 @@
+'''
+Compact binary encoding of matches, used to pickle them. A match is encoded as a sequence of
+unsigned varints: its flags and format, then each set as a reference to the match's regular or final
+set format followed by its games, with each game's points packed into a varint with its kind. Games
+and sets only carry an explicit format if it differs from the one they are expected to have.
+'''
+import tennis
+
+_VERSION = 1
+
+_HISTORY = 1
+_RECORD_POINTS = 2
+_DECIDING_POINT = 4
+_FINAL_SET_DECIDING_POINT = 8
+_FIRST_SERVER_SERVED_FIRST = 16
+
+_REGULAR_SET = 0
+_FINAL_SET = 1
+_EXPLICIT_SET = 2
+
+_GAME = 0
+_TIEBREAK = 1
+_EXPLICIT_GAME = 2
+_EXPLICIT_TIEBREAK = 3
+
+'''
+:param bytearray data: buffer to append to
+:param int value: non-negative integer to append as a varint
+'''
+def write_varint(data, value):
+  while value > 0x7f:
+    data.append(value & 0x7f | 0x80)
+    value >>= 7
+
+  data.append(value)
+
+'''
+:param bytearray data: buffer to append to
+:param int value: non-negative integer or None to append as a varint
+'''
+def _write_optional(data, value):
+  write_varint(data, 0 if value is None else value + 1)
+
+'''
+:param bytearray data: buffer to append to
+:param game: game or tiebreak to append
+:param Set zet: set in which the game is played
+'''
+def _write_game(data, game, zet):
+  if type(game) is tennis.Tiebreak:
+    kind = _TIEBREAK if game.target_points == zet.tiebreak_points else _EXPLICIT_TIEBREAK
+    write_varint(data, game.first_server_points << 2 | kind)
+    write_varint(data, game.first_returner_points)
+    if kind == _EXPLICIT_TIEBREAK:
+      write_varint(data, game.target_points)
+  else:
+    kind = _GAME if game.deciding_point == zet.deciding_point else _EXPLICIT_GAME
+    write_varint(data, game.server_points << 2 | kind)
+    write_varint(data, game.returner_points)
+    if kind == _EXPLICIT_GAME:
+      write_varint(data, game.deciding_point)
+
+'''
+:param int server_points: number of points scored by the server
+:param int returner_points: number of points scored by the returner
+:param bool deciding_point: whether to play a deciding point at deuce
+:return: a game built without validating its score, as the default unpickler would build it
+'''
+def _trusted_game(server_points, returner_points, deciding_point):
+  game = tennis.Game.__new__(tennis.Game)
+  game.server_points = server_points
+  game.returner_points = returner_points
+  game.deciding_point = deciding_point
+  game.winner = game._compute_winner()
+  return game
+
+'''
+:param int first_server_points: number of points scored by the player who served first
+:param int first_returner_points: number of points scored by the player who returned first
+:param int target_points: number of points required to win the tiebreak
+:return: a tiebreak built without validating its score, as the default unpickler would build it
+'''
+def _trusted_tiebreak(first_server_points, first_returner_points, target_points):
+  tiebreak = tennis.Tiebreak.__new__(tennis.Tiebreak)
+  tiebreak.first_server_points = first_server_points
+  tiebreak.first_returner_points = first_returner_points
+  tiebreak.target_points = target_points
+  tiebreak.winner = tiebreak._compute_winner()
+  return tiebreak
+
+'''
+:param int server_points: number of points scored by the server
+:param int returner_points: number of points scored by the returner
+:param bool deciding_point: whether to play a deciding point at deuce
+:return: the game
+:raises RuntimeError: if the score is not reachable
+'''
+def _game(server_points, returner_points, deciding_point):
+  return tennis.Game(
+    server_points=server_points,
+    returner_points=returner_points,
+    deciding_point=deciding_point
+  )
+
+'''
+:param int first_server_points: number of points scored by the player who served first
+:param int first_returner_points: number of points scored by the player who returned first
+:param int target_points: number of points required to win the tiebreak
+:return: the tiebreak
+:raises RuntimeError: if the score is not reachable
+'''
+def _tiebreak(first_server_points, first_returner_points, target_points):
+  return tennis.Tiebreak(
+    first_server_points=first_server_points,
+    first_returner_points=first_returner_points,
+    target_points=target_points
+  )
+
+'''
+:param Match match: match that keeps history
+:return: the number of points played in the games of the match, which bounds the number of points
+         recorded since it was constructed
+'''
+def _num_points(match):
+  return sum(
+    game.first_server_points + game.first_returner_points if type(game) is tennis.Tiebreak else
+    game.server_points + game.returner_points
+    for zet in match.sets for game in zet.games
+  )
+
+class VarintReader:
+  '''
+  Python class for objects that read the varints appended by write_varint.
+
+  :param bytes data: data to read
+  :var index: index in the data of the next varint to read
+  '''
+  def __init__(self, data):
+    self._data = data
+    self.index = 0
+
+  '''
+  :return: the next non-negative integer
+  :raises RuntimeError: if the data ends in the middle of a varint
+  '''
+  def read(self):
+    data = self._data
+    index = self.index
+    value = 0
+    shift = 0
+    while True:
+      if index >= len(data):
+        raise RuntimeError('Encoded match must be well-formed.')
+
+      byte = data[index]
+      index += 1
+      value |= (byte & 0x7f) << shift
+      if byte < 0x80:
+        self.index = index
+        return value
+
+      shift += 7
+
+  '''
+  :return: the next non-negative integer or None
+  '''
+  def read_optional(self):
+    value = self.read()
+    return None if value == 0 else value - 1
+
+  '''
+  :return: True if all of the data has been read, and False otherwise
+  '''
+  def done(self):
+    return self.index == len(self._data)
+
+class _Reader(VarintReader):
+  '''
+  Python class for objects that read varints and games from an encoded match.
+
+  :param bytes data: encoded match
+  :param bool trusted: whether to skip validating the games, for data known to encode a valid match
+  '''
+  def __init__(self, data, trusted):
+    super().__init__(data)
+    self._game = _trusted_game if trusted else _game
+    self._tiebreak = _trusted_tiebreak if trusted else _tiebreak
+
+  '''
+  :param bool deciding_point: whether to play a deciding point at deuce in the set in which the game
+                              is played
+  :param int tiebreak_points: number of points required to win a tiebreak in the set in which the
+                              game is played
+  :return: the next game or tiebreak
+  :raises RuntimeError: if the data ends in the middle of the game, or if it is a tiebreak in a set
+                        in which a tiebreak is not to be played and it has no explicit format
+  '''
+  def read_game(self, deciding_point, tiebreak_points):
+    value = self.read()
+    points = value >> 2
+    kind = value & 3
+    if kind in (_GAME, _EXPLICIT_GAME):
+      returner_points = self.read()
+      return self._game(
+        points,
+        returner_points,
+        deciding_point if kind == _GAME else bool(self.read())
+      )
+
+    first_returner_points = self.read()
+    target_points = tiebreak_points if kind == _TIEBREAK else self.read()
+    if target_points is None:
+      raise RuntimeError('Encoded match must be well-formed.')
+
+    return self._tiebreak(points, first_returner_points, target_points)
+
+'''
+:param Match match: match to encode
+:return: the encoded match
+'''
+def encode(match):
+  data = bytearray()
+  write_varint(data, _VERSION)
+  write_varint(data,
+    (_HISTORY if match.history else 0) |
+    (_RECORD_POINTS if match.point_log is not None else 0) |
+    (_DECIDING_POINT if match.deciding_point else 0) |
+    (_FINAL_SET_DECIDING_POINT if match.final_set_deciding_point else 0) |
+    (_FIRST_SERVER_SERVED_FIRST if match.first_server_served_first[:1] == (True,) else 0)
+  )
+  write_varint(data, match.target_sets)
+  write_varint(data, match.target_games)
+  _write_optional(data, match.tiebreak_games)
+  _write_optional(data, match.tiebreak_points)
+  write_varint(data, match.final_set_target_games)
+  _write_optional(data, match.final_set_tiebreak_games)
+  _write_optional(data, match.final_set_tiebreak_points)
+
+  if not match.history:
+    write_varint(data, match._sets)
+    write_varint(data, match._first_server_sets)
+    write_varint(data, match._first_returner_sets)
+
+  write_varint(data, len(match.sets))
+  for zet in match.sets:
+    if zet.set_format is match.match_format.set_format:
+      write_varint(data, _REGULAR_SET)
+    elif zet.set_format is match.match_format.final_set_format:
+      write_varint(data, _FINAL_SET)
+    else:
+      write_varint(data, _EXPLICIT_SET)
+      write_varint(data, zet.target_games)
+      write_varint(data, zet.deciding_point)
+      _write_optional(data, zet.tiebreak_games)
+      _write_optional(data, zet.tiebreak_points)
+
+    write_varint(data, zet.history)
+    if not zet.history:
+      write_varint(data, zet._games)
+      write_varint(data, zet._first_server_games)
+      write_varint(data, zet._first_returner_games)
+
+    write_varint(data, len(zet.games))
+    for game in zet.games:
+      _write_game(data, game, zet)
+
+  if match.point_log is not None:
+    write_varint(data, len(match.point_log))
+    bits = 0
+    for i, first_server in enumerate(match.point_log):
+      bits |= bool(first_server) << i
+    write_varint(data, bits)
+
+    write_varint(data, len(match._checkpoints))
+    for point_index, set_index, game_index, game in match._checkpoints:
+      write_varint(data, point_index)
+      write_varint(data, set_index)
+      write_varint(data, game_index)
+      _write_game(data, game, match.sets[set_index])
+
+  return bytes(data)
+
+'''
+:param type cls: Match or a subclass of it
+:param bytes data: encoded match
+:param bool trusted: whether to skip validating the match, for data known to encode a valid match,
+                     such as a pickle. Otherwise the games, sets and checkpoints are checked as the
+                     constructors of Game, Tiebreak, Set and Match would check them, so that data
+                     that does not encode a valid match raises RuntimeError
+:return: the decoded match
+:raises RuntimeError: if the data is not a well-formed encoded match
+'''
+def decode(cls, data, trusted=False):
+  reader = _Reader(data, trusted)
+  if reader.read() != _VERSION:
+    raise RuntimeError('Encoded match must be well-formed.')
+
+  flags = reader.read()
+  match = cls(
+    sets=[],
+    target_sets=reader.read(),
+    target_games=reader.read(),
+    deciding_point=bool(flags & _DECIDING_POINT),
+    tiebreak_games=reader.read_optional(),
+    tiebreak_points=reader.read_optional(),
+    final_set_target_games=reader.read(),
+    final_set_deciding_point=bool(flags & _FINAL_SET_DECIDING_POINT),
+    final_set_tiebreak_games=reader.read_optional(),
+    final_set_tiebreak_points=reader.read_optional(),
+    history=bool(flags & _HISTORY),
+    trusted=True
+  )
+
+  if not match.history:
+    match._sets = reader.read()
+    match._first_server_sets = reader.read()
+    match._first_returner_sets = reader.read()
+    if not trusted and (
+      match._first_server_sets + match._first_returner_sets != match._sets or
+      max(match._first_server_sets, match._first_returner_sets) >= match.target_sets
+    ):
+      raise RuntimeError('Encoded match must be well-formed.')
+
+  for i in range(reader.read()):
+    kind = reader.read()
+    if kind == _REGULAR_SET:
+      set_format = match.match_format.set_format
+    elif kind == _FINAL_SET:
+      set_format = match.match_format.final_set_format
+    else:
+      set_format = tennis.SetFormat(
+        target_games=reader.read(),
+        deciding_point=bool(reader.read()),
+        tiebreak_games=reader.read_optional(),
+        tiebreak_points=reader.read_optional()
+      )
+
+    history = bool(reader.read())
+    counts = (0, 0, 0) if history else (reader.read(), reader.read(), reader.read())
+    games = [
+      reader.read_game(set_format.deciding_point, set_format.tiebreak_points)
+      for j in range(reader.read())
+    ]
+    if not games:
+      raise RuntimeError('Encoded match must be well-formed.')
+
+    zet = tennis.Set(
+      games=games,
+      set_format=set_format,
+      history=history,
+      trusted=True
+    )
+    if not history:
+      zet._games, zet._first_server_games, zet._first_returner_games = counts
+      if not trusted and (
+        zet._first_server_games + zet._first_returner_games != zet._games or
+        zet._winner(zet._first_server_games, zet._first_returner_games) is not None or
+        zet.tiebreak_games is not None and
+        max(zet._first_server_games, zet._first_returner_games) > zet.tiebreak_games
+      ):
+        raise RuntimeError('Encoded match must be well-formed.')
+
+      zet.winner = zet._compute_winner()
+      zet._first_server_to_serve = zet._compute_first_server_to_serve()
+
+    if not trusted:
+      zet._validate_games()
+
+    match.sets.append(zet)
+
+  served_first = bool(flags & _FIRST_SERVER_SERVED_FIRST)
+  if not trusted:
+    match._validate_sets(served_first=match.history or served_first)
+
+  if match.history:
+    match.first_server_served_first = tuple(match._compute_first_server_served_first())
+  elif match.sets:
+    match.first_server_served_first = (served_first,)
+
+  match.winner = match._compute_winner()
+
+  if flags & _RECORD_POINTS:
+    if not trusted and not match.history:
+      raise RuntimeError('Encoded match must be well-formed.')
+
+    length = reader.read()
+    bits = reader.read()
+    if not trusted and (bits.bit_length() > length or length > _num_points(match)):
+      raise RuntimeError('Encoded match must be well-formed.')
+
+    match.point_log = [bool(bits >> i & 1) for i in range(length)]
+
+    match._checkpoints = []
+    for i in range(reader.read()):
+      point_index = reader.read()
+      set_index = reader.read()
+      game_index = reader.read()
+      if not trusted and not (
+        point_index <= length and
+        (not match._checkpoints or match._checkpoints[-1][0] <= point_index) and
+        set_index < len(match.sets) and
+        game_index < len(match.sets[set_index].games)
+      ):
+        raise RuntimeError('Encoded match must be well-formed.')
+
+      zet = match.sets[set_index]
+      match._checkpoints.append((
+        point_index,
+        set_index,
+        game_index,
+        reader.read_game(zet.deciding_point, zet.tiebreak_points)
+      ))
+
+  if not reader.done():
+    raise RuntimeError('Encoded match must be well-formed.')
+
+  return match
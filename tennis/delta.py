@@ -0,0 +1,247 @@
+'''
+Delta encoding of successive states of a match, for sending score updates to many replicas. A delta
+is a sequence of unsigned varints: the number of games closed since the previous state shifted left
+by one, then the final points of each closed game, then the points of the game being played if the
+match is not over. Points are given as the codec gives them, as the server's and returner's points
+for a game and as the first server's and first returner's points for a tiebreak. Sets closed and
+tiebreaks started are not encoded, as the replica infers them from the games closed. A keyframe is a
+varint of 1 followed by the match encoded by tennis.codec, and replaces the replica.
+'''
+import tennis
+import tennis.codec
+
+_KEYFRAME = 1
+
+class DeltaEncoder:
+  '''
+  Python class for objects that encode the successive states of a match as deltas, remembering only
+  the position and points of the game being played in the last state encoded. A keyframe is encoded
+  for the first state, every keyframe_interval states, when a point has been corrected with
+  Match.correct_point since the last state, when the score went backwards, and when the games
+  closed since the last state are no longer kept by the match, as when history is not being kept.
+
+  :param int keyframe_interval: number of states encoded per keyframe, or None to encode keyframes
+                                only when they are needed
+  :var states: number of states encoded
+  :var keyframes: number of keyframes encoded
+  '''
+  def __init__(self, *, keyframe_interval=None):
+    self.keyframe_interval = keyframe_interval
+    self.states = 0
+    self.keyframes = 0
+    self._position = None
+    self._points = None
+    self._over = False
+    self._corrections = None
+
+  '''
+  :param Match match: the next state of the match
+  :param bool keyframe: whether to encode a keyframe, as for a new replica
+  :return: the encoded delta or keyframe
+  '''
+  def encode(self, *, match, keyframe=False):
+    zet = match.sets[-1]
+    game = zet.games[-1]
+    position = (match._sets + len(match.sets) - 1, zet._games + len(zet.games) - 1)
+    points = _points(game)
+    interval = self.keyframe_interval
+    self.states += 1
+    if keyframe or self._position is None or position < self._position or \
+      match._corrections != self._corrections or \
+      interval is not None and self.states % interval == 1 % interval:
+      return self._keyframe(match, position, points)
+
+    if position == self._position:
+      if points[0] < self._points[0] or points[1] < self._points[1] or \
+        self._over and match.winner is None:
+        return self._keyframe(match, position, points)
+
+      closed = [points] if match.winner is not None and not self._over else []
+    else:
+      closed = self._closed(match, position)
+      if closed is None:
+        return self._keyframe(match, position, points)
+
+    self._position = position
+    self._points = points
+    self._over = match.winner is not None
+    if not closed and not self._over and points[0] < 0x80 and points[1] < 0x80:
+      return bytes((0, points[0], points[1]))
+
+    data = bytearray()
+    tennis.codec.write_varint(data, len(closed) << 1)
+    for closed_points in closed:
+      tennis.codec.write_varint(data, closed_points[0])
+      tennis.codec.write_varint(data, closed_points[1])
+
+    if not self._over:
+      tennis.codec.write_varint(data, points[0])
+      tennis.codec.write_varint(data, points[1])
+
+    return bytes(data)
+
+  '''
+  :param Match match: the next state of the match
+  :param tuple position: absolute indexes of the set and game being played in the match
+  :param tuple points: points of the game being played in the match
+  :return: the encoded keyframe
+  '''
+  def _keyframe(self, match, position, points):
+    self.keyframes += 1
+    self._position = position
+    self._points = points
+    self._over = match.winner is not None
+    self._corrections = match._corrections
+    return bytes((_KEYFRAME,)) + tennis.codec.encode(match)
+
+  '''
+  :param Match match: the next state of the match
+  :param tuple position: absolute indexes of the set and game being played in the match
+  :return: a list with the final points of each game closed since the last state encoded, including
+           the game being played if the match is over, or None if any of them is not kept by the
+           match
+  '''
+  def _closed(self, match, position):
+    closed = []
+    set_index, game_index = self._position
+    while (set_index, game_index) != position:
+      i = set_index - match._sets
+      if not 0 <= i < len(match.sets):
+        return None
+
+      zet = match.sets[i]
+      j = game_index - zet._games
+      if not 0 <= j < len(zet.games):
+        return None
+
+      closed.append(_points(zet.games[j]))
+      if j + 1 < len(zet.games):
+        game_index += 1
+      else:
+        set_index += 1
+        game_index = 0
+
+    if match.winner is not None:
+      closed.append(_points(match.sets[-1].games[-1]))
+
+    return closed
+
+class DeltaDecoder:
+  '''
+  Python class for objects that apply the deltas and keyframes encoded by a DeltaEncoder to a
+  replica of the match. Sets closed and tiebreaks started are applied by playing the last point of
+  each closed game in the replica, so the replica's observers are emitted to for every game closed.
+
+  :var match: the replica, or None until a keyframe has been applied
+  '''
+  def __init__(self):
+    self.match = None
+
+  '''
+  :param bytes data: delta or keyframe encoded by a DeltaEncoder
+  :return: the replica
+  :raises RuntimeError: if the data is not a well-formed delta for the replica or keyframe, after
+                        which the replica must be replaced by decoding a keyframe
+  '''
+  def decode(self, *, data):
+    if data[:1] == bytes((_KEYFRAME,)):
+      self.match = tennis.codec.decode(tennis.Match, data[1:])
+      return self.match
+
+    match = self.match
+    if match is None:
+      raise RuntimeError('A keyframe must be decoded before deltas.')
+
+    if len(data) == 3 and data[0] == 0 and data[1] < 0x80 and data[2] < 0x80 and \
+      match.winner is None:
+      game = match.sets[-1].games[-1]
+      points = _points(game)
+      _set_points(game, data[1], data[2])
+      if game._compute_winner() is not None:
+        _set_points(game, *points)
+        raise RuntimeError('Delta must be well-formed.')
+
+      return match
+
+    reader = tennis.codec.VarintReader(data)
+    try:
+      header = reader.read()
+      if header & _KEYFRAME:
+        raise RuntimeError('Delta must be well-formed.')
+
+      for i in range(header >> 1):
+        if match.winner is not None:
+          raise RuntimeError('Delta must be well-formed.')
+
+        _close(match, reader.read(), reader.read())
+
+      if match.winner is None:
+        game = match.sets[-1].games[-1]
+        points = _points(game)
+        _set_points(game, reader.read(), reader.read())
+        if game._compute_winner() is not None:
+          _set_points(game, *points)
+          raise RuntimeError('Delta must be well-formed.')
+    except RuntimeError as e:
+      raise RuntimeError('Delta must be well-formed.') from e
+
+    if not reader.done():
+      raise RuntimeError('Delta must be well-formed.')
+
+    return match
+
+'''
+:param game: game or tiebreak
+:return: a tuple of the server's and returner's points for a game, or of the first server's and
+         first returner's points for a tiebreak
+'''
+def _points(game):
+  if type(game) is tennis.Tiebreak:
+    return (game.first_server_points, game.first_returner_points)
+
+  return (game.server_points, game.returner_points)
+
+'''
+:param game: game or tiebreak whose points to set
+:param int points: points of the server of a game, or of the first server of a tiebreak
+:param int other_points: points of the returner of a game, or of the first returner of a tiebreak
+'''
+def _set_points(game, points, other_points):
+  if type(game) is tennis.Tiebreak:
+    game.first_server_points = points
+    game.first_returner_points = other_points
+  else:
+    game.server_points = points
+    game.returner_points = other_points
+
+'''
+Closes the game being played in a match with its final points, by setting the points it had before
+its last point and playing the last point in the match.
+
+:param Match match: match in which to close the game being played
+:param int points: final points of the server of a game, or of the first server of a tiebreak
+:param int other_points: final points of the returner of a game, or of the first returner of a
+                         tiebreak
+:raises RuntimeError: if the points are not the final points of a game
+'''
+def _close(match, points, other_points):
+  zet = match.sets[-1]
+  game = zet.games[-1]
+  previous = _points(game)
+  won = points > other_points
+  if won:
+    _set_points(game, points - 1, other_points)
+  elif other_points:
+    _set_points(game, points, other_points - 1)
+  else:
+    raise RuntimeError('Delta must be well-formed.')
+
+  if game._compute_winner() is not None:
+    _set_points(game, *previous)
+    raise RuntimeError('Delta must be well-formed.')
+
+  match.point(
+    first_server=match.first_server_served_first[-1] == ((zet._num_games() % 2 == 1) == won)
+  )
+  if game.winner is None:
+    raise RuntimeError('Delta must be well-formed.')
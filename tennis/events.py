@@ -0,0 +1,92 @@
+'''
+Events emitted by a match to its observers as points are played. Each kind of event is its own
+class, so observers can subscribe to the kinds they need and dispatch on the type of each event.
+Sets and games are indexed from the start of the match and of the set, counting those that are no
+longer kept when history is not being kept.
+'''
+
+class Event:
+  '''
+  Python class for objects that represent something that happened in a match as a point was played.
+
+  :param int set_index: index of the set in which the event happened
+  :param int game_index: index of the game in the set in which the event happened
+  :param bool first_server: True if the event is in favour of the player who served first in the
+                            match, and False otherwise
+  :var set_index: index of the set in which the event happened
+  :var game_index: index of the game in the set in which the event happened
+  :var first_server: True if the event is in favour of the player who served first in the match,
+                     and False otherwise
+  '''
+  __slots__ = ('set_index', 'game_index', 'first_server')
+
+  def __init__(self, *, set_index, game_index, first_server):
+    self.set_index = set_index
+    self.game_index = game_index
+    self.first_server = first_server
+
+  '''
+  :return: a string representation of the event
+  '''
+  def __repr__(self):
+    return '{}(set_index={}, game_index={}, first_server={})'.format(
+      type(self).__name__,
+      self.set_index,
+      self.game_index,
+      self.first_server
+    )
+
+  '''
+  :param object other: object to compare to the event
+  :return: True if the input object is an event of the same kind with the same attributes, and
+           False otherwise
+  '''
+  def __eq__(self, other):
+    return type(other) is type(self) and \
+      (self.set_index, self.game_index, self.first_server) == \
+      (other.set_index, other.game_index, other.first_server)
+
+  '''
+  :return: a hash of the event
+  '''
+  def __hash__(self):
+    return hash((type(self), self.set_index, self.game_index, self.first_server))
+
+class PointWon(Event):
+  '''
+  Python class for events emitted for every point, in favour of the player who won the point.
+  '''
+  __slots__ = ()
+
+class GameWon(Event):
+  '''
+  Python class for events emitted when a point ends a game or tiebreak, in favour of the player who
+  won it.
+  '''
+  __slots__ = ()
+
+class Break(Event):
+  '''
+  Python class for events emitted when the returner wins a game that is not a tiebreak, in favour of
+  the returner.
+  '''
+  __slots__ = ()
+
+class TiebreakStarted(Event):
+  '''
+  Python class for events emitted when a point leads to a tiebreak, in favour of the player who
+  serves first in the tiebreak.
+  '''
+  __slots__ = ()
+
+class SetWon(Event):
+  '''
+  Python class for events emitted when a point ends a set, in favour of the player who won it.
+  '''
+  __slots__ = ()
+
+class MatchWon(Event):
+  '''
+  Python class for events emitted when a point ends the match, in favour of the player who won it.
+  '''
+  __slots__ = ()
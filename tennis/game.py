@@ -88,3 +88,5 @@ class Game:
   '''
   def __eq__(self, other):
     return isinstance(other, type(self)) and self.__dict__ == other.__dict__
+
+  __hash__ = None
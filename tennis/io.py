@@ -0,0 +1,163 @@
+'''
+Streaming ingestion of point-by-point files, with one match per row and a column with a string of
+the points played in the match. Each point is S or A if the server won it, and R or D if the
+returner won it, which are the characters in SERVER_POINTS and RETURNER_POINTS. Games are separated
+by ';', sets by '.', and the changes of server in a tiebreak may be marked by '/'.
+'''
+import csv
+import time
+
+import tennis
+
+SERVER_POINTS = frozenset('SA')
+RETURNER_POINTS = frozenset('RD')
+
+class PointReader:
+  '''
+  Python class for objects that stream matches from a point-by-point CSV file with a header row. The
+  file is read one row at a time, and each row's points are converted to first_server booleans and
+  fed to Match.points as they are parsed, so memory use does not grow with the size of the file.
+
+  :param file: text file object to read from
+  :param MatchFormat match_format: format of every match in the file, or None for the default format
+  :param str column: name of the column with the points played in each match
+  :param list errors: list to which a (line number, message) tuple is appended for each bad row,
+                      which is then skipped, or None to raise an error for the first bad row
+  :var rows: number of rows read
+  :var matches: number of matches read
+  :var points: number of points played in the matches read
+  :var bad_rows: number of bad rows skipped
+  '''
+  def __init__(
+    self,
+    *,
+    file,
+    match_format=None,
+    column='pbp',
+    errors=None
+  ):
+    self.file = file
+    self.match_format = tennis.MatchFormat() if match_format is None else match_format
+    self.column = column
+    self.errors = errors
+    self.rows = 0
+    self.matches = 0
+    self.points = 0
+    self.bad_rows = 0
+    self._start = None
+    self._end = None
+
+  '''
+  :return: yields a (row, match) tuple for each good row in the file, where row is a dictionary that
+           maps the names in the header row to the values in the row
+  :raises RuntimeError: if a row is bad and errors is None
+  '''
+  def __iter__(self):
+    self._start = time.perf_counter()
+    self._end = None
+    rows = csv.DictReader(self.file)
+    for row in rows:
+      self.rows += 1
+      match = tennis.Match(match_format=self.match_format)
+      parsed = _Points(match, row.get(self.column) or '')
+      try:
+        match.points(first_servers=parsed)
+      except RuntimeError as e:
+        message = 'Line {}, character {}: {}'.format(rows.line_num, parsed.index + 1, e)
+        if self.errors is None:
+          raise RuntimeError(message) from e
+
+        self.errors.append((rows.line_num, message))
+        self.bad_rows += 1
+        continue
+
+      self.matches += 1
+      self.points += parsed.points
+      yield row, match
+
+    self._end = time.perf_counter()
+
+  '''
+  :return: the number of seconds spent reading the file so far
+  '''
+  def elapsed(self):
+    if self._start is None:
+      return 0.0
+
+    return (time.perf_counter() if self._end is None else self._end) - self._start
+
+  '''
+  :return: the number of rows read per second
+  '''
+  def rows_per_second(self):
+    elapsed = self.elapsed()
+    return self.rows / elapsed if elapsed else 0.0
+
+  '''
+  :return: the number of points played per second in the matches read
+  '''
+  def points_per_second(self):
+    elapsed = self.elapsed()
+    return self.points / elapsed if elapsed else 0.0
+
+class _Points:
+  '''
+  Python class for iterators that convert a string of server-relative points into first_server
+  booleans for a match, checking the separators against the match's score as the points are played.
+
+  :param Match match: match in which the points are played, which is advanced by the caller after
+                      each boolean is yielded
+  :param str string: points played in the match
+  :var index: index in the string of the character being parsed, or the length of the string once
+              it has all been parsed
+  :var points: number of points yielded
+  '''
+  def __init__(self, match, string):
+    self._match = match
+    self._string = string
+    self.index = 0
+    self.points = 0
+
+  '''
+  :return: yields True if the first server won each point, and False otherwise
+  :raises RuntimeError: if the string is not a well-formed string of points for the match
+  '''
+  def __iter__(self):
+    match = self._match
+    zet = match.sets[-1]
+    game = zet.games[-1]
+    game_over = False
+    set_over = False
+    for self.index, char in enumerate(self._string):
+      if char in SERVER_POINTS or char in RETURNER_POINTS:
+        if match.winner is not None:
+          raise RuntimeError('Points must not be played after the match is over.')
+
+        if game_over:
+          raise RuntimeError('Games must be followed by a separator.')
+
+        self.points += 1
+        yield (char in SERVER_POINTS) == match.first_server_to_serve()
+
+        set_over = match.winner is not None or match.sets[-1] is not zet
+        game_over = set_over or match.sets[-1].games[-1] is not game
+        zet = match.sets[-1]
+        game = zet.games[-1]
+      elif char == ';':
+        if not game_over or set_over:
+          raise RuntimeError('\';\' must only follow the last point of a game.')
+
+        game_over = False
+      elif char == '.':
+        if not set_over or match.winner is not None:
+          raise RuntimeError('\'.\' must only follow the last point of a set.')
+
+        game_over = False
+        set_over = False
+      elif char == '/':
+        if game_over or type(game) is not tennis.Tiebreak:
+          raise RuntimeError('\'/\' must only be played within a tiebreak.')
+      else:
+        raise RuntimeError('Points must be S, A, R or D, not {!r}.'.format(char))
+
+    self.index = len(self._string)
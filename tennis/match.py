@@ -1,3 +1,9 @@
+import bisect
+import copy
+import io
+import itertools
+import re
+
 import tennis
 
 class Match:
@@ -20,7 +26,17 @@ class Match:
   :param int final_set_tiebreak_points: number of points required to win a tiebreak in the final
                                         set, or None if a tiebreak is not to be played in the final
                                         set
-  :var sets: list of sets played in the match
+  :param MatchFormat match_format: format of the match, which is used instead of target_sets and
+                                  the other format parameters if it is not None
+  :param bool record_points: whether to keep a log of the points played in the match, along with a
+                             checkpoint at the start of each game, so that points can be corrected
+  :param bool history: whether to keep every set and game played in the match, or only the set and
+                       game currently being played along with the number of sets and games won by
+                       each player
+  :param bool trusted: whether to skip validating the sets, for sets known to be valid
+  :var sets: list of sets played in the match, or a list with only the set currently being played if
+             history is not being kept
+  :var match_format: format of the match, which is shared with every match of the same format
   :var target_sets: number of sets required to win the match
   :var target_games: number of games required to win each set
   :var deciding_point: whether to play a deciding point at deuce
@@ -35,11 +51,15 @@ class Match:
                                  final set
   :var final_set_tiebreak_points: number of points required to win a tiebreak in the final set, or
                                   None if a tiebreak is not to be played in the final set
-  :var first_server_served_first: a tuple with a boolean for each set that indicates whether the
-                                  player that served first in the first set also served first in
-                                  that set
+  :var history: whether every set and game played in the match is kept
+  :var first_server_served_first: a tuple with a boolean for each set in sets that indicates whether
+                                  the player that served first in the first set also served first
+                                  in that set
   :var winner: True if the first server won the match, False if the first returner won the match,
                and None otherwise
+  :var point_log: list with a boolean for each point played since the match was constructed that
+                  indicates whether the first server won that point, or None if points are not
+                  being recorded
   '''
   def __init__(
     self,
@@ -53,61 +73,165 @@ class Match:
     final_set_target_games=6,
     final_set_deciding_point=False,
     final_set_tiebreak_games=6,
-    final_set_tiebreak_points=7
+    final_set_tiebreak_points=7,
+    match_format=None,
+    record_points=False,
+    history=True,
+    trusted=False
   ):
-    # TODO(abw333): validate sets
-
-    if target_sets < 1:
-      raise RuntimeError('target_sets must be at least 1.')
-
-    if min(target_games, final_set_target_games) < 0:
-      raise RuntimeError('Point scores must be non-negative.')
-
-    if (tiebreak_games is None) != (tiebreak_points is None):
-      raise RuntimeError('tiebreak_games and tiebreak_points must both be None or non-None.')
-
-    if (final_set_tiebreak_games is None) != (final_set_tiebreak_points is None):
-      raise RuntimeError(
-        'final_set_tiebreak_games and final_set_tiebreak_points must both be None or non-None.'
+    if match_format is None:
+      match_format = tennis.MatchFormat(
+        target_sets=target_sets,
+        target_games=target_games,
+        deciding_point=deciding_point,
+        tiebreak_games=tiebreak_games,
+        tiebreak_points=tiebreak_points,
+        final_set_target_games=final_set_target_games,
+        final_set_deciding_point=final_set_deciding_point,
+        final_set_tiebreak_games=final_set_tiebreak_games,
+        final_set_tiebreak_points=final_set_tiebreak_points
       )
 
-    if tiebreak_games is not None and min(tiebreak_games, tiebreak_points) < 0:
-      raise RuntimeError('Point scores must be non-negative.')
-
-    if final_set_tiebreak_games is not None:
-      if min(final_set_tiebreak_games, final_set_tiebreak_points) < 0:
-        raise RuntimeError('Point scores must be non-negative.')
+    if record_points and not history:
+      raise RuntimeError('Points cannot be recorded if history is not being kept.')
 
     if sets is not None:
       self.sets = sets
-    elif target_sets == 1:
-      self.sets = [tennis.Set(
-        games=None,
-        target_games=final_set_target_games,
-        deciding_point=final_set_deciding_point,
-        tiebreak_games=final_set_tiebreak_games,
-        tiebreak_points=final_set_tiebreak_points
-      )]
+    elif match_format.target_sets == 1:
+      self.sets = [tennis.Set(set_format=match_format.final_set_format, history=history)]
     else:
-      self.sets = [tennis.Set(
-        games=None,
-        target_games=target_games,
-        deciding_point=deciding_point,
-        tiebreak_games=tiebreak_games,
-        tiebreak_points=tiebreak_points
-      )]
-
-    self.target_sets = target_sets
-    self.target_games = target_games
-    self.deciding_point = deciding_point
-    self.tiebreak_games = tiebreak_games
-    self.tiebreak_points = tiebreak_points
-    self.final_set_target_games = final_set_target_games
-    self.final_set_deciding_point = final_set_deciding_point
-    self.final_set_tiebreak_games = final_set_tiebreak_games
-    self.final_set_tiebreak_points = final_set_tiebreak_points
+      self.sets = [tennis.Set(set_format=match_format.set_format, history=history)]
+
+    self.match_format = match_format
+    self.history = history
+    self._sets = 0
+    self._first_server_sets = 0
+    self._first_returner_sets = 0
+
+    if not trusted:
+      self._validate_sets()
+
     self.first_server_served_first = tuple(self._compute_first_server_served_first())
     self.winner = self._compute_winner()
+    self._observers = None
+    self._corrections = 0
+
+    if record_points:
+      self.point_log = []
+      self._checkpoints = []
+      self._checkpoint()
+    else:
+      self.point_log = None
+
+  '''
+  :return: the number of sets required to win the match
+  '''
+  @property
+  def target_sets(self):
+    return self.match_format.target_sets
+
+  '''
+  :return: the number of games required to win each set
+  '''
+  @property
+  def target_games(self):
+    return self.match_format.set_format.target_games
+
+  '''
+  :return: whether to play a deciding point at deuce
+  '''
+  @property
+  def deciding_point(self):
+    return self.match_format.set_format.deciding_point
+
+  '''
+  :return: the number of games each player must have before a tiebreak is played, or None if
+           a tiebreak is not to be played
+  '''
+  @property
+  def tiebreak_games(self):
+    return self.match_format.set_format.tiebreak_games
+
+  '''
+  :return: the number of points required to win a tiebreak, or None if a tiebreak is not
+           to be played
+  '''
+  @property
+  def tiebreak_points(self):
+    return self.match_format.set_format.tiebreak_points
+
+  '''
+  :return: the number of games required to win the final set
+  '''
+  @property
+  def final_set_target_games(self):
+    return self.match_format.final_set_format.target_games
+
+  '''
+  :return: whether to play a deciding point at deuce in the final set
+  '''
+  @property
+  def final_set_deciding_point(self):
+    return self.match_format.final_set_format.deciding_point
+
+  '''
+  :return: the number of games each player must have before a tiebreak is played in the final
+           set, or None if a tiebreak is not to be played in the final set
+  '''
+  @property
+  def final_set_tiebreak_games(self):
+    return self.match_format.final_set_format.tiebreak_games
+
+  '''
+  :return: the number of points required to win a tiebreak in the final set, or None if a
+           tiebreak is not to be played in the final set
+  '''
+  @property
+  def final_set_tiebreak_points(self):
+    return self.match_format.final_set_format.tiebreak_points
+
+  '''
+  Checks, in a single pass over the sets, that there is at least one set, that only the last set is
+  unfinished and that it is unfinished unless the match is over, that no set is played after the
+  match is over, and that each set has the format of the match, with the final set's format applied
+  to the final set only. The sets are counted from the sets no longer kept if
+  history is not being kept.
+
+  :param bool served_first: whether the player that served first in the match also served first in
+                            the first set kept
+  :raises RuntimeError: if the sets are not valid
+  '''
+  def _validate_sets(self, served_first=True):
+    first_server_sets = self._first_server_sets
+    first_returner_sets = self._first_returner_sets
+    for i, zet in enumerate(self.sets, self._sets):
+      if self.target_sets in (first_server_sets, first_returner_sets):
+        raise RuntimeError('Sets must not be played after the match is over.')
+
+      if i == 2 * (self.target_sets - 1):
+        set_format = self.match_format.final_set_format
+      else:
+        set_format = self.match_format.set_format
+
+      if zet.set_format is not set_format:
+        raise RuntimeError('Sets must have the match\'s format.')
+
+      if zet.winner is None:
+        if i != self._sets + len(self.sets) - 1:
+          raise RuntimeError('Only the last set of a match may be unfinished.')
+      elif zet.winner == served_first:
+        first_server_sets += 1
+      else:
+        first_returner_sets += 1
+
+      served_first = served_first != bool(zet._num_games() % 2)
+
+    if not self.sets:
+      raise RuntimeError('Matches must have at least one set.')
+
+    if self.sets[-1].winner is not None and \
+      self.target_sets not in (first_server_sets, first_returner_sets):
+      raise RuntimeError('The last set of a match must be unfinished unless the match is over.')
 
   '''
   :return: yields a boolean for each set that indicates whether the player that served first in the
@@ -117,7 +241,7 @@ class Match:
     for i, zet in enumerate(self.sets):
       if not i:
         served_first = True
-      elif len(self.sets[i - 1].games) % 2:
+      elif self.sets[i - 1]._num_games() % 2:
         served_first = not served_first
 
       yield served_first
@@ -126,7 +250,7 @@ class Match:
   :return: the number of sets won by the player who served first
   '''
   def first_server_sets(self):
-    return len([
+    return self._first_server_sets + len([
       0 for fssf, s in zip(self.first_server_served_first, self.sets) if fssf == s.winner
     ])
 
@@ -134,7 +258,7 @@ class Match:
   :return: the number of sets won by the player who returned first
   '''
   def first_returner_sets(self):
-    return len([
+    return self._first_returner_sets + len([
       0 for fssf, s in zip(self.first_server_served_first, self.sets) if (not fssf) == s.winner
     ])
 
@@ -172,6 +296,134 @@ class Match:
     if self.winner is not None:
       raise RuntimeError('Cannot advance this match\'s score because the match is over.')
 
+    if self._observers is not None:
+      return self._observed_point(first_server=first_server)
+
+    if self.point_log is None:
+      return self._point(first_server=first_server)
+
+    return self._recorded_point(first_server=first_server)
+
+  '''
+  Advances the match's score by a point and records the point, without checking whether the match
+  is over.
+
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  '''
+  def _recorded_point(self, *, first_server):
+    games = (len(self.sets), len(self.sets[-1].games))
+    self.point_log.append(first_server)
+    winner = self._point(first_server=first_server)
+    if winner is None and (len(self.sets), len(self.sets[-1].games)) != games:
+      self._checkpoint()
+
+    return winner
+
+  '''
+  Advances the match's score by a point and emits its events to the observers, without checking
+  whether the match is over.
+
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  '''
+  def _observed_point(self, *, first_server):
+    observers = self._observers
+    zet = self.sets[-1]
+    game = zet.games[-1]
+    set_index = self._sets + len(self.sets) - 1
+    game_index = zet._num_games() - 1
+    server = self.first_server_to_serve()
+    if self.point_log is None:
+      winner = self._point(first_server=first_server)
+    else:
+      winner = self._recorded_point(first_server=first_server)
+
+    events = [tennis.events.PointWon(
+      set_index=set_index,
+      game_index=game_index,
+      first_server=first_server
+    )]
+    if game.winner is not None:
+      events.append(tennis.events.GameWon(
+        set_index=set_index,
+        game_index=game_index,
+        first_server=first_server
+      ))
+      if first_server != server and type(game) is not tennis.Tiebreak:
+        events.append(tennis.events.Break(
+          set_index=set_index,
+          game_index=game_index,
+          first_server=first_server
+        ))
+
+      if zet.winner is not None:
+        events.append(tennis.events.SetWon(
+          set_index=set_index,
+          game_index=game_index,
+          first_server=first_server
+        ))
+
+      if winner is not None:
+        events.append(tennis.events.MatchWon(
+          set_index=set_index,
+          game_index=game_index,
+          first_server=first_server
+        ))
+      elif type(self.sets[-1].games[-1]) is tennis.Tiebreak:
+        events.append(tennis.events.TiebreakStarted(
+          set_index=self._sets + len(self.sets) - 1,
+          game_index=self.sets[-1]._num_games() - 1,
+          first_server=self.first_server_to_serve()
+        ))
+
+    for event in events:
+      for observer, kinds in observers:
+        if kinds is None or isinstance(event, kinds):
+          observer(event)
+
+    return winner
+
+  '''
+  Subscribes an observer to the events emitted as points are played in the match. Observers are
+  called in the order they were subscribed, after the point has been played. Matches without
+  observers do not construct events. Observers are not kept by copies of the match or emitted to
+  for points replayed by correct_point.
+
+  :param observer: callable that takes an event
+  :param iterable events: classes in tennis.events of the events to emit to the observer, or None
+                          for every event
+  '''
+  def subscribe(self, *, observer, events=None):
+    self._observers = (self._observers or ()) + ((
+      observer,
+      None if events is None else tuple(events)
+    ),)
+
+  '''
+  Unsubscribes an observer from the events emitted by the match.
+
+  :param observer: callable that was subscribed to the match
+  :raises RuntimeError: if the observer is not subscribed to the match
+  '''
+  def unsubscribe(self, *, observer):
+    observers = tuple(pair for pair in self._observers or () if pair[0] != observer)
+    if len(observers) == len(self._observers or ()):
+      raise RuntimeError('Observer must be subscribed to the match.')
+
+    self._observers = observers or None
+
+  '''
+  Advances the match's score by a point, without checking whether the match is over or recording
+  the point.
+
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  '''
+  def _point(self, *, first_server):
     set_winner = self.sets[-1].point(
       first_server=list(self.first_server_served_first)[-1] == first_server
     )
@@ -183,35 +435,331 @@ class Match:
     if self.winner is not None:
       return self.winner
 
-    if len(self.sets) == 2 * (self.target_sets - 1):
-      self.sets.append(tennis.Set(
-        games=None,
-        target_games=self.final_set_target_games,
-        deciding_point=self.final_set_deciding_point,
-        tiebreak_games=self.final_set_tiebreak_games,
-        tiebreak_points=self.final_set_tiebreak_points
-      ))
+    self._new_set()
+
+    if not self.history:
+      self._first_server_sets = self.first_server_sets()
+      self._first_returner_sets = self.first_returner_sets()
+      self._sets += len(self.sets) - 1
+      del self.sets[:-1]
+      self.first_server_served_first = self.first_server_served_first[-1:]
+
+  '''
+  :return: a new match with the same score that does not keep history, with a copy of the set and
+           game currently being played
+  '''
+  def _without_history(self):
+    zet = self.sets[-1]
+    served_first = self.first_server_served_first[-1]
+    match = type(self)(
+      sets=[zet._without_history()],
+      match_format=self.match_format,
+      history=False,
+      trusted=True
+    )
+    match._sets = self._sets + len(self.sets) - 1
+    match._first_server_sets = self.first_server_sets() - (served_first == zet.winner)
+    match._first_returner_sets = self.first_returner_sets() - ((not served_first) == zet.winner)
+    match.first_server_served_first = (served_first,)
+    match.winner = self.winner
+    return match
+
+  '''
+  Appends a new set to the match.
+  '''
+  def _new_set(self):
+    if self.sets:
+      served_first = self.first_server_served_first[-1] != bool(self.sets[-1]._num_games() % 2)
     else:
-      self.sets.append(tennis.Set(
-        games=None,
-        target_games=self.target_games,
-        deciding_point=self.deciding_point,
-        tiebreak_games=self.tiebreak_games,
-        tiebreak_points=self.tiebreak_points
-      ))
+      served_first = True
+
+    if self._sets + len(self.sets) == 2 * (self.match_format.target_sets - 1):
+      set_format = self.match_format.final_set_format
+    else:
+      set_format = self.match_format.set_format
+
+    self.sets.append(tennis.Set(set_format=set_format, history=self.history, trusted=True))
 
     self.first_server_served_first = tuple(
-      list(self.first_server_served_first) + [
-        self.first_server_served_first[-1] != bool(len(self.sets[-2].games) % 2)
-      ]
+      list(self.first_server_served_first) + [served_first]
     )
 
   '''
-  :return: a string representation of the match
+  Advances the match's score by a sequence of points.
+
+  :param iterable first_servers: a boolean for each point that is True if the first server won the
+                                 point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  :raises RuntimeError: if the match's score cannot be advanced because the match is over
+  '''
+  def points(self, *, first_servers):
+    point = self.point
+    winner = self.winner
+    for first_server in first_servers:
+      winner = point(first_server=first_server)
+
+    return winner
+
+  '''
+  Records a checkpoint at the start of the game currently being played.
   '''
-  def __str__(self):
-    return ('{}('
-      'sets={}, '
+  def _checkpoint(self):
+    if self.winner is None and self.sets:
+      self._checkpoints.append((
+        len(self.point_log),
+        len(self.sets) - 1,
+        len(self.sets[-1].games) - 1,
+        copy.copy(self.sets[-1].games[-1])
+      ))
+
+  '''
+  :param int set_index: index of the first set to include
+  :return: a tuple of a dictionary that maps (set index, game index) pairs to True if the first
+           server won that game and False if the first returner won that game, and a dictionary
+           that maps set indexes to True if the first server won that set and False if the first
+           returner won that set, for the finished games and sets starting at the input set index
+  '''
+  def _outcomes(self, set_index):
+    games = {}
+    sets = {}
+    for i in range(set_index, len(self.sets)):
+      served_first = self.first_server_served_first[i]
+      for j, game in enumerate(self.sets[i].games):
+        if game.winner is not None:
+          games[(i, j)] = (game.winner == (j % 2 == 0)) == served_first
+
+      if self.sets[i].winner is not None:
+        sets[i] = self.sets[i].winner == served_first
+
+    return games, sets
+
+  '''
+  Flips the winner of a recorded point. The match's score is restored to the checkpoint at the start
+  of the game in which that point was played, and only the points from that checkpoint onwards are
+  replayed. Recorded points that would be played after the corrected match is over are dropped from
+  the point log.
+
+  :param int index: index into the point log of the point to correct
+  :return: a tuple of a sorted list of (set index, game index) pairs for the games whose outcome
+           changed, and a sorted list of indexes of the sets whose outcome changed
+  :raises RuntimeError: if points are not being recorded or the index is not in the point log
+  '''
+  def correct_point(self, *, index):
+    if self.point_log is None:
+      raise RuntimeError('Cannot correct a point because points are not being recorded.')
+
+    if not 0 <= index < len(self.point_log):
+      raise RuntimeError('Point index must be in the point log.')
+
+    i = bisect.bisect_right(self._checkpoints, (index, float('inf'))) - 1
+    point_index, set_index, game_index, game = self._checkpoints[i]
+
+    games_before, sets_before = self._outcomes(set_index)
+
+    first_servers = self.point_log[point_index:]
+    first_servers[index - point_index] = not first_servers[index - point_index]
+
+    self._corrections += 1
+    del self.point_log[point_index:]
+    del self._checkpoints[i + 1:]
+    del self.sets[set_index + 1:]
+    zet = self.sets[set_index]
+    del zet.games[game_index + 1:]
+    zet.games[game_index] = copy.copy(game)
+    zet.winner = zet._compute_winner()
+    zet._first_server_to_serve = zet._compute_first_server_to_serve()
+    self.first_server_served_first = self.first_server_served_first[:set_index + 1]
+    self.winner = self._compute_winner()
+
+    observers = self._observers
+    self._observers = None
+    try:
+      self.points(first_servers=itertools.takewhile(lambda _: self.winner is None, first_servers))
+    finally:
+      self._observers = observers
+
+    games_after, sets_after = self._outcomes(set_index)
+
+    return (
+      sorted(k for k in games_before.keys() | games_after.keys()
+        if games_before.get(k) != games_after.get(k)),
+      sorted(k for k in sets_before.keys() | sets_after.keys()
+        if sets_before.get(k) != sets_after.get(k))
+    )
+
+  '''
+  Constructs a match from a scoreline such as '6-4 3-6 7-6(5) 2-1 30-15'. Each set is given as the
+  number of games won by each player, followed by the number of points won by the loser of the
+  tiebreak in parentheses if the set was decided by a tiebreak. A set in which tiebreak_games is 0
+  is given as the number of points won by each player in its tiebreak instead. The score of the game
+  currently being played may follow the last set, in points (0, 15, 30, 40 or AD) for a game or as
+  a number of points for a tiebreak. All scores are given with the player who served first in the
+  match first; the player who served first in each set and the player who is to serve the next
+  point are inferred from the number of games played.
+
+  :param str scoreline: scoreline of the match
+  :param kwargs: format of the match and whether to keep history, as for the constructor
+  :return: a match with the input score, which keeps only the set and game currently being played if
+           history is not being kept
+  :raises RuntimeError: if the scoreline is malformed or its scores are not reachable
+  '''
+  @classmethod
+  def from_scoreline(cls, *, scoreline, **kwargs):
+    match = cls(sets=[], trusted=True, **kwargs)
+    tokens = scoreline.split()
+    i = 0
+    while i < len(tokens):
+      if match.winner is not None:
+        raise RuntimeError('Set scores must be reachable.')
+
+      set_score = _SET_SCORE.match(tokens[i])
+      if set_score is None:
+        raise RuntimeError('Scoreline must be well-formed.')
+
+      match._new_set()
+      zet = match.sets[-1]
+      served_first = match.first_server_served_first[-1]
+      games = (int(set_score.group(1)), int(set_score.group(2)))
+      if not served_first:
+        games = games[::-1]
+
+      if zet.tiebreak_games == 0:
+        if set_score.group(3) is not None:
+          raise RuntimeError('Scoreline must be well-formed.')
+
+        zet.games[-1] = tennis.Tiebreak(
+          first_server_points=games[0],
+          first_returner_points=games[1],
+          target_points=zet.tiebreak_points
+        )
+      else:
+        leader = games[0] >= games[1]
+        for first_server in [leader, not leader] * min(games) + [leader] * abs(games[0] - games[1]):
+          if zet.winner is not None:
+            raise RuntimeError('Game scores must be reachable.')
+
+          server = first_server == (len(zet.games) % 2 == 1)
+          if type(zet.games[-1]) is tennis.Tiebreak:
+            if set_score.group(3) is None:
+              points = (zet.tiebreak_points, zet.tiebreak_points - 2)
+            else:
+              loser_points = int(set_score.group(3))
+              points = (max(zet.tiebreak_points, loser_points + 2), loser_points)
+
+            zet.games[-1] = tennis.Tiebreak(
+              first_server_points=points[not server],
+              first_returner_points=points[server],
+              target_points=zet.tiebreak_points
+            )
+          else:
+            zet.games[-1] = tennis.Game(
+              server_points=4 if server else 0,
+              returner_points=0 if server else 4,
+              deciding_point=zet.deciding_point
+            )
+
+          zet.winner = zet._compute_winner()
+          if zet.winner is None:
+            zet.games.append(zet._next_game())
+
+        if set_score.group(3) is not None:
+          if zet.winner is None or type(zet.games[-1]) is not tennis.Tiebreak:
+            raise RuntimeError('Scoreline must be well-formed.')
+
+      zet.winner = zet._compute_winner()
+      zet._first_server_to_serve = zet._compute_first_server_to_serve()
+      match.winner = match._compute_winner()
+      i += 1
+
+      if zet.winner is None and zet.tiebreak_games != 0 and i < len(tokens):
+        zet.games[-1] = _current_game(
+          point_score=tokens[i],
+          game=zet.games[-1],
+          first_server=(len(zet.games) % 2 == 1) == served_first
+        )
+        i += 1
+
+      if zet.winner is None and i < len(tokens):
+        raise RuntimeError('Set scores must be reachable.')
+
+    if match.winner is None and (not match.sets or match.sets[-1].winner is not None):
+      match._new_set()
+
+    match = cls(sets=match.sets, trusted=True, **kwargs)
+    return match if match.history else match._without_history()
+
+  '''
+  :return: a compact binary encoding of the match
+  '''
+  def to_bytes(self):
+    return tennis.codec.encode(self)
+
+  '''
+  :param bytes data: compact binary encoding of a match, as returned by to_bytes
+  :param bool trusted: whether to skip validating the match, for data known to encode a valid match
+  :return: the match
+  :raises RuntimeError: if the data is not a well-formed encoding of a match
+  '''
+  @classmethod
+  def from_bytes(cls, *, data, trusted=False):
+    return tennis.codec.decode(cls, data, trusted)
+
+  '''
+  :return: a tuple that pickles the match as its compact binary encoding
+  '''
+  def __reduce__(self):
+    return tennis.codec.decode, (type(self), self.to_bytes(), True)
+
+  '''
+  :return: the scoreline of the match, in the format accepted by from_scoreline, for the sets kept
+           in the match, preceded by the number of sets won by each player in brackets, such as
+           '[2-1] 2-1 30-15', if history is not being kept and some sets are no longer kept
+  '''
+  def scoreline(self):
+    scores = []
+    if self._sets:
+      scores.append('[{}-{}]'.format(self._first_server_sets, self._first_returner_sets))
+
+    for served_first, zet in zip(self.first_server_served_first, self.sets):
+      if zet.tiebreak_games == 0:
+        games = (zet.games[-1].first_server_points, zet.games[-1].first_returner_points)
+      else:
+        games = (zet.first_server_games(), zet.first_returner_games())
+
+      score = '{}-{}'.format(*(games if served_first else games[::-1]))
+
+      game = zet.games[-1]
+      if zet.tiebreak_games != 0 and zet.winner is not None and type(game) is tennis.Tiebreak:
+        score += '({})'.format(min(game.first_server_points, game.first_returner_points))
+
+      scores.append(score)
+
+      if zet.tiebreak_games != 0 and zet.winner is None and game.winner is None:
+        point_score = _point_score(
+          game=game,
+          first_server=(zet._num_games() % 2 == 1) == served_first
+        )
+        if point_score != '0-0':
+          scores.append(point_score)
+
+    return ' '.join(scores)
+
+  '''
+  Writes the full string representation of the match to a file object one set at a time, without
+  building the whole string in memory.
+
+  :param file: file object to write to
+  '''
+  def write(self, *, file):
+    file.write('{}(sets=['.format(type(self).__name__))
+    for i, zet in enumerate(self.sets):
+      if i:
+        file.write(', ')
+
+      zet.write(file=file)
+
+    file.write(('], '
       'target_sets={}, '
       'target_games={}, '
       'deciding_point={}, '
@@ -222,8 +770,6 @@ class Match:
       'final_set_tiebreak_games={}, '
       'final_set_tiebreak_points={}'
     ')').format(
-      type(self).__name__,
-      self.sets,
       self.target_sets,
       self.target_games,
       self.deciding_point,
@@ -232,18 +778,168 @@ class Match:
       self.final_set_target_games,
       self.final_set_deciding_point,
       self.final_set_tiebreak_games,
-      self.final_set_tiebreak_points,
-    )
+      self.final_set_tiebreak_points
+    ))
+
+  '''
+  :return: the full string representation of the match, with every set and game
+  '''
+  def __str__(self):
+    output = io.StringIO()
+    self.write(file=output)
+    return output.getvalue()
 
   '''
-  :return: a string representation of the match
+  :return: a compact string representation of the match, with its format and scoreline, or with its
+           compact binary encoding if history is not being kept, since the scoreline of such a match
+           does not give the score of the sets no longer kept
   '''
   def __repr__(self):
-    return str(self)
+    if not self.history:
+      return '{}.from_bytes(data={!r})'.format(type(self).__name__, self.to_bytes())
+
+    return ('{}.from_scoreline('
+      'scoreline={!r}, '
+      'target_sets={}, '
+      'target_games={}, '
+      'deciding_point={}, '
+      'tiebreak_games={}, '
+      'tiebreak_points={}, '
+      'final_set_target_games={}, '
+      'final_set_deciding_point={}, '
+      'final_set_tiebreak_games={}, '
+      'final_set_tiebreak_points={}'
+    ')').format(
+      type(self).__name__,
+      self.scoreline(),
+      self.target_sets,
+      self.target_games,
+      self.deciding_point,
+      self.tiebreak_games,
+      self.tiebreak_points,
+      self.final_set_target_games,
+      self.final_set_deciding_point,
+      self.final_set_tiebreak_games,
+      self.final_set_tiebreak_points
+    )
 
   '''
   :param object other: object to compare to the match
   :return: True if the input object is equal to the match, and False otherwise
   '''
   def __eq__(self, other):
-    return isinstance(other, type(self)) and self.__dict__ == other.__dict__
+    if self is other:
+      return True
+
+    if not isinstance(other, type(self)) or self._key() != other._key():
+      return False
+
+    if self._game_winners() != other._game_winners():
+      return False
+
+    if self._observers is None and other._observers is None and \
+      not self._corrections and not other._corrections:
+      return self.__dict__ == other.__dict__
+
+    return dict(self.__dict__, _observers=None, _corrections=0) == \
+      dict(other.__dict__, _observers=None, _corrections=0)
+
+  __hash__ = None
+
+  '''
+  :return: a tuple of the match's format, winner, number of sets and the cheap aggregates of each
+           set, which is cheap to compute and equal for equal matches
+  '''
+  def _key(self):
+    return (
+      self.match_format,
+      self.winner,
+      self._sets,
+      self.first_server_served_first,
+      tuple(zet._key() for zet in self.sets)
+    )
+
+  '''
+  :return: a tuple with a bytes object for each set, with a byte for each game that is 1 if the
+           server won the game, 0 if the returner won the game, and 2 if the game is unfinished
+  '''
+  def _game_winners(self):
+    return tuple(
+      bytes(2 if game.winner is None else game.winner for game in zet.games) for zet in self.sets
+    )
+
+_SET_SCORE = re.compile(r'^(\d+)-(\d+)(?:\((\d+)\))?$')
+_GAME_SCORE = re.compile(r'^(0|15|30|40|AD?)-(0|15|30|40|AD?)$')
+_TIEBREAK_SCORE = re.compile(r'^(\d+)-(\d+)$')
+_GAME_POINTS = {'0': 0, '15': 1, '30': 2, '40': 3, 'A': 4, 'AD': 4}
+
+'''
+:param str point_score: score of a game in points (0, 15, 30, 40 or AD), or of a tiebreak as a
+                        number of points, with the player who served first in the match first
+:param game: the game or tiebreak currently being played, before any points are played
+:param bool first_server: True if the player who served first in the match is the server of the game
+                          or the first server of the tiebreak, and False otherwise
+:return: a game or tiebreak with the input score
+:raises RuntimeError: if the score is malformed or not reachable
+'''
+def _current_game(*, point_score, game, first_server):
+  if type(game) is tennis.Tiebreak:
+    score = _TIEBREAK_SCORE.match(point_score)
+    if score is None:
+      raise RuntimeError('Scoreline must be well-formed.')
+
+    points = (int(score.group(1)), int(score.group(2)))
+  else:
+    score = _GAME_SCORE.match(point_score)
+    if score is None or score.group(1)[0] == score.group(2)[0] == 'A':
+      raise RuntimeError('Scoreline must be well-formed.')
+
+    points = (_GAME_POINTS[score.group(1)], _GAME_POINTS[score.group(2)])
+
+  if not first_server:
+    points = points[::-1]
+
+  if type(game) is tennis.Tiebreak:
+    game = tennis.Tiebreak(
+      first_server_points=points[0],
+      first_returner_points=points[1],
+      target_points=game.target_points
+    )
+  else:
+    game = tennis.Game(
+      server_points=points[0],
+      returner_points=points[1],
+      deciding_point=game.deciding_point
+    )
+
+  if game.winner is not None:
+    raise RuntimeError('Point scores must be reachable.')
+
+  return game
+
+_POINT_NAMES = ('0', '15', '30', '40')
+
+'''
+:param game: the game or tiebreak currently being played
+:param bool first_server: True if the player who served first in the match is the server of the game
+                          or the first server of the tiebreak, and False otherwise
+:return: the score of the game in points (0, 15, 30, 40 or AD), or of the tiebreak as a number of
+         points, with the player who served first in the match first
+'''
+def _point_score(*, game, first_server):
+  if type(game) is tennis.Tiebreak:
+    points = (str(game.first_server_points), str(game.first_returner_points))
+  elif min(game.server_points, game.returner_points) >= 3:
+    if game.server_points == game.returner_points:
+      points = ('40', '40')
+    elif game.server_points > game.returner_points:
+      points = ('AD', '40')
+    else:
+      points = ('40', 'AD')
+  else:
+    points = (_POINT_NAMES[game.server_points], _POINT_NAMES[game.returner_points])
+
+  if not first_server:
+    points = points[::-1]
+
+  return '{}-{}'.format(*points)
@@ -0,0 +1,191 @@
+'''
+Memory-bounded cache of live matches, which spills the least recently used matches to a match store
+when more than its capacity of matches are in memory, and rehydrates a spilled match the next time
+it is played in or read.
+'''
+import collections
+import time
+
+import tennis
+
+_BUCKETS = 32
+
+class MatchCache:
+  '''
+  Python class for objects that hold live matches by id, keeping at most capacity of them in memory
+  in least recently used order and the rest encoded in a MatchStore. Playing in or reading a match
+  that is in memory is a hit, and one that is not is a miss, which rehydrates the match from the
+  store. Only playing in or adding a match starts one, and reading a match that neither the cache
+  nor the store holds returns None. The latency of each hit, miss and spill is
+  counted in a histogram, which is a list whose element i is the number of operations that took
+  less than 2 ** i microseconds and at least 2 ** (i - 1) microseconds, with the last element
+  counting every slower operation. Closing the cache spills every match in memory, so a cache
+  opened on the same store later rehydrates them.
+
+  :param MatchStore store: store to spill matches to
+  :param int capacity: maximum number of matches to keep in memory
+  :param MatchFormat match_format: format of the matches started by their first point, or None for
+                                   the default format
+  :var store: store to spill matches to
+  :var capacity: maximum number of matches to keep in memory
+  :var match_format: format of the matches started by their first point
+  :var hits: number of times a match was in memory when it was played in or read
+  :var misses: number of times a match was not in memory when it was played in or read
+  :var spills: number of times a match was spilled to the store
+  :var hit_latencies: histogram of the latencies of hits
+  :var miss_latencies: histogram of the latencies of misses
+  :var spill_latencies: histogram of the latencies of spills
+  '''
+  def __init__(self, *, store, capacity, match_format=None):
+    if capacity < 1:
+      raise RuntimeError('capacity must be at least 1.')
+
+    self.store = store
+    self.capacity = capacity
+    self.match_format = tennis.MatchFormat() if match_format is None else match_format
+    self.hits = 0
+    self.misses = 0
+    self.spills = 0
+    self.hit_latencies = [0] * _BUCKETS
+    self.miss_latencies = [0] * _BUCKETS
+    self.spill_latencies = [0] * _BUCKETS
+    self._matches = collections.OrderedDict()
+
+  '''
+  Plays a point in a match, rehydrating the match if it was spilled and starting a new match with
+  the cache's format if no match has the id.
+
+  :param str match_id: id of the match
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  :raises RuntimeError: if the match is over
+  '''
+  def point(self, *, match_id, first_server):
+    match = self._get(match_id, True)
+    if match.winner is not None:
+      raise RuntimeError('Points must not be played after the match is over.')
+
+    return match.point(first_server=first_server)
+
+  '''
+  Reads a match, rehydrating it if it was spilled.
+
+  :param str match_id: id of the match
+  :return: the match, or None if no match has the id
+  '''
+  def get(self, *, match_id):
+    return self._get(match_id, False)
+
+  '''
+  Adds a match to the cache, replacing any match with the same id.
+
+  :param str match_id: id of the match
+  :param Match match: the match, or None for a new match with the cache's format
+  '''
+  def add(self, *, match_id, match=None):
+    self._matches[match_id] = tennis.Match(match_format=self.match_format) if match is None \
+      else match
+    self._matches.move_to_end(match_id)
+    if len(self._matches) > self.capacity:
+      self._spill()
+
+  '''
+  Reads a match, rehydrating it if it was spilled.
+
+  :param str match_id: id of the match
+  :param bool create: True to start a new match with the cache's format if no match has the id,
+                      and False to return None instead
+  :return: the match, or None if no match has the id and create is False
+  '''
+  def _get(self, match_id, create):
+    start = time.perf_counter()
+    matches = self._matches
+    match = matches.get(match_id)
+    if match is not None:
+      matches.move_to_end(match_id)
+      self.hits += 1
+      _record(self.hit_latencies, start)
+      return match
+
+    self.misses += 1
+    match = self.store.get(match_id=match_id)
+    if match is None:
+      if not create:
+        _record(self.miss_latencies, start)
+        return None
+
+      match = tennis.Match(match_format=self.match_format)
+
+    matches[match_id] = match
+    if len(matches) > self.capacity:
+      self._spill()
+
+    _record(self.miss_latencies, start)
+    return match
+
+  '''
+  Removes a match from the cache and from the store.
+
+  :param str match_id: id of the match
+  :return: the match, or None if no match has the id
+  '''
+  def remove(self, *, match_id):
+    match = self._matches.pop(match_id, None)
+    if match is None:
+      match = self.store.get(match_id=match_id)
+
+    self.store.remove(match_id=match_id)
+    return match
+
+  '''
+  :return: the number of matches in memory
+  '''
+  def __len__(self):
+    return len(self._matches)
+
+  '''
+  :param str match_id: id of a match
+  :return: whether the match is in memory
+  '''
+  def __contains__(self, match_id):
+    return match_id in self._matches
+
+  '''
+  Spills every match in memory to the store and closes the store.
+  '''
+  def close(self):
+    while self._matches:
+      self._spill()
+
+    self.store.close()
+
+  '''
+  :return: the cache
+  '''
+  def __enter__(self):
+    return self
+
+  '''
+  Spills every match in memory to the store and closes the store.
+  '''
+  def __exit__(self, *args):
+    self.close()
+
+  '''
+  Spills the least recently used match in memory to the store.
+  '''
+  def _spill(self):
+    start = time.perf_counter()
+    match_id, match = self._matches.popitem(last=False)
+    self.store.put(match_id=match_id, match=match)
+    self.spills += 1
+    _record(self.spill_latencies, start)
+
+'''
+:param list histogram: histogram to count an operation in
+:param float start: value of time.perf_counter when the operation started
+'''
+def _record(histogram, start):
+  microseconds = int(1e6 * (time.perf_counter() - start))
+  histogram[min(microseconds.bit_length(), _BUCKETS - 1)] += 1
@@ -0,0 +1,162 @@
+import tennis.set_format
+
+class MatchFormat:
+  '''
+  Python class for objects that represent the format of tennis matches. Formats are immutable and
+  interned, so constructing a format with the same parameters as an existing one returns the
+  existing format without validating the parameters again, and formats can be compared by identity.
+  Ready-made formats are available as BEST_OF_THREE, BEST_OF_FIVE, NO_AD, FAST4 and
+  MATCH_TIEBREAK.
+
+  :param int target_sets: number of sets required to win the match
+  :param int target_games: number of games required to win each set
+  :param bool deciding_point: whether to play a deciding point at deuce
+  :param int tiebreak_games: number of games each player must have before a tiebreak is played, or
+                             None if a tiebreak is not to be played
+  :param int tiebreak_points: number of points required to win a tiebreak, or None if a tiebreak is
+                              not to be played
+  :param int final_set_target_games: number of games required to win the final set
+  :param bool final_set_deciding_point: whether to play a deciding point at deuce in the final set
+  :param int final_set_tiebreak_games: number of games each player must have before a tiebreak is
+                                       played in the final set, or None if a tiebreak is not to be
+                                       played in the final set
+  :param int final_set_tiebreak_points: number of points required to win a tiebreak in the final
+                                        set, or None if a tiebreak is not to be played in the final
+                                        set
+  :var target_sets: number of sets required to win the match
+  :var set_format: format of each set but the final set
+  :var final_set_format: format of the final set
+  '''
+  __slots__ = ('target_sets', 'set_format', 'final_set_format')
+
+  _formats = {}
+
+  def __new__(
+    cls,
+    *,
+    target_sets=2,
+    target_games=6,
+    deciding_point=False,
+    tiebreak_games=6,
+    tiebreak_points=7,
+    final_set_target_games=6,
+    final_set_deciding_point=False,
+    final_set_tiebreak_games=6,
+    final_set_tiebreak_points=7
+  ):
+    key = (
+      cls,
+      target_sets,
+      target_games,
+      deciding_point,
+      tiebreak_games,
+      tiebreak_points,
+      final_set_target_games,
+      final_set_deciding_point,
+      final_set_tiebreak_games,
+      final_set_tiebreak_points
+    )
+    match_format = cls._formats.get(key)
+    if match_format is not None:
+      return match_format
+
+    if target_sets < 1:
+      raise RuntimeError('target_sets must be at least 1.')
+
+    if min(target_games, final_set_target_games) < 0:
+      raise RuntimeError('Point scores must be non-negative.')
+
+    if (tiebreak_games is None) != (tiebreak_points is None):
+      raise RuntimeError('tiebreak_games and tiebreak_points must both be None or non-None.')
+
+    if (final_set_tiebreak_games is None) != (final_set_tiebreak_points is None):
+      raise RuntimeError(
+        'final_set_tiebreak_games and final_set_tiebreak_points must both be None or non-None.'
+      )
+
+    match_format = super().__new__(cls)
+    object.__setattr__(match_format, 'target_sets', target_sets)
+    object.__setattr__(match_format, 'set_format', tennis.set_format.SetFormat(
+      target_games=target_games,
+      deciding_point=deciding_point,
+      tiebreak_games=tiebreak_games,
+      tiebreak_points=tiebreak_points
+    ))
+    object.__setattr__(match_format, 'final_set_format', tennis.set_format.SetFormat(
+      target_games=final_set_target_games,
+      deciding_point=final_set_deciding_point,
+      tiebreak_games=final_set_tiebreak_games,
+      tiebreak_points=final_set_tiebreak_points
+    ))
+
+    return cls._formats.setdefault(key, match_format)
+
+  '''
+  :raises RuntimeError: always, because formats are immutable
+  '''
+  def __setattr__(self, name, value):
+    raise RuntimeError('Formats cannot be modified.')
+
+  '''
+  :raises RuntimeError: always, because formats are immutable
+  '''
+  def __delattr__(self, name):
+    raise RuntimeError('Formats cannot be modified.')
+
+  '''
+  :return: a dictionary of the keyword arguments that construct the format
+  '''
+  def kwargs(self):
+    return {
+      'target_sets': self.target_sets,
+      'target_games': self.set_format.target_games,
+      'deciding_point': self.set_format.deciding_point,
+      'tiebreak_games': self.set_format.tiebreak_games,
+      'tiebreak_points': self.set_format.tiebreak_points,
+      'final_set_target_games': self.final_set_format.target_games,
+      'final_set_deciding_point': self.final_set_format.deciding_point,
+      'final_set_tiebreak_games': self.final_set_format.tiebreak_games,
+      'final_set_tiebreak_points': self.final_set_format.tiebreak_points
+    }
+
+  '''
+  :return: a tuple that unpickles and copies the format as the interned format
+  '''
+  def __reduce__(self):
+    return _match_format, (type(self), self.kwargs())
+
+  '''
+  :return: a string representation of the format
+  '''
+  def __repr__(self):
+    return '{}({})'.format(
+      type(self).__name__,
+      ', '.join('{}={}'.format(name, value) for name, value in self.kwargs().items())
+    )
+
+'''
+:param type cls: MatchFormat or a subclass of it
+:param dict kwargs: keyword arguments that construct the format
+:return: the interned match format with the input parameters
+'''
+def _match_format(cls, kwargs):
+  return cls(**kwargs)
+
+MatchFormat.BEST_OF_THREE = MatchFormat()
+MatchFormat.BEST_OF_FIVE = MatchFormat(target_sets=3)
+MatchFormat.NO_AD = MatchFormat(deciding_point=True, final_set_deciding_point=True)
+MatchFormat.FAST4 = MatchFormat(
+  target_games=4,
+  deciding_point=True,
+  tiebreak_games=3,
+  tiebreak_points=5,
+  final_set_target_games=4,
+  final_set_deciding_point=True,
+  final_set_tiebreak_games=3,
+  final_set_tiebreak_points=5
+)
+MatchFormat.MATCH_TIEBREAK = MatchFormat(
+  final_set_target_games=1,
+  final_set_tiebreak_games=0,
+  final_set_tiebreak_points=10
+)
@@ -0,0 +1,117 @@
+import copy
+
+import tennis
+
+class MatchHistory:
+  '''
+  Python class for objects that represent the sequence of points played in a tennis match. Points
+  are stored as a packed bit array, and a checkpoint is stored every checkpoint_interval points so
+  that the score as it stood at any point can be recovered by replaying at most checkpoint_interval
+  points. A checkpoint is the match encoded by tennis.codec without history, so it holds only the
+  set and game being played and its size does not grow with the number of points played.
+
+  :param Match match: the match as it stood before the first point in the history, or None to start
+                      from a new match with the default format
+  :param int checkpoint_interval: number of points between consecutive checkpoints
+  :var match: the match as it stands after the last point in the history
+  :var checkpoint_interval: number of points between consecutive checkpoints
+  '''
+  def __init__(self, *, match=None, checkpoint_interval=64):
+    if checkpoint_interval < 1:
+      raise RuntimeError('checkpoint_interval must be at least 1.')
+
+    self.match = tennis.Match() if match is None else copy.deepcopy(match)
+    self.checkpoint_interval = checkpoint_interval
+    self._bits = bytearray()
+    self._length = 0
+    self._start = copy.deepcopy(self.match)
+    self._checkpoints = [self.match._without_history().to_bytes()]
+
+  '''
+  :return: the number of points in the history
+  '''
+  def __len__(self):
+    return self._length
+
+  '''
+  :param int index: index of a point in the history
+  :return: True if the first server won the point, and False otherwise
+  :raises IndexError: if the index is not in the history
+  '''
+  def __getitem__(self, index):
+    if not 0 <= index < self._length:
+      raise IndexError('Point index must be in the history.')
+
+    return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+  '''
+  Advances the match's score by a point and appends the point to the history.
+
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  :raises RuntimeError: if the match's score cannot be advanced because the match is over
+  '''
+  def point(self, *, first_server):
+    winner = self.match.point(first_server=first_server)
+
+    if not self._length & 7:
+      self._bits.append(0)
+
+    if first_server:
+      self._bits[-1] |= 1 << (self._length & 7)
+
+    self._length += 1
+
+    if not self._length % self.checkpoint_interval:
+      self._checkpoints.append(self.match._without_history().to_bytes())
+
+    return winner
+
+  '''
+  Advances the match's score by a sequence of points and appends them to the history.
+
+  :param iterable first_servers: a boolean for each point that is True if the first server won the
+                                 point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  :raises RuntimeError: if the match's score cannot be advanced because the match is over
+  '''
+  def points(self, *, first_servers):
+    point = self.point
+    winner = self.match.winner
+    for first_server in first_servers:
+      winner = point(first_server=first_server)
+
+    return winner
+
+  '''
+  :param int index: number of points played, between 0 and the length of the history
+  :return: a new match as it stood after the input number of points were played, which does not
+           keep history
+  :raises IndexError: if the index is out of range
+  '''
+  def state_at(self, *, index):
+    if not 0 <= index <= self._length:
+      raise IndexError('Point index must be between 0 and the length of the history.')
+
+    checkpoint = index // self.checkpoint_interval
+    match = tennis.Match.from_bytes(data=self._checkpoints[checkpoint], trusted=True)
+    match.points(
+      first_servers=(self[i] for i in range(checkpoint * self.checkpoint_interval, index))
+    )
+
+    return match
+
+  '''
+  :return: yields the match as it stood before the first point and after each point in the history.
+           The same match object is advanced in place and yielded each time, so it must be copied
+           if it is to be kept.
+  '''
+  def states(self):
+    match = copy.deepcopy(self._start)
+    yield match
+
+    for i in range(self._length):
+      match.point(first_server=self[i])
+      yield match
@@ -0,0 +1,289 @@
+'''
+Store of matches in a local SQLite database. Each match is a row with its id, its format as the
+values of MatchFormat.kwargs joined by commas, its winner as 1 or 0, or NULL while it is live,
+its scoreline in the format of Match.scoreline, and the match encoded by tennis.codec. The format,
+winner and scoreline columns are indexed, so live and archived matches share one table and are
+queried by those columns without decoding any match.
+'''
+import sqlite3
+
+import tennis
+
+_VALUES = {'None': None, 'False': False, 'True': True}
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS matches (
+  id TEXT PRIMARY KEY,
+  format TEXT NOT NULL,
+  winner INTEGER,
+  scoreline TEXT NOT NULL,
+  data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_format ON matches (format);
+CREATE INDEX IF NOT EXISTS matches_winner ON matches (winner);
+CREATE INDEX IF NOT EXISTS matches_scoreline ON matches (scoreline);
+'''
+
+class MatchStore:
+  '''
+  Python class for objects that store matches in a SQLite database. Matches that are put are
+  written in batches of batch_size matches, each in a single transaction, and the latest put of a
+  match replaces the earlier ones in the same batch, so a live match may be put after every point.
+  Matches that are waiting to be written are read from the batch by get, and are written before
+  the store is queried and when it is flushed or closed. Queries return StoredMatch objects, which
+  decode their match only when it is accessed.
+
+  :param str path: path of the database, which is created if it does not exist, or ':memory:'
+  :param int batch_size: number of matches written per transaction
+  :var path: path of the database
+  :var batch_size: number of matches written per transaction
+  :var transactions: number of transactions in which matches were written
+  '''
+  def __init__(self, *, path, batch_size=1000):
+    if batch_size < 1:
+      raise RuntimeError('batch_size must be at least 1.')
+
+    self.path = path
+    self.batch_size = batch_size
+    self.transactions = 0
+    self._pending = {}
+    self._connection = sqlite3.connect(path, isolation_level=None)
+    self._connection.execute('PRAGMA journal_mode=WAL')
+    self._connection.execute('PRAGMA synchronous=NORMAL')
+    self._connection.executescript(_SCHEMA)
+
+  '''
+  Puts a match in the store, replacing any match with the same id. The match is encoded
+  immediately, so it may be played in after it is put.
+
+  :param str match_id: id of the match
+  :param Match match: the match
+  '''
+  def put(self, *, match_id, match):
+    self._pending[match_id] = (
+      match_id,
+      _format_key(match.match_format),
+      None if match.winner is None else int(match.winner),
+      match.scoreline(),
+      match.to_bytes()
+    )
+    if len(self._pending) >= self.batch_size:
+      self.flush()
+
+  '''
+  Puts matches in the store, as put does for each of them.
+
+  :param iterable matches: a (match id, match) tuple for each match
+  '''
+  def put_many(self, *, matches):
+    put = self.put
+    for match_id, match in matches:
+      put(match_id=match_id, match=match)
+
+  '''
+  Writes the matches that are waiting to be written in a single transaction.
+  '''
+  def flush(self):
+    if not self._pending:
+      return
+
+    rows = self._pending.values()
+    self._connection.execute('BEGIN')
+    try:
+      self._connection.executemany('INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?)', rows)
+    except BaseException:
+      self._connection.execute('ROLLBACK')
+      raise
+
+    self._connection.execute('COMMIT')
+    self._pending = {}
+    self.transactions += 1
+
+  '''
+  :param str match_id: id of the match
+  :return: the match with the id, or None if no match has it
+  '''
+  def get(self, *, match_id):
+    pending = self._pending.get(match_id)
+    if pending is not None:
+      return tennis.Match.from_bytes(data=pending[-1], trusted=True)
+
+    row = self._connection.execute(
+      'SELECT data FROM matches WHERE id = ?',
+      (match_id,)
+    ).fetchone()
+    return None if row is None else tennis.Match.from_bytes(data=row[0], trusted=True)
+
+  '''
+  Removes a match from the store.
+
+  :param str match_id: id of the match
+  :return: True if a match had the id, and False otherwise
+  '''
+  def remove(self, *, match_id):
+    self.flush()
+    return self._connection.execute('DELETE FROM matches WHERE id = ?', (match_id,)).rowcount > 0
+
+  '''
+  Queries the matches that have every input that is not None.
+
+  :param MatchFormat match_format: format of the matches, or None
+  :param bool winner: True for the matches won by the first server, False for the matches won by
+                      the first returner, or None
+  :param bool live: True for the matches that are not over, False for the matches that are over, or
+                    None
+  :param str scoreline: scoreline of the matches, or None
+  :return: a list of a StoredMatch for each match, in the order of their ids
+  '''
+  def query(self, *, match_format=None, winner=None, live=None, scoreline=None):
+    self.flush()
+    sql, parameters = _where(match_format, winner, live, scoreline)
+    return [
+      StoredMatch(
+        match_id=match_id,
+        match_format=format_key,
+        winner=None if winner is None else bool(winner),
+        scoreline=scoreline,
+        data=data
+      )
+      for match_id, format_key, winner, scoreline, data in self._connection.execute(
+        'SELECT id, format, winner, scoreline, data FROM matches' + sql + ' ORDER BY id',
+        parameters
+      )
+    ]
+
+  '''
+  Counts the matches that have every input that is not None, as query queries them.
+
+  :param MatchFormat match_format: format of the matches, or None
+  :param bool winner: True for the matches won by the first server, False for the matches won by
+                      the first returner, or None
+  :param bool live: True for the matches that are not over, False for the matches that are over, or
+                    None
+  :param str scoreline: scoreline of the matches, or None
+  :return: the number of matches
+  '''
+  def count(self, *, match_format=None, winner=None, live=None, scoreline=None):
+    self.flush()
+    sql, parameters = _where(match_format, winner, live, scoreline)
+    return self._connection.execute('SELECT COUNT(*) FROM matches' + sql, parameters).fetchone()[0]
+
+  '''
+  :return: the number of matches in the store
+  '''
+  def __len__(self):
+    return self.count()
+
+  '''
+  Writes the matches that are waiting to be written and closes the database.
+  '''
+  def close(self):
+    self.flush()
+    self._connection.close()
+
+  '''
+  :return: the store
+  '''
+  def __enter__(self):
+    return self
+
+  '''
+  Writes the matches that are waiting to be written and closes the database.
+  '''
+  def __exit__(self, *args):
+    self.close()
+
+class StoredMatch:
+  '''
+  Python class for objects that hold the indexed columns of a stored match, and its encoded match,
+  which is decoded when match is first accessed.
+
+  :param str match_id: id of the match
+  :param str match_format: format of the match as stored
+  :param bool winner: True if the first server won the match, False if the first returner won the
+                      match, and None otherwise
+  :param str scoreline: scoreline of the match
+  :param bytes data: the match encoded by tennis.codec
+  :var match_id: id of the match
+  :var winner: True if the first server won the match, False if the first returner won the match,
+               and None otherwise
+  :var scoreline: scoreline of the match
+  '''
+  __slots__ = ('match_id', 'winner', 'scoreline', '_format_key', '_data', '_match')
+
+  def __init__(self, *, match_id, match_format, winner, scoreline, data):
+    self.match_id = match_id
+    self.winner = winner
+    self.scoreline = scoreline
+    self._format_key = match_format
+    self._data = data
+    self._match = None
+
+  '''
+  :return: format of the match
+  '''
+  @property
+  def match_format(self):
+    values = self._format_key.split(',')
+    return tennis.MatchFormat(**{
+      name: _VALUES[value] if value in _VALUES else int(value)
+      for name, value in zip(tennis.MatchFormat().kwargs(), values)
+    })
+
+  '''
+  :return: the match, which is decoded the first time it is accessed
+  '''
+  @property
+  def match(self):
+    if self._match is None:
+      self._match = tennis.Match.from_bytes(data=self._data, trusted=True)
+
+    return self._match
+
+  '''
+  :return: a string representation of the stored match
+  '''
+  def __repr__(self):
+    return '{}(match_id={!r}, winner={}, scoreline={!r})'.format(
+      type(self).__name__,
+      self.match_id,
+      self.winner,
+      self.scoreline
+    )
+
+'''
+:param MatchFormat match_format: format of a match
+:return: the format as stored, as its keyword arguments joined by commas
+'''
+def _format_key(match_format):
+  return ','.join(str(value) for value in match_format.kwargs().values())
+
+'''
+:param MatchFormat match_format: format of the matches, or None
+:param bool winner: winner of the matches, or None
+:param bool live: whether the matches are not over, or None
+:param str scoreline: scoreline of the matches, or None
+:return: a tuple of the WHERE clause that selects the matches and its parameters
+'''
+def _where(match_format, winner, live, scoreline):
+  conditions = []
+  parameters = []
+  if match_format is not None:
+    conditions.append('format = ?')
+    parameters.append(_format_key(match_format))
+
+  if winner is not None:
+    conditions.append('winner = ?')
+    parameters.append(int(winner))
+
+  if live is not None:
+    conditions.append('winner IS NULL' if live else 'winner IS NOT NULL')
+
+  if scoreline is not None:
+    conditions.append('scoreline = ?')
+    parameters.append(scoreline)
+
+  if not conditions:
+    return '', parameters
+
+  return ' WHERE ' + ' AND '.join(conditions), parameters
@@ -0,0 +1,208 @@
+'''
+Arithmetic coding of the points of a match. Each point is coded as whether its server won it, with
+the probability that the server wins given by a model of the match's score before the point, so a
+match in which servers win as often as the model expects costs less than a bit per point. The
+coder is a binary range coder with 32-bit range and 12-bit probabilities.
+'''
+import tennis
+import tennis.codec
+
+_PROBABILITY_BITS = 12
+_TOP = 1 << 24
+
+'''
+:param float probability: probability that the server wins the next point
+:return: the probability that the returner wins the next point, scaled to _PROBABILITY_BITS bits and
+         clamped so that both outcomes can be coded
+'''
+def _returner_probability(probability):
+  probability = round((1 - probability) * (1 << _PROBABILITY_BITS))
+  return min(max(probability, 1), (1 << _PROBABILITY_BITS) - 1)
+
+_DEFAULT_PROBABILITY = _returner_probability(0.64)
+
+class _Encoder:
+  '''
+  Python class for objects that arithmetic-code a sequence of bits.
+
+  :var data: bytes coded so far
+  '''
+  def __init__(self):
+    self.data = bytearray()
+    self._low = 0
+    self._range = 0xffffffff
+    self._cache = 0
+    self._cache_size = 1
+
+  '''
+  :param bool bit: bit to code
+  :param int probability: probability that the bit is 0, scaled to _PROBABILITY_BITS bits
+  '''
+  def encode(self, bit, probability):
+    bound = (self._range >> _PROBABILITY_BITS) * probability
+    if bit:
+      self._low += bound
+      self._range -= bound
+    else:
+      self._range = bound
+
+    while self._range < _TOP:
+      self._range <<= 8
+      self._shift_low()
+
+  '''
+  Moves the top byte of low to the output, propagating a carry into the bytes held back.
+  '''
+  def _shift_low(self):
+    if self._low < 0xff000000 or self._low > 0xffffffff:
+      carry = self._low >> 32
+      byte = self._cache
+      while self._cache_size:
+        self.data.append(byte + carry & 0xff)
+        byte = 0xff
+        self._cache_size -= 1
+
+      self._cache = self._low >> 24 & 0xff
+
+    self._cache_size += 1
+    self._low = (self._low & 0xffffff) << 8
+
+  '''
+  Codes the value in the final range with the most trailing zero bits, so that as few bytes as
+  possible are needed to identify the range.
+
+  :return: the coded bytes, without the leading byte that is always 0 or the trailing zero bytes
+           that the decoder supplies itself
+  '''
+  def finish(self):
+    for bits in range(32, -1, -8):
+      value = (self._low + (1 << bits) - 1) >> bits << bits
+      if value < self._low + self._range:
+        self._low = value
+        break
+
+    for i in range(5):
+      self._shift_low()
+
+    return bytes(self.data[1:]).rstrip(b'\0')
+
+class _Decoder:
+  '''
+  Python class for objects that decode a sequence of bits coded by _Encoder.
+
+  :param bytes data: coded bytes
+  :param int index: index in the data of the first coded byte
+  '''
+  def __init__(self, data, index):
+    self._data = data
+    self._index = index
+    self._range = 0xffffffff
+    self._code = 0
+    for i in range(4):
+      self._code = self._code << 8 | self._next()
+
+  '''
+  :return: the next coded byte, or 0 past the end of the data
+  '''
+  def _next(self):
+    if self._index >= len(self._data):
+      return 0
+
+    self._index += 1
+    return self._data[self._index - 1]
+
+  '''
+  :param int probability: probability that the bit is 0, scaled to _PROBABILITY_BITS bits
+  :return: the decoded bit
+  '''
+  def decode(self, probability):
+    bound = (self._range >> _PROBABILITY_BITS) * probability
+    if self._code < bound:
+      self._range = bound
+      bit = False
+    else:
+      self._code -= bound
+      self._range -= bound
+      bit = True
+
+    while self._range < _TOP:
+      self._range <<= 8
+      self._code = (self._code << 8 | self._next()) & 0xffffffff
+
+    return bit
+
+'''
+Codes the points of a match as the number of points followed by an arithmetic-coded bitstream. The
+model is given a match with the format that does not keep history, so that the decoder gives it the
+same match whatever history it keeps.
+
+:param iterable first_servers: a boolean for each point in the match that is True if the first
+                               server won the point, and False otherwise
+:param MatchFormat match_format: format of the match, or None for the default format
+:param model: callable that takes the match before each point and returns the probability that the
+              server wins the point, or None for a constant probability of 0.64. The decoder must
+              be given the same model.
+:return: the coded points
+:raises RuntimeError: if the points continue after the match is over
+'''
+def encode_points(*, first_servers, match_format=None, model=None):
+  match = tennis.Match(
+    match_format=tennis.MatchFormat() if match_format is None else match_format,
+    history=False
+  )
+  encoder = _Encoder()
+  length = 0
+  for first_server in first_servers:
+    if match.winner is not None:
+      raise RuntimeError('Points must not be played after the match is over.')
+
+    encoder.encode(
+      first_server == match.first_server_to_serve(),
+      _DEFAULT_PROBABILITY if model is None else _returner_probability(model(match))
+    )
+    match.point(first_server=first_server)
+    length += 1
+
+  data = bytearray()
+  tennis.codec.write_varint(data, length)
+  return bytes(data) + encoder.finish()
+
+'''
+Replays the points coded by encode_points into a new match. The model is given a match that does
+not keep history, as encode_points gives it, whatever history the match returned keeps.
+
+:param bytes data: coded points
+:param MatchFormat match_format: format of the match, which must be the one the points were coded
+                                 with, or None for the default format
+:param model: callable that takes the match before each point and returns the probability that the
+              server wins the point, which must be the one the points were coded with, or None for a
+              constant probability of 0.64
+:param bool history: whether to keep every set and game played in the match
+:return: the match
+:raises RuntimeError: if the data is not well-formed coded points
+'''
+def decode_points(*, data, match_format=None, model=None, history=True):
+  match_format = tennis.MatchFormat() if match_format is None else match_format
+  match = tennis.Match(match_format=match_format, history=history)
+  modelled = match if model is None or not history else \
+    tennis.Match(match_format=match_format, history=False)
+  reader = tennis.codec.VarintReader(data)
+  try:
+    length = reader.read()
+  except RuntimeError as e:
+    raise RuntimeError('Coded points must be well-formed.') from e
+
+  decoder = _Decoder(data, reader.index)
+  for i in range(length):
+    if match.winner is not None:
+      raise RuntimeError('Coded points must be well-formed.')
+
+    server_won = decoder.decode(
+      _DEFAULT_PROBABILITY if model is None else _returner_probability(model(modelled))
+    )
+    first_server = server_won == match.first_server_to_serve()
+    match.point(first_server=first_server)
+    if modelled is not match:
+      modelled.point(first_server=first_server)
+
+  return match
@@ -0,0 +1,119 @@
+import tennis
+
+class PointFeed:
+  '''
+  Python class for objects that apply sequence-numbered points from redundant feeds to a match
+  exactly once and in order. A point whose sequence number has been applied or buffered is dropped
+  in constant time, by checking it against the next sequence number and a ring buffer of the points
+  received ahead of it, without replaying or comparing matches. The points applied are kept as a
+  packed bit array, so a duplicate that disagrees with the point applied is counted as a conflict.
+
+  :param Match match: match to apply the points to, or None for a new match with the default format
+  :param int first_sequence_number: sequence number of the first point to apply
+  :param int window: number of sequence numbers from the next one that may be buffered
+  :var match: match to which the points are applied
+  :var next_sequence_number: sequence number of the next point to apply
+  :var window: number of sequence numbers from the next one that may be buffered
+  :var buffered: number of points buffered until the points before them are received
+  :var duplicates: number of points dropped because their sequence number was applied or buffered
+  :var conflicts: number of duplicates whose winner differed from that of the point applied or
+                  buffered
+  '''
+  def __init__(self, *, match=None, first_sequence_number=0, window=64):
+    if window < 1:
+      raise RuntimeError('window must be at least 1.')
+
+    self.match = tennis.Match() if match is None else match
+    self.next_sequence_number = first_sequence_number
+    self.window = window
+    self.buffered = 0
+    self.duplicates = 0
+    self.conflicts = 0
+    self._first_sequence_number = first_sequence_number
+    self._bits = bytearray()
+    self._pending = [None] * window
+
+  '''
+  Applies a point to the match if it has the next sequence number, followed by the points buffered
+  after it, buffers it if it is within the window after the next sequence number, and drops it if
+  its sequence number has been applied or buffered.
+
+  :param int sequence_number: sequence number of the point
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: the number of points applied to the match
+  :raises RuntimeError: if the sequence number is past the window, or the points applied continue
+                        after the match is over, in which case the buffered point that could not be
+                        applied is dropped
+  '''
+  def point(self, *, sequence_number, first_server):
+    next_sequence_number = self.next_sequence_number
+    if sequence_number < next_sequence_number:
+      self.duplicates += 1
+      index = sequence_number - self._first_sequence_number
+      if index >= 0 and bool(self._bits[index >> 3] >> (index & 7) & 1) != bool(first_server):
+        self.conflicts += 1
+
+      return 0
+
+    if sequence_number != next_sequence_number:
+      if sequence_number - next_sequence_number >= self.window:
+        raise RuntimeError('Sequence numbers must be within the window after the next one.')
+
+      pending = self._pending
+      slot = sequence_number % self.window
+      if pending[slot] is None:
+        pending[slot] = bool(first_server)
+        self.buffered += 1
+      else:
+        self.duplicates += 1
+        if pending[slot] != bool(first_server):
+          self.conflicts += 1
+
+      return 0
+
+    self._apply(first_server)
+    applied = 1
+    if self.buffered:
+      pending = self._pending
+      slot = self.next_sequence_number % self.window
+      while pending[slot] is not None:
+        first_server = pending[slot]
+        pending[slot] = None
+        self.buffered -= 1
+        self._apply(first_server)
+        applied += 1
+        slot = self.next_sequence_number % self.window
+
+    return applied
+
+  '''
+  Applies, buffers or drops a sequence of points, as point does for each of them.
+
+  :param iterable events: a (sequence number, first_server) tuple for each point
+  :return: the number of points applied to the match
+  :raises RuntimeError: if a sequence number is past the window, or the points applied continue
+                        after the match is over
+  '''
+  def points(self, *, events):
+    point = self.point
+    return sum(
+      point(sequence_number=sequence_number, first_server=first_server)
+      for sequence_number, first_server in events
+    )
+
+  '''
+  Plays the point with the next sequence number in the match and records it.
+
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :raises RuntimeError: if the match is over
+  '''
+  def _apply(self, first_server):
+    self.match.point(first_server=first_server)
+    index = self.next_sequence_number - self._first_sequence_number
+    if not index & 7:
+      self._bits.append(0)
+
+    if first_server:
+      self._bits[-1] |= 1 << (index & 7)
+
+    self.next_sequence_number += 1
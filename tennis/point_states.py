@@ -0,0 +1,190 @@
+'''
+Columnar export of the score before every point of a corpus of matches, for training models on.
+Each column is written as a .npy file with a fixed-width type, which NumPy can memory-map with
+numpy.load(path, mmap_mode='r'), and which read_point_states memory-maps without NumPy.
+'''
+import array
+import copy
+import mmap
+import os
+import re
+import struct
+import sys
+
+import tennis
+
+'''
+Name, NumPy type and array type code of each column.
+'''
+COLUMNS = (
+  ('match', '<u4', 'I'),
+  ('point', '<u4', 'I'),
+  ('first_server_sets', '|u1', 'B'),
+  ('first_returner_sets', '|u1', 'B'),
+  ('first_server_games', '|u1', 'B'),
+  ('first_returner_games', '|u1', 'B'),
+  ('first_server_points', '<u2', 'H'),
+  ('first_returner_points', '<u2', 'H'),
+  ('tiebreak', '|b1', 'B'),
+  ('first_server_to_serve', '|b1', 'B'),
+  ('break_point', '|b1', 'B'),
+  ('set_point', '|b1', 'B'),
+  ('match_point', '|b1', 'B')
+)
+
+_MAGIC = b'\x93NUMPY\x01\x00'
+_HEADER_SIZE = 128
+_HEADER = re.compile(
+  r"^\{'descr': '([<|][a-z]\d)', 'fortran_order': False, 'shape': \((\d+),\), \} *\n$"
+)
+
+'''
+:param Match match: match whose score to describe, which must not be over
+:return: a tuple with the value of each column after the first two of COLUMNS for the match's
+         current score
+'''
+def point_state(*, match):
+  zet = match.sets[-1]
+  game = zet.games[-1]
+  first_server_served_first = match.first_server_served_first[-1]
+  first_server_games = zet.first_server_games()
+  first_returner_games = zet.first_returner_games()
+  first_server_sets = match.first_server_sets()
+  first_returner_sets = match.first_returner_sets()
+  tiebreak = type(game) is tennis.Tiebreak
+  first_server_leads = (zet._num_games() % 2 == 1) == first_server_served_first
+
+  if tiebreak:
+    points = (game.first_server_points, game.first_returner_points)
+  else:
+    points = (game.server_points, game.returner_points)
+
+  break_point = False
+  set_point = False
+  match_point = False
+  for first_server in (True, False):
+    if copy.copy(game).point(first_server=first_server == first_server_leads) is None:
+      continue
+
+    break_point = break_point or not tiebreak and first_server != first_server_leads
+    won = first_server == first_server_served_first
+    if zet._winner(first_server_games + won, first_returner_games + (not won)) is None:
+      continue
+
+    set_point = True
+    sets = first_server_sets if first_server else first_returner_sets
+    match_point = match_point or sets + 1 == match.target_sets
+
+  return (
+    first_server_sets,
+    first_returner_sets,
+    first_server_games if first_server_served_first else first_returner_games,
+    first_returner_games if first_server_served_first else first_server_games,
+    points[0] if first_server_leads else points[1],
+    points[1] if first_server_leads else points[0],
+    tiebreak,
+    match.first_server_to_serve(),
+    break_point,
+    set_point,
+    match_point
+  )
+
+'''
+:param str descr: NumPy type of the array
+:param int length: number of items in the array
+:return: a .npy header of _HEADER_SIZE bytes for a one-dimensional array
+'''
+def _header(descr, length):
+  header = "{{'descr': '{}', 'fortran_order': False, 'shape': ({},), }}".format(descr, length)
+  header = header.ljust(_HEADER_SIZE - len(_MAGIC) - 3) + '\n'
+  return _MAGIC + struct.pack('<H', len(header)) + header.encode('latin1')
+
+'''
+:param file: binary file object to write to
+:param array.array values: values to append to the file in little-endian byte order
+'''
+def _write(file, values):
+  if sys.byteorder == 'big':
+    values.byteswap()
+
+  file.write(values.tobytes())
+
+'''
+Runs the points of each match in a corpus and writes the score before every point to a .npy file
+per column in COLUMNS, named after the column. The columns are buffered chunk_points points at a
+time, so memory use does not grow with the size of the corpus.
+
+:param iterable sequences: a sequence for each match with a boolean for each point that is True if
+                           the first server won the point, and False otherwise
+:param str directory: existing directory to write the files to
+:param MatchFormat match_format: format of every match in the corpus, or None for the default format
+:param int chunk_points: number of points to buffer before writing them
+:return: the number of points written
+:raises RuntimeError: if a match's points continue after the match is over
+'''
+def write_point_states(*, sequences, directory, match_format=None, chunk_points=65536):
+  match_format = tennis.MatchFormat() if match_format is None else match_format
+  files = [open(os.path.join(directory, name + '.npy'), 'wb') for name, descr, code in COLUMNS]
+  try:
+    for file, (name, descr, code) in zip(files, COLUMNS):
+      file.write(_header(descr, 0))
+
+    columns = [array.array(code) for name, descr, code in COLUMNS]
+    length = 0
+    for i, sequence in enumerate(sequences):
+      match = tennis.Match(match_format=match_format, history=False)
+      for j, first_server in enumerate(sequence):
+        if match.winner is not None:
+          raise RuntimeError(
+            'Match {}: Points must not be played after the match is over.'.format(i)
+          )
+
+        columns[0].append(i)
+        columns[1].append(j)
+        for column, value in zip(columns[2:], point_state(match=match)):
+          column.append(value)
+
+        match.point(first_server=first_server)
+        length += 1
+
+        if len(columns[0]) >= chunk_points:
+          for file, column in zip(files, columns):
+            _write(file, column)
+
+          columns = [array.array(code) for name, descr, code in COLUMNS]
+
+    for file, column, (name, descr, code) in zip(files, columns, COLUMNS):
+      _write(file, column)
+      file.seek(0)
+      file.write(_header(descr, length))
+  finally:
+    for file in files:
+      file.close()
+
+  return length
+
+'''
+Memory-maps the columns written by write_point_states without copying them.
+
+:param str directory: directory the files were written to
+:return: a dictionary that maps the name of each column in COLUMNS to a read-only memoryview of it
+:raises RuntimeError: if a file is not a .npy file of the column's type
+'''
+def read_point_states(*, directory):
+  columns = {}
+  for name, descr, code in COLUMNS:
+    with open(os.path.join(directory, name + '.npy'), 'rb') as file:
+      data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    size = _HEADER_SIZE - len(_MAGIC) - 2
+    header = _HEADER.match(data[len(_MAGIC) + 2:_HEADER_SIZE].decode('latin1'))
+    if data[:len(_MAGIC) + 2] != _MAGIC + struct.pack('<H', size) or header is None or \
+      header.group(1) != descr:
+      raise RuntimeError('{}.npy must be a .npy file of type {}.'.format(name, descr))
+
+    if len(data) - _HEADER_SIZE != int(header.group(2)) * array.array(code).itemsize:
+      raise RuntimeError('{}.npy must be a .npy file of type {}.'.format(name, descr))
+
+    columns[name] = memoryview(data)[_HEADER_SIZE:].cast(code)
+
+  return columns
@@ -0,0 +1,130 @@
+import re
+
+import tennis
+
+_BOOL = {'True': True, 'False': False}
+
+_MATCH = re.compile(
+  r'Match\(sets=\[(.*)\], '
+  r'target_sets=(\d+), '
+  r'target_games=(\d+), '
+  r'deciding_point=(True|False), '
+  r'tiebreak_games=(\d+|None), '
+  r'tiebreak_points=(\d+|None), '
+  r'final_set_target_games=(\d+), '
+  r'final_set_deciding_point=(True|False), '
+  r'final_set_tiebreak_games=(\d+|None), '
+  r'final_set_tiebreak_points=(\d+|None)\)'
+)
+
+_SET = re.compile(
+  r'Set\(games=\[(.*?)\], '
+  r'target_games=(\d+), '
+  r'deciding_point=(True|False), '
+  r'tiebreak_games=(\d+|None), '
+  r'tiebreak_points=(\d+|None)\)'
+)
+
+_GAME = re.compile(
+  r'Game\(server_points=(\d+), returner_points=(\d+), deciding_point=(True|False)\)|'
+  r'Tiebreak\(first_server_points=(\d+), first_returner_points=(\d+), target_points=(\d+)\)'
+)
+
+'''
+:param str value: a string representation of an optional integer
+:return: the integer, or None if the string is 'None'
+'''
+def _optional_int(value):
+  return None if value == 'None' else int(value)
+
+'''
+:param re.Pattern pattern: pattern of each item in the list
+:param str string: string representation of a list, without the enclosing brackets
+:return: yields a match object for each item in the list
+:raises RuntimeError: if the string is not a list of items that match the pattern
+'''
+def _items(pattern, string):
+  end = 0
+  for item in pattern.finditer(string):
+    if string[end:item.start()] != (', ' if end else ''):
+      raise RuntimeError('Match string must be well-formed.')
+
+    end = item.end()
+    yield item
+
+  if end != len(string):
+    raise RuntimeError('Match string must be well-formed.')
+
+'''
+Parses the string representation of a match, as produced by str(), without using eval.
+
+:param str string: string representation of a match
+:param bool trusted: whether to skip validating the sets and games, for strings known to represent
+                     valid matches
+:return: the match
+:raises RuntimeError: if the string is not a well-formed string representation of a valid match
+'''
+def read_match(*, string, trusted=False):
+  match = _MATCH.fullmatch(string.strip())
+  if match is None:
+    raise RuntimeError('Match string must be well-formed.')
+
+  sets = []
+  for zet in _items(_SET, match.group(1)):
+    games = []
+    for game in _items(_GAME, zet.group(1)):
+      if game.group(1) is not None:
+        games.append(tennis.Game(
+          server_points=int(game.group(1)),
+          returner_points=int(game.group(2)),
+          deciding_point=_BOOL[game.group(3)]
+        ))
+      else:
+        games.append(tennis.Tiebreak(
+          first_server_points=int(game.group(4)),
+          first_returner_points=int(game.group(5)),
+          target_points=int(game.group(6))
+        ))
+
+    sets.append(tennis.Set(
+      games=games,
+      target_games=int(zet.group(2)),
+      deciding_point=_BOOL[zet.group(3)],
+      tiebreak_games=_optional_int(zet.group(4)),
+      tiebreak_points=_optional_int(zet.group(5)),
+      trusted=trusted
+    ))
+
+  return tennis.Match(
+    sets=sets,
+    target_sets=int(match.group(2)),
+    target_games=int(match.group(3)),
+    deciding_point=_BOOL[match.group(4)],
+    tiebreak_games=_optional_int(match.group(5)),
+    tiebreak_points=_optional_int(match.group(6)),
+    final_set_target_games=int(match.group(7)),
+    final_set_deciding_point=_BOOL[match.group(8)],
+    final_set_tiebreak_games=_optional_int(match.group(9)),
+    final_set_tiebreak_points=_optional_int(match.group(10)),
+    trusted=trusted
+  )
+
+'''
+Parses a file with the string representation of a match, as produced by str(), on each line. Blank
+lines are skipped.
+
+:param file: file object to read from
+:param bool trusted: whether to skip validating the sets and games, for files known to represent
+                     valid matches
+:return: yields each match in the file
+:raises RuntimeError: if a line is not a well-formed string representation of a valid match
+'''
+def read_matches(*, file, trusted=False):
+  for line_number, line in enumerate(file, 1):
+    if not line.strip():
+      continue
+
+    try:
+      yield read_match(string=line, trusted=trusted)
+    except RuntimeError as e:
+      raise RuntimeError('Line {}: {}'.format(line_number, e)) from e
@@ -0,0 +1,161 @@
+'''
+Replay of a corpus of matches across worker processes. The points of every match are packed into a
+shared memory block that the workers attach to by name, so the corpus is never pickled, and each
+worker writes the results for its slice of matches into a second shared memory block.
+'''
+import array
+import concurrent.futures
+import multiprocessing.shared_memory
+import os
+
+import tennis
+
+class Corpus:
+  '''
+  Python class for objects that hold the points of a corpus of matches in shared memory. The block
+  starts with the offset of each match's points as an unsigned 64-bit integer, followed by the
+  offset of the end of the last match's points, followed by the points of every match packed as a
+  bit array, with a bit that is 1 if the first server won the point and 0 otherwise. The block is
+  released when the corpus is closed, or on leaving a with statement.
+
+  :param iterable sequences: a sequence for each match with a boolean for each point that is True if
+                             the first server won the point, and False otherwise
+  :var name: name of the shared memory block
+  '''
+  def __init__(self, *, sequences):
+    offsets = array.array('Q', [0])
+    bits = bytearray()
+    length = 0
+    for sequence in sequences:
+      for first_server in sequence:
+        if not length & 7:
+          bits.append(0)
+
+        if first_server:
+          bits[-1] |= 1 << (length & 7)
+
+        length += 1
+
+      offsets.append(length)
+
+    self._length = len(offsets) - 1
+    self._memory = multiprocessing.shared_memory.SharedMemory(
+      create=True,
+      size=max(1, offsets.itemsize * len(offsets) + len(bits))
+    )
+    self._memory.buf[:offsets.itemsize * len(offsets)] = offsets.tobytes()
+    self._memory.buf[offsets.itemsize * len(offsets):][:len(bits)] = bits
+    self.name = self._memory.name
+
+  '''
+  :return: the number of matches in the corpus
+  '''
+  def __len__(self):
+    return self._length
+
+  '''
+  Scores every match in the corpus, split into contiguous slices that are scored by worker
+  processes.
+
+  :param MatchFormat match_format: format of every match in the corpus, or None for the default
+                                   format
+  :param int workers: number of worker processes, or None for the number of processors
+  :param int slices: number of slices to split the corpus into, or None for four per worker
+  :return: a tuple of three arrays of unsigned bytes with an item for each match: 1 if the first
+           server won the match, 0 if the first returner won the match, and 2 if the match is
+           unfinished; the number of sets won by the first server; and the number of sets won by the
+           first returner
+  :raises RuntimeError: if a match's points continue after the match is over
+  '''
+  def replay(self, *, match_format=None, workers=None, slices=None):
+    match_format = tennis.MatchFormat() if match_format is None else match_format
+    workers = os.cpu_count() if workers is None else workers
+    slices = 4 * workers if slices is None else slices
+    results = multiprocessing.shared_memory.SharedMemory(create=True, size=max(1, 3 * self._length))
+    try:
+      with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        bounds = [self._length * i // slices for i in range(slices + 1)]
+        futures = [
+          executor.submit(
+            _replay,
+            self.name,
+            self._length,
+            results.name,
+            start,
+            stop,
+            match_format
+          )
+          for start, stop in zip(bounds, bounds[1:]) if start < stop
+        ]
+        for future in futures:
+          future.result()
+
+      return tuple(
+        array.array('B', results.buf[i * self._length:(i + 1) * self._length]) for i in range(3)
+      )
+    finally:
+      results.close()
+      results.unlink()
+
+  '''
+  Releases the shared memory block.
+  '''
+  def close(self):
+    self._memory.close()
+    self._memory.unlink()
+
+  '''
+  :return: the corpus
+  '''
+  def __enter__(self):
+    return self
+
+  '''
+  Releases the shared memory block.
+  '''
+  def __exit__(self, *args):
+    self.close()
+
+'''
+Scores a slice of the matches in a corpus in a worker process.
+
+:param str name: name of the corpus's shared memory block
+:param int length: number of matches in the corpus
+:param str results_name: name of the shared memory block to write the results to
+:param int start: index of the first match in the slice
+:param int stop: index after the last match in the slice
+:param MatchFormat match_format: format of every match in the corpus
+:raises RuntimeError: if a match's points continue after the match is over
+'''
+def _replay(name, length, results_name, start, stop, match_format):
+  memory = multiprocessing.shared_memory.SharedMemory(name=name)
+  results = multiprocessing.shared_memory.SharedMemory(name=results_name)
+  try:
+    offsets = array.array('Q')
+    offsets.frombytes(memory.buf[offsets.itemsize * start:offsets.itemsize * (stop + 1)])
+    base = offsets.itemsize * (length + 1)
+    bits = bytes(memory.buf[base + (offsets[0] >> 3):base + (offsets[-1] + 7 >> 3)])
+    first = offsets[0] & ~7
+
+    winners = bytearray()
+    first_server_sets = bytearray()
+    first_returner_sets = bytearray()
+    for i in range(stop - start):
+      match = tennis.Match(match_format=match_format)
+      try:
+        match.points(first_servers=(
+          bool(bits[j - first >> 3] >> (j & 7) & 1) for j in range(offsets[i], offsets[i + 1])
+        ))
+      except RuntimeError as e:
+        raise RuntimeError('Match {}: {}'.format(start + i, e)) from e
+
+      winners.append(2 if match.winner is None else match.winner)
+      first_server_sets.append(match.first_server_sets())
+      first_returner_sets.append(match.first_returner_sets())
+
+    results.buf[start:stop] = winners
+    results.buf[length + start:length + stop] = first_server_sets
+    results.buf[2 * length + start:2 * length + stop] = first_returner_sets
+  finally:
+    memory.close()
+    results.close()
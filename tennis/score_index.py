@@ -0,0 +1,164 @@
+import array
+import bisect
+
+import tennis
+import tennis.point_states
+
+class ScoreIndex:
+  '''
+  Python class for objects that index the points of a corpus of matches by the score before each
+  point and by the events around it, so that queries intersect posting lists instead of replaying
+  the corpus. Each posting list is a sorted array of (match index, point index) pairs packed into
+  unsigned 64-bit integers.
+
+  The flags that can be queried are:
+
+  - tiebreak: the point is played in a tiebreak
+  - deciding_set: the point is played in the final set
+  - break_point: the returner wins the game if they win the point
+  - set_point: either player wins the set if they win the point
+  - match_point: either player wins the match if they win the point
+  - set_won: the point ends a set
+  - match_won: the point ends the match
+  - comeback: the point ends a match won by a player who trailed by target_sets - 1 sets to none
+
+  :param iterable sequences: a sequence for each match with a boolean for each point that is True if
+                             the first server won the point, and False otherwise
+  :param MatchFormat match_format: format of every match in the corpus, or None for the default
+                                   format
+  :var matches: number of matches in the corpus
+  :var points: number of points in the corpus
+  '''
+  FLAGS = (
+    'tiebreak',
+    'deciding_set',
+    'break_point',
+    'set_point',
+    'match_point',
+    'set_won',
+    'match_won',
+    'comeback'
+  )
+
+  def __init__(self, *, sequences, match_format=None):
+    match_format = tennis.MatchFormat() if match_format is None else match_format
+    self._postings = {}
+    self.matches = 0
+    self.points = 0
+    for match_id, sequence in enumerate(sequences):
+      self._add_match(match_id, sequence, match_format)
+      self.matches += 1
+
+  '''
+  :param int match_id: index of the match in the corpus
+  :param iterable sequence: a boolean for each point in the match that is True if the first server
+                            won the point, and False otherwise
+  :param MatchFormat match_format: format of the match
+  :raises RuntimeError: if the match's points continue after the match is over
+  '''
+  def _add_match(self, match_id, sequence, match_format):
+    match = tennis.Match(match_format=match_format, history=False)
+    deciding = match.target_sets - 1
+    trailed = {True: False, False: False}
+    for point_index, first_server in enumerate(sequence):
+      if match.winner is not None:
+        raise RuntimeError(
+          'Match {}: Points must not be played after the match is over.'.format(match_id)
+        )
+
+      state = tennis.point_states.point_state(match=match)
+      key = match_id << 32 | point_index
+      server_points = state[4:6] if state[7] else state[5:3:-1]
+      self._add(key, ('sets',) + state[0:2])
+      self._add(key, ('games',) + state[2:4])
+      self._add(key, ('points',) + state[4:6])
+      self._add(key, ('server_points',) + server_points)
+      for flag, value in zip(
+        ('tiebreak', 'deciding_set', 'break_point', 'set_point', 'match_point'),
+        (state[6], state[0] == state[1] == deciding, state[8], state[9], state[10])
+      ):
+        if value:
+          self._add(key, flag)
+
+      if deciding:
+        trailed[True] = trailed[True] or state[0:2] == (0, deciding)
+        trailed[False] = trailed[False] or state[0:2] == (deciding, 0)
+
+      winner = match.point(first_server=first_server)
+      self.points += 1
+      if winner is not None:
+        self._add(key, 'set_won')
+        self._add(key, 'match_won')
+        if trailed[winner]:
+          self._add(key, 'comeback')
+      elif match.first_server_sets() + match.first_returner_sets() != state[0] + state[1]:
+        self._add(key, 'set_won')
+
+  '''
+  :param int key: packed match and point index
+  :param term: term whose posting list to append the key to
+  '''
+  def _add(self, key, term):
+    postings = self._postings.get(term)
+    if postings is None:
+      postings = self._postings[term] = array.array('Q')
+
+    postings.append(key)
+
+  '''
+  Finds the points that match every input criterion. Sets, games and points are given from the
+  perspective of the first server of the match, and server_points from the perspective of the
+  server of the point.
+
+  :param tuple sets: number of sets won by each player before the point, or None for any
+  :param tuple games: number of games won by each player in the set before the point, or None for
+                      any
+  :param tuple points: number of points won by each player in the game before the point, or None
+                       for any
+  :param tuple server_points: number of points won by the server and the returner in the game
+                              before the point, or None for any
+  :param iterable flags: flags in FLAGS that must all be set for the point
+  :return: a sorted list of (match index, point index) tuples, for every point if no criteria are
+           given
+  :raises RuntimeError: if a flag is not in FLAGS
+  '''
+  def query(self, *, sets=None, games=None, points=None, server_points=None, flags=()):
+    terms = []
+    for name, value in (
+      ('sets', sets),
+      ('games', games),
+      ('points', points),
+      ('server_points', server_points)
+    ):
+      if value is not None:
+        terms.append((name,) + tuple(value))
+
+    for flag in flags:
+      if flag not in self.FLAGS:
+        raise RuntimeError('Flags must be in ScoreIndex.FLAGS.')
+
+      terms.append(flag)
+
+    if not terms:
+      result = sorted(
+        key
+        for term, values in self._postings.items() if type(term) is tuple and term[0] == 'sets'
+        for key in values
+      )
+      return [(key >> 32, key & 0xffffffff) for key in result]
+
+    postings = sorted((self._postings.get(term, ()) for term in terms), key=len)
+    result = postings[0]
+    for other in postings[1:]:
+      result = [key for key in result if _contains(other, key)]
+
+    return [(key >> 32, key & 0xffffffff) for key in result]
+
+'''
+:param array.array postings: sorted posting list
+:param int key: packed match and point index
+:return: True if the posting list contains the key, and False otherwise
+'''
+def _contains(postings, key):
+  i = bisect.bisect_left(postings, key)
+  return i < len(postings) and postings[i] == key
@@ -0,0 +1,119 @@
+import array
+
+import tennis
+import tennis.point_states
+
+class ScoreTrie:
+  '''
+  Python class for objects that store the point sequences of many matches of the same format as a
+  trie, so that matches with a common prefix share its nodes. Each node stands for the score reached
+  by the points on the path to it, packed into an integer, and records how many of the matches
+  stored pass through it and how many of those were won by each player. The nodes are kept in
+  parallel arrays rather than as objects, and the nodes with each score are indexed so that the
+  outcomes of every match that reached a score can be summed without walking the trie.
+
+  :param MatchFormat match_format: format of every match stored, or None for the default format
+  :var match_format: format of every match stored
+  :var matches: number of matches stored
+  '''
+  def __init__(self, *, match_format=None):
+    self.match_format = tennis.MatchFormat() if match_format is None else match_format
+    self.matches = 0
+    self._children = array.array('q', [-1, -1])
+    self._counts = array.array('Q', [0])
+    self._first_server_wins = array.array('Q', [0])
+    self._first_returner_wins = array.array('Q', [0])
+    self._nodes = {_pack(tennis.Match(match_format=self.match_format)): array.array('Q', [0])}
+
+  '''
+  :return: the number of nodes in the trie
+  '''
+  def __len__(self):
+    return len(self._counts)
+
+  '''
+  Stores the points of a match.
+
+  :param iterable first_servers: a boolean for each point in the match that is True if the first
+                                 server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  :raises RuntimeError: if the points continue after the match is over, in which case the trie is
+                        left unchanged
+  '''
+  def add(self, *, first_servers):
+    first_servers = [bool(first_server) for first_server in first_servers]
+    path = [0]
+    for first_server in first_servers:
+      child = self._children[2 * path[-1] + first_server]
+      if child < 0:
+        break
+
+      path.append(child)
+
+    shared = len(path) - 1
+    match = tennis.Match(match_format=self.match_format, history=False)
+    match.points(first_servers=first_servers[:shared])
+    packed = []
+    for first_server in first_servers[shared:]:
+      match.point(first_server=first_server)
+      packed.append(_pack(match))
+
+    for first_server, score in zip(first_servers[shared:], packed):
+      node = len(self._counts)
+      self._children[2 * path[-1] + first_server] = node
+      self._children.extend((-1, -1))
+      self._counts.append(0)
+      self._first_server_wins.append(0)
+      self._first_returner_wins.append(0)
+      self._nodes.setdefault(score, array.array('Q')).append(node)
+      path.append(node)
+
+    for node in path:
+      self._counts[node] += 1
+      if match.winner is True:
+        self._first_server_wins[node] += 1
+      elif match.winner is False:
+        self._first_returner_wins[node] += 1
+
+    self.matches += 1
+    return match.winner
+
+  '''
+  :param Match match: match with the format of the trie, at the score to look up
+  :return: a tuple of the number of matches stored that reached the match's score, and the number
+           of those that were won by the first server and by the first returner
+  '''
+  def outcomes(self, *, match):
+    nodes = self._nodes.get(_pack(match), ())
+    return (
+      sum(self._counts[node] for node in nodes),
+      sum(self._first_server_wins[node] for node in nodes),
+      sum(self._first_returner_wins[node] for node in nodes)
+    )
+
+  '''
+  :param Match match: match with the format of the trie, at the score to look up
+  :return: the fraction of the finished matches stored that reached the match's score that were
+           won by the first server, or None if no finished match reached it
+  '''
+  def win_probability(self, *, match):
+    count, first_server_wins, first_returner_wins = self.outcomes(match=match)
+    if not first_server_wins + first_returner_wins:
+      return None
+
+    return first_server_wins / (first_server_wins + first_returner_wins)
+
+'''
+:param Match match: match whose score to pack
+:return: the match's score packed into an integer: the number of sets won by each player and, if the
+         match is not over, the number of games and points won by each player in the current set and
+         game, whether the current game is a tiebreak and who is serving
+'''
+def _pack(match):
+  if match.winner is not None:
+    return match.first_server_sets() | match.first_returner_sets() << 8 | 1 << 60
+
+  state = tennis.point_states.point_state(match=match)
+  return state[0] | state[1] << 8 | state[2] << 16 | state[3] << 24 | state[4] << 32 | \
+    state[5] << 44 | state[6] << 56 | state[7] << 57
@@ -0,0 +1,266 @@
+'''
+Live-scoring service that runs on an asyncio event loop over TCP or a Unix socket. Clients send
+newline-terminated commands:
+
+- point <match id> <point>: plays a point in the match with the input id, where the point is S or A
+  if the server won it and R or D if the returner won it, as in tennis.io. A match is started with
+  the server's format by the first point played in it.
+- subscribe <match id>: subscribes to the score of the match with the input id, which is sent
+  immediately and again after every point played in the match.
+- unsubscribe <match id>: unsubscribes from the score of the match with the input id.
+
+The server sends newline-terminated messages:
+
+- score <match id> <scoreline>: the scoreline of a match that the client is subscribed to, in the
+  format of Match.scoreline.
+- error <match id> <message>: a command of the client's failed, with - for the match id if the
+  command is malformed. A client whose command is longer than 2 ** 16 bytes is sent an error and
+  disconnected.
+
+A match is removed from the live matches when it is over, and only its final scoreline is kept, for
+the most recently finished matches up to the server's finished_capacity. The ids of every finished
+match are kept after their scorelines are dropped, so points played in a finished match fail and an
+id is never started again.
+
+Score updates for a client that reads slowly are conflated, so that only the latest score of each
+match is waiting to be sent to it, and a client's commands are not read while the errors sent to it
+are waiting to be sent, so memory use does not grow with a client's backlog.
+'''
+import asyncio
+import collections
+
+import tennis
+import tennis.io
+
+_LIMIT = 2 ** 16
+
+class Server:
+  '''
+  Python class for objects that host the matches of a live-scoring service.
+
+  :param MatchFormat match_format: format of every match, or None for the default format
+  :param int finished_capacity: maximum number of finished matches whose final scoreline is kept
+  :var match_format: format of every match
+  :var finished_capacity: maximum number of finished matches whose final scoreline is kept
+  :var matches: dictionary that maps the id of each match that is not over to the match
+  :var finished: ordered dictionary that maps the id of each of the most recently finished matches
+                 to its final scoreline, from the least to the most recently finished
+  :var ended: set of the ids of every finished match
+  :var points: number of points played
+  :var connections: number of clients connected
+  '''
+  def __init__(self, *, match_format=None, finished_capacity=4096):
+    if finished_capacity < 0:
+      raise RuntimeError('finished_capacity must be non-negative.')
+
+    self.match_format = tennis.MatchFormat() if match_format is None else match_format
+    self.finished_capacity = finished_capacity
+    self.matches = {}
+    self.finished = collections.OrderedDict()
+    self.ended = set()
+    self.points = 0
+    self.connections = 0
+    self._subscribers = {}
+
+  '''
+  Starts serving clients on a TCP port or a Unix socket.
+
+  :param str host: host to listen on for TCP connections, or None for every interface
+  :param int port: port to listen on for TCP connections, or None to listen on a Unix socket
+  :param str path: path of the Unix socket to listen on if port is None
+  :param int backlog: number of connections that may wait to be accepted, which must allow for the
+                      subscribers that connect at once
+  :return: the asyncio.Server that serves the clients
+  :raises RuntimeError: if neither a port nor a path is given
+  '''
+  async def start(self, *, host=None, port=None, path=None, backlog=4096):
+    if port is not None:
+      return await asyncio.start_server(
+        self._serve,
+        host=host,
+        port=port,
+        backlog=backlog,
+        limit=_LIMIT
+      )
+
+    if path is None:
+      raise RuntimeError('A port or a path must be given.')
+
+    return await asyncio.start_unix_server(self._serve, path=path, backlog=backlog, limit=_LIMIT)
+
+  '''
+  Plays a point in a match and sends its score to the match's subscribers. A match that is over is
+  moved from matches to finished.
+
+  :param str match_id: id of the match, which is started if it is not being played and has not
+                       finished
+  :param bool server: True if the server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  :raises RuntimeError: if the match is over
+  '''
+  def point(self, *, match_id, server):
+    match = self.matches.get(match_id)
+    if match is None:
+      if match_id in self.ended:
+        raise RuntimeError('Points must not be played after the match is over.')
+
+      match = self.matches[match_id] = tennis.Match(match_format=self.match_format)
+
+    winner = match.point(first_server=server == match.first_server_to_serve())
+    self.points += 1
+    if winner is not None:
+      del self.matches[match_id]
+      self.ended.add(match_id)
+      if self.finished_capacity:
+        self.finished[match_id] = match.scoreline()
+        if len(self.finished) > self.finished_capacity:
+          self.finished.popitem(last=False)
+
+    subscribers = self._subscribers.get(match_id)
+    if subscribers:
+      message = 'score {} {}\n'.format(match_id, match.scoreline()).encode()
+      for connection in subscribers:
+        connection.send(match_id, message)
+
+    return winner
+
+  '''
+  Serves a client until it disconnects.
+
+  :param asyncio.StreamReader reader: stream of the client's commands
+  :param asyncio.StreamWriter writer: stream of the messages to the client
+  '''
+  async def _serve(self, reader, writer):
+    connection = _Connection(writer)
+    sender = asyncio.get_running_loop().create_task(connection.run())
+    self.connections += 1
+    try:
+      while not reader.at_eof():
+        try:
+          line = await reader.readline()
+        except ValueError:
+          connection.send(None, 'error - Commands must be at most {} bytes long.\n'.format(
+            _LIMIT
+          ).encode())
+          await connection.flushed()
+          break
+
+        if not line:
+          break
+
+        error = self._command(connection, line.decode(errors='replace').split())
+        if error is not None:
+          connection.send(None, 'error {} {}\n'.format(*error).encode())
+          await connection.flushed()
+    except ConnectionError:
+      pass
+    finally:
+      self.connections -= 1
+      for match_id in connection.match_ids:
+        self._unsubscribe(connection, match_id)
+
+      sender.cancel()
+      writer.close()
+
+  '''
+  :param _Connection connection: connection of the client that sent the command
+  :param list words: words of the command
+  :return: a tuple of the match id and the message of the error if the command failed, and None
+           otherwise
+  '''
+  def _command(self, connection, words):
+    if len(words) == 3 and words[0] == 'point':
+      if words[2] not in tennis.io.SERVER_POINTS and words[2] not in tennis.io.RETURNER_POINTS:
+        return words[1], 'Points must be S, A, R or D, not {!r}.'.format(words[2])
+
+      try:
+        self.point(match_id=words[1], server=words[2] in tennis.io.SERVER_POINTS)
+      except RuntimeError as e:
+        return words[1], e
+    elif len(words) == 2 and words[0] == 'subscribe':
+      match = self.matches.get(words[1])
+      connection.match_ids.add(words[1])
+      self._subscribers.setdefault(words[1], set()).add(connection)
+      if match is not None:
+        scoreline = match.scoreline()
+      elif words[1] in self.finished:
+        scoreline = self.finished[words[1]]
+      else:
+        scoreline = tennis.Match(match_format=self.match_format).scoreline()
+      connection.send(words[1], 'score {} {}\n'.format(words[1], scoreline).encode())
+    elif len(words) == 2 and words[0] == 'unsubscribe':
+      if words[1] not in connection.match_ids:
+        return words[1], 'Matches must be subscribed to before they are unsubscribed from.'
+
+      connection.match_ids.remove(words[1])
+      self._unsubscribe(connection, words[1])
+    else:
+      return '-', 'Commands must be point, subscribe or unsubscribe with their arguments.'
+
+  '''
+  :param _Connection connection: connection of the client to unsubscribe
+  :param str match_id: id of the match to unsubscribe the client from
+  '''
+  def _unsubscribe(self, connection, match_id):
+    subscribers = self._subscribers[match_id]
+    subscribers.discard(connection)
+    if not subscribers:
+      del self._subscribers[match_id]
+
+class _Connection:
+  '''
+  Python class for objects that send messages to a client, keeping only the latest message for each
+  key until it is sent.
+
+  :param asyncio.StreamWriter writer: stream of the messages to the client
+  :var match_ids: set of the ids of the matches the client is subscribed to
+  '''
+  def __init__(self, writer):
+    self._writer = writer
+    self._messages = {}
+    self._errors = 0
+    self._ready = asyncio.Event()
+    self._flushed = asyncio.Event()
+    self._flushed.set()
+    self.match_ids = set()
+
+  '''
+  :param key: key of the message, which replaces any message with the same key that is waiting to
+              be sent, or None for a message that replaces none
+  :param bytes message: message to send
+  '''
+  def send(self, key, message):
+    if key is None:
+      self._errors += 1
+      key = (None, self._errors)
+
+    self._messages[key] = message
+    self._ready.set()
+    self._flushed.clear()
+
+  '''
+  Waits until every message waiting to be sent has been written to the client.
+  '''
+  async def flushed(self):
+    await self._flushed.wait()
+
+  '''
+  Writes the messages to the client as they are sent, waiting for the client to read them before
+  writing more.
+  '''
+  async def run(self):
+    while True:
+      await self._ready.wait()
+      self._ready.clear()
+      messages = self._messages
+      self._messages = {}
+      self._writer.write(b''.join(messages.values()))
+      try:
+        await self._writer.drain()
+      except ConnectionError:
+        self._flushed.set()
+        return
+
+      if not self._messages:
+        self._flushed.set()
@@ -1,3 +1,6 @@
+import copy
+import io
+
 import tennis
 
 class Set:
@@ -11,13 +14,21 @@ class Set:
                              None if a tiebreak is not to be played
   :param int tiebreak_points: number of points required to win the tiebreak, or None if a tiebreak
                               is not to be played
-  :var games: list of games played in the set
+  :param SetFormat set_format: format of the set, which is used instead of target_games and the
+                               other format parameters if it is not None
+  :param bool history: whether to keep every game played in the set, or only the game currently
+                       being played along with the number of games won by each player
+  :param bool trusted: whether to skip validating the games, for games known to be valid
+  :var games: list of games played in the set, or a list with only the game currently being played
+              if history is not being kept
+  :var set_format: format of the set, which is shared with every set of the same format
   :var target_games: number of games required to win the set
   :var deciding_point: whether to play a deciding point at deuce
   :var tiebreak_games: number of games each player must have before a tiebreak is played, or None if
                        a tiebreak is not to be played
   :var tiebreak_points: number of points required to win the tiebreak, or None if a tiebreak is not
                         to be played
+  :var history: whether every game played in the set is kept
   :var winner: True if the first server won the set, False if the first returner won the set, and
                None otherwise
   '''
@@ -28,66 +39,166 @@ class Set:
     target_games=6,
     deciding_point=False,
     tiebreak_games=6,
-    tiebreak_points=7
+    tiebreak_points=7,
+    set_format=None,
+    history=True,
+    trusted=False
   ):
-    # TODO(abw333): validate games
-
-    if target_games < 0:
-      raise RuntimeError('Point scores must be non-negative.')
-
-    if (tiebreak_games is None) != (tiebreak_points is None):
-      raise RuntimeError('tiebreak_games and tiebreak_points must both be None or non-None.')
-
-    if tiebreak_games is not None and min(tiebreak_games, tiebreak_points) < 0:
-      raise RuntimeError('Point scores must be non-negative.')
+    if set_format is None:
+      set_format = tennis.SetFormat(
+        target_games=target_games,
+        deciding_point=deciding_point,
+        tiebreak_games=tiebreak_games,
+        tiebreak_points=tiebreak_points
+      )
 
     if games is not None:
       self.games = games
-    elif tiebreak_games != 0:
-      self.games = [tennis.Game(server_points=0, returner_points=0, deciding_point=deciding_point)]
+    elif set_format.tiebreak_games != 0:
+      self.games = [tennis.Game(
+        server_points=0,
+        returner_points=0,
+        deciding_point=set_format.deciding_point
+      )]
     else:
       self.games = [tennis.Tiebreak(
         first_server_points=0,
         first_returner_points=0,
-        target_points=tiebreak_points
+        target_points=set_format.tiebreak_points
       )]
 
-    self.target_games = target_games
-    self.deciding_point = deciding_point
-    self.tiebreak_games = tiebreak_games
-    self.tiebreak_points = tiebreak_points
+    self.set_format = set_format
+    self.history = history
+    self._games = 0
+    self._first_server_games = 0
+    self._first_returner_games = 0
+
+    if not trusted:
+      self._validate_games()
+
     self.winner = self._compute_winner()
     self._first_server_to_serve = self._compute_first_server_to_serve()
 
+  '''
+  :return: the number of games required to win the set
+  '''
+  @property
+  def target_games(self):
+    return self.set_format.target_games
+
+  '''
+  :return: whether to play a deciding point at deuce
+  '''
+  @property
+  def deciding_point(self):
+    return self.set_format.deciding_point
+
+  '''
+  :return: the number of games each player must have before a tiebreak is played, or None if
+           a tiebreak is not to be played
+  '''
+  @property
+  def tiebreak_games(self):
+    return self.set_format.tiebreak_games
+
+  '''
+  :return: the number of points required to win the tiebreak, or None if a tiebreak is not
+           to be played
+  '''
+  @property
+  def tiebreak_points(self):
+    return self.set_format.tiebreak_points
+
+  '''
+  Checks, in a single pass over the games, that there is at least one game, that only the last game
+  is unfinished and that it is unfinished unless the set is over, that no game is played after the
+  set is over, that tiebreaks are played exactly when each player has won tiebreak_games games, and
+  that each game has the set's format. The games are counted from the games no longer kept if
+  history is not being kept.
+
+  :raises RuntimeError: if the games are not valid
+  '''
+  def _validate_games(self):
+    first_server_games = self._first_server_games
+    first_returner_games = self._first_returner_games
+    for i, game in enumerate(self.games):
+      if self._winner(first_server_games, first_returner_games) is not None:
+        raise RuntimeError('Games must not be played after the set is over.')
+
+      tiebreak = self.tiebreak_games is not None and \
+        first_server_games == first_returner_games == self.tiebreak_games
+      if tiebreak != (type(game) is tennis.Tiebreak):
+        raise RuntimeError(
+          'Tiebreaks must be played exactly when each player has won tiebreak_games games.'
+        )
+
+      if tiebreak and game.target_points != self.tiebreak_points or \
+        not tiebreak and game.deciding_point != self.deciding_point:
+        raise RuntimeError('Games must have the set\'s format.')
+
+      if game.winner is None:
+        if i != len(self.games) - 1:
+          raise RuntimeError('Only the last game of a set may be unfinished.')
+      elif ((self._games + i) % 2 == 0) == game.winner:
+        first_server_games += 1
+      else:
+        first_returner_games += 1
+
+    if not self.games:
+      raise RuntimeError('Sets must have at least one game.')
+
+    if self.games[-1].winner is not None and \
+      self._winner(first_server_games, first_returner_games) is None:
+      raise RuntimeError('The last game of a set must be unfinished unless the set is over.')
+
   '''
   :return: the number of games won by the player who served first
   '''
   def first_server_games(self):
-    return len([i for i, g in enumerate(self.games) if (i % 2 == 0) == g.winner])
+    return self._first_server_games + len([
+      0 for i, g in enumerate(self.games, self._games) if (i % 2 == 0) == g.winner
+    ])
 
   '''
   :return: the number of games won by the player who returned first
   '''
   def first_returner_games(self):
-    return len([i for i, g in enumerate(self.games) if (i % 2 == 1) == g.winner])
+    return self._first_returner_games + len([
+      0 for i, g in enumerate(self.games, self._games) if (i % 2 == 1) == g.winner
+    ])
+
+  '''
+  :return: the number of games played in the set, including the game currently being played
+  '''
+  def _num_games(self):
+    return self._games + len(self.games)
 
   '''
   :return: True if the first server won the set, False if the first returner won the set, and None
            otherwise
   '''
   def _compute_winner(self):
-    first_server_games = self.first_server_games()
-    if self.tiebreak_games is not None and first_server_games == self.tiebreak_games + 1:
+    return self._winner(self.first_server_games(), self.first_returner_games())
+
+  '''
+  :param int first_server_games: number of games won by the player who served first
+  :param int first_returner_games: number of games won by the player who returned first
+  :return: True if the first server won the set, False if the first returner won the set, and None
+           otherwise, given the input number of games won by each player
+  '''
+  def _winner(self, first_server_games, first_returner_games):
+    tiebreak_games = self.set_format.tiebreak_games
+    target_games = self.set_format.target_games
+    if tiebreak_games is not None and first_server_games == tiebreak_games + 1:
       return True
 
-    first_returner_games = self.first_returner_games()
-    if self.tiebreak_games is not None and first_returner_games == self.tiebreak_games + 1:
+    if tiebreak_games is not None and first_returner_games == tiebreak_games + 1:
       return False
 
-    if first_server_games >= self.target_games and first_server_games - first_returner_games >= 2:
+    if first_server_games >= target_games and first_server_games - first_returner_games >= 2:
       return True
 
-    if first_returner_games >= self.target_games and first_returner_games - first_server_games >= 2:
+    if first_returner_games >= target_games and first_returner_games - first_server_games >= 2:
       return False
 
   '''
@@ -98,7 +209,22 @@ class Set:
     if type(self.games[-1]) is tennis.Tiebreak:
       return None
 
-    return bool(len(self.games) % 2)
+    return bool(self._num_games() % 2)
+
+  '''
+  :return: a new set with the same score that does not keep history, with a copy of the game
+           currently being played
+  '''
+  def _without_history(self):
+    index = self._num_games() - 1
+    game = self.games[-1]
+    zet = Set(games=[copy.copy(game)], set_format=self.set_format, history=False, trusted=True)
+    zet._games = index
+    zet._first_server_games = self.first_server_games() - ((index % 2 == 0) == game.winner)
+    zet._first_returner_games = self.first_returner_games() - ((index % 2 == 1) == game.winner)
+    zet.winner = self.winner
+    zet._first_server_to_serve = self._first_server_to_serve
+    return zet
 
   '''
   :return: True if the first server is to serve the next point, and False if the first returner
@@ -126,7 +252,7 @@ class Set:
     if self.winner is not None:
       raise RuntimeError('Cannot advance this set\'s score because the set is over.')
 
-    game_winner = self.games[-1].point(first_server=(len(self.games) % 2 == 1) == first_server)
+    game_winner = self.games[-1].point(first_server=(self._num_games() % 2 == 1) == first_server)
     if game_winner is None:
       return None
 
@@ -135,41 +261,64 @@ class Set:
     if self.winner is not None:
       return self.winner
 
-    if self.tiebreak_games is not None and \
-      self.first_server_games() == self.tiebreak_games and \
-      self.first_returner_games() == self.tiebreak_games:
-      self.games.append(tennis.Tiebreak(
+    if not self.history:
+      self._first_server_games = self.first_server_games()
+      self._first_returner_games = self.first_returner_games()
+      self._games = self._num_games()
+      self.games = []
+
+    self.games.append(self._next_game())
+    self._first_server_to_serve = self._compute_first_server_to_serve()
+
+  '''
+  :return: a new tiebreak if each player has won tiebreak_games games, and a new game otherwise
+  '''
+  def _next_game(self):
+    set_format = self.set_format
+    if set_format.tiebreak_games is not None and \
+      self.first_server_games() == set_format.tiebreak_games and \
+      self.first_returner_games() == set_format.tiebreak_games:
+      return tennis.Tiebreak(
         first_server_points=0,
         first_returner_points=0,
-        target_points=self.tiebreak_points
-      ))
-      self._first_server_to_serve = None
-    else:
-      self.games.append(tennis.Game(
-        server_points=0,
-        returner_points=0,
-        deciding_point=self.deciding_point
-      ))
-      self._first_server_to_serve = not self._first_server_to_serve
+        target_points=set_format.tiebreak_points
+      )
+
+    return tennis.Game(server_points=0, returner_points=0, deciding_point=set_format.deciding_point)
 
   '''
-  :return: a string representation of the set
+  Writes the string representation of the set to a file object one game at a time, without building
+  the whole string in memory.
+
+  :param file: file object to write to
   '''
-  def __str__(self):
-    return ('{}('
-      'games={}, '
+  def write(self, *, file):
+    file.write('{}(games=['.format(type(self).__name__))
+    for i, game in enumerate(self.games):
+      if i:
+        file.write(', ')
+
+      file.write(str(game))
+
+    file.write(('], '
       'target_games={}, '
       'deciding_point={}, '
       'tiebreak_games={}, '
       'tiebreak_points={}'
     ')').format(
-      type(self).__name__,
-      self.games,
       self.target_games,
       self.deciding_point,
       self.tiebreak_games,
       self.tiebreak_points
-    )
+    ))
+
+  '''
+  :return: a string representation of the set
+  '''
+  def __str__(self):
+    output = io.StringIO()
+    self.write(file=output)
+    return output.getvalue()
 
   '''
   :return: a string representation of the set
@@ -182,4 +331,25 @@ class Set:
   :return: True if the input object is equal to the set, and False otherwise
   '''
   def __eq__(self, other):
-    return isinstance(other, type(self)) and self.__dict__ == other.__dict__
+    if self is other:
+      return True
+
+    if not isinstance(other, type(self)) or self._key() != other._key():
+      return False
+
+    return self.__dict__ == other.__dict__
+
+  __hash__ = None
+
+  '''
+  :return: a tuple of the set's format, winner, number of games and current game, which is cheap to
+           compute and equal for equal sets
+  '''
+  def _key(self):
+    return (
+      self.set_format,
+      self.winner,
+      self._games,
+      len(self.games),
+      self.games[-1] if self.games else None
+    )
@@ -0,0 +1,104 @@
+class SetFormat:
+  '''
+  Python class for objects that represent the format of tennis sets. Formats are immutable and
+  interned, so constructing a format with the same parameters as an existing one returns the
+  existing format without validating the parameters again, and formats can be compared by identity.
+
+  :param int target_games: number of games required to win the set
+  :param bool deciding_point: whether to play a deciding point at deuce
+  :param int tiebreak_games: number of games each player must have before a tiebreak is played, or
+                             None if a tiebreak is not to be played
+  :param int tiebreak_points: number of points required to win the tiebreak, or None if a tiebreak
+                              is not to be played
+  :var target_games: number of games required to win the set
+  :var deciding_point: whether to play a deciding point at deuce
+  :var tiebreak_games: number of games each player must have before a tiebreak is played, or None if
+                       a tiebreak is not to be played
+  :var tiebreak_points: number of points required to win the tiebreak, or None if a tiebreak is not
+                        to be played
+  '''
+  __slots__ = ('target_games', 'deciding_point', 'tiebreak_games', 'tiebreak_points')
+
+  _formats = {}
+
+  def __new__(cls, *, target_games=6, deciding_point=False, tiebreak_games=6, tiebreak_points=7):
+    key = (cls, target_games, deciding_point, tiebreak_games, tiebreak_points)
+    set_format = cls._formats.get(key)
+    if set_format is not None:
+      return set_format
+
+    if target_games < 0:
+      raise RuntimeError('Point scores must be non-negative.')
+
+    if (tiebreak_games is None) != (tiebreak_points is None):
+      raise RuntimeError('tiebreak_games and tiebreak_points must both be None or non-None.')
+
+    if tiebreak_games is not None and min(tiebreak_games, tiebreak_points) < 0:
+      raise RuntimeError('Point scores must be non-negative.')
+
+    set_format = super().__new__(cls)
+    for name, value in zip(SetFormat.__slots__, key[1:]):
+      object.__setattr__(set_format, name, value)
+
+    return cls._formats.setdefault(key, set_format)
+
+  '''
+  :raises RuntimeError: always, because formats are immutable
+  '''
+  def __setattr__(self, name, value):
+    raise RuntimeError('Formats cannot be modified.')
+
+  '''
+  :raises RuntimeError: always, because formats are immutable
+  '''
+  def __delattr__(self, name):
+    raise RuntimeError('Formats cannot be modified.')
+
+  '''
+  :return: a tuple that unpickles and copies the format as the interned format
+  '''
+  def __reduce__(self):
+    return _set_format, (
+      type(self),
+      self.target_games,
+      self.deciding_point,
+      self.tiebreak_games,
+      self.tiebreak_points
+    )
+
+  '''
+  :return: a string representation of the format
+  '''
+  def __repr__(self):
+    return (
+      '{}('
+      'target_games={}, '
+      'deciding_point={}, '
+      'tiebreak_games={}, '
+      'tiebreak_points={}'
+      ')'
+    ).format(
+      type(self).__name__,
+      self.target_games,
+      self.deciding_point,
+      self.tiebreak_games,
+      self.tiebreak_points
+    )
+
+'''
+:param type cls: SetFormat or a subclass of it
+:param int target_games: number of games required to win the set
+:param bool deciding_point: whether to play a deciding point at deuce
+:param int tiebreak_games: number of games each player must have before a tiebreak is played, or
+                           None if a tiebreak is not to be played
+:param int tiebreak_points: number of points required to win the tiebreak, or None if a tiebreak is
+                            not to be played
+:return: the interned set format with the input parameters
+'''
+def _set_format(cls, target_games, deciding_point, tiebreak_games, tiebreak_points):
+  return cls(
+    target_games=target_games,
+    deciding_point=deciding_point,
+    tiebreak_games=tiebreak_games,
+    tiebreak_points=tiebreak_points
+  )
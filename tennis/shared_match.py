@@ -0,0 +1,173 @@
+'''
+Concurrent access to a match from several threads. Writers play points under the match's lock and
+publish an immutable snapshot of the match after each commit, and readers take the latest snapshot
+without locking, so they never see a match in the middle of a point and never wait for a writer.
+'''
+import threading
+
+import tennis
+
+class SharedMatch:
+  '''
+  Python class for objects that share a match between writer and reader threads. Each call to point
+  or points is a commit, which plays its points under a lock held only by writers and then publishes
+  a MatchSnapshot of the match with the next version, so a batch of points is published once and a
+  commit that plays no point publishes nothing. Replacing the published snapshot is a single
+  assignment, so snapshot never blocks and always returns a whole snapshot.
+
+  :param Match match: match to share, which must not be used directly afterwards, or None for a new
+                      match with the default format
+  :var version: version of the latest snapshot, which is 0 for the snapshot of the input match and
+                increases by 1 with every commit that plays a point
+  '''
+  def __init__(self, *, match=None):
+    self._match = tennis.Match() if match is None else match
+    self._lock = threading.Lock()
+    self._snapshot = MatchSnapshot(version=0, data=self._match.to_bytes())
+
+  '''
+  :return: version of the latest snapshot
+  '''
+  @property
+  def version(self):
+    return self._snapshot.version
+
+  '''
+  Plays a point in the match and publishes a snapshot of it.
+
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: the snapshot published
+  :raises RuntimeError: if the match is over, in which case no snapshot is published
+  '''
+  def point(self, *, first_server):
+    with self._lock:
+      if self._match.winner is not None:
+        raise RuntimeError('Points must not be played after the match is over.')
+
+      self._match.point(first_server=first_server)
+      return self._publish()
+
+  '''
+  Plays a sequence of points in the match and publishes a single snapshot of it if any point was
+  played.
+
+  :param iterable first_servers: a boolean for each point that is True if the first server won the
+                                 point, and False otherwise
+  :return: the snapshot published, or the latest snapshot if no point was played
+  :raises RuntimeError: if the points continue after the match is over, in which case a snapshot is
+                        published with the points played before it was over, if any
+  '''
+  def points(self, *, first_servers):
+    with self._lock:
+      point = self._match.point
+      played = False
+      try:
+        for first_server in first_servers:
+          point(first_server=first_server)
+          played = True
+      finally:
+        if played:
+          self._publish()
+
+      return self._snapshot
+
+  '''
+  :return: the latest snapshot
+  '''
+  def snapshot(self):
+    return self._snapshot
+
+  '''
+  Publishes a snapshot of the match with the next version.
+
+  :return: the snapshot published
+  '''
+  def _publish(self):
+    self._snapshot = MatchSnapshot(
+      version=self._snapshot.version + 1,
+      data=self._match.to_bytes()
+    )
+    return self._snapshot
+
+class MatchSnapshot:
+  '''
+  Python class for objects that hold an immutable state of a shared match, as the match encoded by
+  tennis.codec. The match and its scoreline are decoded the first time they are accessed, and are
+  shared by every reader of the snapshot, so the match must not be modified. Snapshots are equal if
+  their matches are equal, whatever their versions.
+
+  :param int version: version of the snapshot
+  :param bytes data: the match encoded by tennis.codec
+  :var version: version of the snapshot
+  :var data: the match encoded by tennis.codec
+  '''
+  __slots__ = ('version', 'data', '_match', '_scoreline')
+
+  def __init__(self, *, version, data):
+    self.version = version
+    self.data = data
+    self._match = None
+    self._scoreline = None
+
+  '''
+  :return: the match, which is decoded the first time it is accessed
+  '''
+  @property
+  def match(self):
+    match = self._match
+    if match is None:
+      match = self._match = tennis.Match.from_bytes(data=self.data, trusted=True)
+
+    return match
+
+  '''
+  :return: the scoreline of the match, in the format of Match.scoreline
+  '''
+  @property
+  def scoreline(self):
+    scoreline = self._scoreline
+    if scoreline is None:
+      scoreline = self._scoreline = self.match.scoreline()
+
+    return scoreline
+
+  '''
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  '''
+  @property
+  def winner(self):
+    return self.match.winner
+
+  '''
+  :param object other: object to compare to the snapshot
+  :return: True if the input object is a snapshot of a match equal to the snapshot's match, whatever
+           the versions of the snapshots, and False otherwise
+  '''
+  def __eq__(self, other):
+    if self is other:
+      return True
+
+    return isinstance(other, type(self)) and self.match == other.match
+
+  '''
+  :return: a hash of the snapshot, which is equal for snapshots of equal matches
+  '''
+  def __hash__(self):
+    match = self.match
+    return hash((
+      match.match_format,
+      match.winner,
+      match.first_server_served_first,
+      match._game_winners()
+    ))
+
+  '''
+  :return: a string representation of the snapshot
+  '''
+  def __repr__(self):
+    return '{}(version={}, scoreline={!r})'.format(
+      type(self).__name__,
+      self.version,
+      self.scoreline
+    )
@@ -0,0 +1,157 @@
+'''
+Asynchronous scoring of a match from a feed of points, for services that run on an asyncio event
+loop. The feed is read by its own task into a bounded queue, so the points that arrive while the
+previous batch is being scored are played together and reported in one update.
+'''
+import asyncio
+import functools
+
+import tennis
+import tennis.events
+
+_END = object()
+
+_UNITS = (
+  tennis.events.GameWon,
+  tennis.events.Break,
+  tennis.events.TiebreakStarted,
+  tennis.events.SetWon,
+  tennis.events.MatchWon
+)
+
+class ScoreUpdate:
+  '''
+  Python class for objects that report a batch of points played in a match by stream.
+
+  :param int points: number of points played
+  :param str scoreline: scoreline of the match after the points, in the format of Match.scoreline
+  :param bool winner: True if the first server won the match, False if the first returner won the
+                      match, and None otherwise
+  :param list events: events other than PointWon that the match emitted for the points, in order
+  :var points: number of points played
+  :var scoreline: scoreline of the match after the points, in the format of Match.scoreline
+  :var winner: True if the first server won the match, False if the first returner won the match,
+               and None otherwise
+  :var events: events other than PointWon that the match emitted for the points, in order
+  '''
+  __slots__ = ('points', 'scoreline', 'winner', 'events')
+
+  def __init__(self, *, points, scoreline, winner, events):
+    self.points = points
+    self.scoreline = scoreline
+    self.winner = winner
+    self.events = events
+
+  '''
+  :return: a string representation of the update
+  '''
+  def __repr__(self):
+    return '{}(points={}, scoreline={!r}, winner={}, events={})'.format(
+      type(self).__name__,
+      self.points,
+      self.scoreline,
+      self.winner,
+      self.events
+    )
+
+'''
+Plays the points of a feed in a match as they arrive, yielding an update after each batch of points.
+A batch is every point that has arrived since the previous batch was played, up to max_batch points.
+Iteration ends when the feed ends. A point that arrives after the match is over raises RuntimeError,
+whether it is in the batch that ends the match or in a later one, after an update for the points
+that were played. Cancelling the task that iterates, or closing the iterator, cancels the task that
+reads the feed.
+
+:param Match match: match to play the points in
+:param feed: asynchronous iterable of a boolean for each point that is True if the first server won
+             the point, and False otherwise
+:param int max_batch: maximum number of points to read ahead of the match and to play per batch
+:return: an asynchronous iterator of a ScoreUpdate for each batch of points
+:raises RuntimeError: if the points continue after the match is over, after the update for the
+                      points played before it was over
+:raises Exception: any exception raised by the feed, including asyncio.CancelledError, after the
+                   points before it have been played
+'''
+async def stream(*, match, feed, max_batch=1024):
+  if max_batch < 1:
+    raise RuntimeError('max_batch must be at least 1.')
+
+  queue = asyncio.Queue(maxsize=max_batch)
+  reader = asyncio.get_running_loop().create_task(_read(feed, queue))
+  reader.add_done_callback(functools.partial(_cancelled, queue))
+  events = []
+  observer = events.append
+  match.subscribe(observer=observer, events=_UNITS)
+  try:
+    while True:
+      if queue.empty() and reader.cancelled():
+        batch = [asyncio.CancelledError()]
+      else:
+        batch = [await queue.get()]
+
+      while not queue.empty():
+        batch.append(queue.get_nowait())
+
+      end = batch[-1]
+      if end is _END or isinstance(end, BaseException):
+        batch.pop()
+      else:
+        end = None
+
+      played = 0
+      try:
+        for first_server in batch:
+          match.point(first_server=first_server)
+          played += 1
+      except RuntimeError as e:
+        if match.winner is None:
+          raise
+
+        end = e
+
+      if played:
+        yield ScoreUpdate(
+          points=played,
+          scoreline=match.scoreline(),
+          winner=match.winner,
+          events=events[:]
+        )
+        del events[:]
+
+      if end is _END:
+        return
+
+      if end is not None:
+        raise end
+  finally:
+    match.unsubscribe(observer=observer)
+    reader.cancel()
+    await asyncio.wait([reader])
+
+'''
+Puts asyncio.CancelledError in the queue of a reader that was cancelled, if the queue is empty, so
+that stream does not wait for a point that will not arrive. If the queue is not empty, stream finds
+that the reader was cancelled once it has played the points in the queue.
+
+:param asyncio.Queue queue: queue of the points
+:param asyncio.Task reader: task that read the feed into the queue
+'''
+def _cancelled(queue, reader):
+  if reader.cancelled() and queue.empty():
+    queue.put_nowait(asyncio.CancelledError())
+
+'''
+Reads a feed into a queue, followed by _END if the feed ends or by the exception it raised. If the
+feed raises asyncio.CancelledError, the reader is cancelled without putting anything in the queue.
+
+:param feed: asynchronous iterable of the points
+:param asyncio.Queue queue: queue to put the points in
+'''
+async def _read(feed, queue):
+  try:
+    async for first_server in feed:
+      await queue.put(first_server)
+  except Exception as e:
+    await queue.put(e)
+  else:
+    await queue.put(_END)
@@ -92,3 +92,5 @@ class Tiebreak:
   '''
   def __eq__(self, other):
     return isinstance(other, type(self)) and self.__dict__ == other.__dict__
+
+  __hash__ = None
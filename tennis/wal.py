@@ -0,0 +1,354 @@
+'''
+Write-ahead log of the points played in live matches, so that the matches can be rebuilt after the
+scoring process dies. The log is a single append-only file of records, each of which is its length
+as a varint, its body and the CRC-32 of its body. A body is a varint record type and the match id as
+a length-prefixed UTF-8 string, followed by a byte that is 1 if the first server won the point for a
+point, or by the match encoded by tennis.codec for a checkpoint. A record cut short by a crash, and
+anything after it, is discarded when the log is opened.
+'''
+import os
+import struct
+import threading
+import time
+import zlib
+
+import tennis
+import tennis.codec
+
+_POINT = 0
+_CHECKPOINT = 1
+_REMOVE = 2
+
+_CRC = struct.Struct('<I')
+
+class WriteAheadLog:
+  '''
+  Python class for objects that keep live matches in memory and log each point to a file once it has
+  been played, so a point that fails to be played is never logged. Opening an existing log rebuilds
+  its live matches from the latest checkpoint of each match plus the points logged after it, which
+  are played with Match.points. A checkpoint is logged when a match is added and every
+  checkpoint_points points after that, so recovery replays at most that many points per match.
+  Points are synced to disk every sync_points points, and if sync_seconds is not None, by a
+  background thread every sync_seconds seconds while there are records that have not been synced, so
+  a point logged with sync_seconds set is on disk within sync_seconds seconds plus the time a sync
+  takes, even if no other point is logged. If both are None, points are synced only by sync, compact
+  and close. The log must be closed to stop the background thread.
+
+  :param str path: path of the log, which is created if it does not exist
+  :param MatchFormat match_format: format of the matches started by their first point, or None for
+                                   the default format
+  :param int sync_points: number of points after which to sync the log, or None
+  :param float sync_seconds: maximum number of seconds for which a logged point may be left
+                             unsynced, or None
+  :param int checkpoint_points: number of points between consecutive checkpoints of a match
+  :var path: path of the log
+  :var match_format: format of the matches started by their first point
+  :var sync_points: number of points after which to sync the log, or None
+  :var sync_seconds: maximum number of seconds for which a logged point may be left unsynced, or
+                    None
+  :var checkpoint_points: number of points between consecutive checkpoints of a match
+  :var matches: dictionary that maps the id of each live match to the match
+  :var points: number of points logged since the log was opened
+  :var syncs: number of times the log was synced since it was opened
+  :var recovered_points: number of points replayed when the log was opened
+  :var recovery_seconds: number of seconds spent rebuilding the live matches when the log was opened
+  '''
+  def __init__(
+    self,
+    *,
+    path,
+    match_format=None,
+    sync_points=1,
+    sync_seconds=None,
+    checkpoint_points=64
+  ):
+    if checkpoint_points < 1:
+      raise RuntimeError('checkpoint_points must be at least 1.')
+
+    self.path = path
+    self.match_format = tennis.MatchFormat() if match_format is None else match_format
+    self.sync_points = sync_points
+    self.sync_seconds = sync_seconds
+    self.checkpoint_points = checkpoint_points
+    self.points = 0
+    self.syncs = 0
+    self._since_checkpoint = {}
+    self._unsynced = 0
+    self._dirty = False
+    self._synced_at = time.monotonic()
+    self._lock = threading.RLock()
+    self._closed = threading.Event()
+
+    start = time.perf_counter()
+    self.matches, self.recovered_points, length = self._recover()
+    self.recovery_seconds = time.perf_counter() - start
+
+    self._file = open(path, 'ab')
+    if self._file.tell() != length:
+      self._file.truncate(length)
+      self._sync()
+
+    self._syncer = None
+    if sync_seconds:
+      self._syncer = threading.Thread(target=self._sync_periodically, daemon=True)
+      self._syncer.start()
+
+  '''
+  Reads the log and rebuilds its live matches.
+
+  :return: a tuple of a dictionary that maps the id of each live match to the match, the number of
+           points replayed, and the length of the log up to the end of its last whole record
+  :raises RuntimeError: if a whole record is not well-formed
+  '''
+  def _recover(self):
+    try:
+      with open(self.path, 'rb') as file:
+        data = file.read()
+    except FileNotFoundError:
+      return {}, 0, 0
+
+    checkpoints = {}
+    suffixes = {}
+    index = 0
+    while True:
+      record = _record(data, index)
+      if record is None:
+        break
+
+      kind, match_id, body, index = record
+      if kind == _POINT:
+        suffix = suffixes.get(match_id)
+        if suffix is None:
+          raise RuntimeError('Points must be logged after a checkpoint of their match.')
+
+        suffix.append(body == b'\x01')
+      elif kind == _CHECKPOINT:
+        checkpoints[match_id] = body
+        suffixes[match_id] = []
+      elif kind == _REMOVE:
+        checkpoints.pop(match_id, None)
+        suffixes.pop(match_id, None)
+      else:
+        raise RuntimeError('Log records must be well-formed.')
+
+    matches = {}
+    points = 0
+    for match_id, checkpoint in checkpoints.items():
+      match = tennis.Match.from_bytes(data=checkpoint, trusted=True)
+      match.points(first_servers=suffixes[match_id])
+      matches[match_id] = match
+      points += len(suffixes[match_id])
+      self._since_checkpoint[match_id] = len(suffixes[match_id])
+
+    return matches, points, index
+
+  '''
+  Adds a live match and logs a checkpoint of it.
+
+  :param str match_id: id of the match
+  :param Match match: the match, or None for a new match with the log's format
+  :raises RuntimeError: if a live match has the same id
+  '''
+  def add(self, *, match_id, match=None):
+    if match_id in self.matches:
+      raise RuntimeError('Match ids must be unique among live matches.')
+
+    match = tennis.Match(match_format=self.match_format) if match is None else match
+    self._checkpoint(match_id, match)
+    self.matches[match_id] = match
+
+  '''
+  Plays a point in a live match and logs it, adding a new match with the log's format if no live
+  match has the id. The point is logged only if it is played without raising an error.
+
+  :param str match_id: id of the match
+  :param bool first_server: True if the first server won the point, and False otherwise
+  :return: True if the first server won the match, False if the first returner won the match, and
+           None otherwise
+  :raises RuntimeError: if the match is over
+  '''
+  def point(self, *, match_id, first_server):
+    match = self.matches.get(match_id)
+    if match is None:
+      self.add(match_id=match_id)
+      match = self.matches[match_id]
+    elif match.winner is not None:
+      raise RuntimeError('Points must not be played after the match is over.')
+
+    winner = match.point(first_server=first_server)
+    self._write(_POINT, match_id, b'\x01' if first_server else b'\x00')
+    self.points += 1
+    self._unsynced += 1
+    since_checkpoint = self._since_checkpoint[match_id] + 1
+    if since_checkpoint >= self.checkpoint_points:
+      self._checkpoint(match_id, match)
+    else:
+      self._since_checkpoint[match_id] = since_checkpoint
+
+    if self.sync_points is not None and self._unsynced >= self.sync_points or \
+      self.sync_seconds is not None and time.monotonic() - self._synced_at >= self.sync_seconds:
+      self._sync()
+
+    return winner
+
+  '''
+  Removes a match that is no longer live, so that it is not rebuilt when the log is opened.
+
+  :param str match_id: id of the match
+  :return: the match
+  :raises RuntimeError: if no live match has the id
+  '''
+  def remove(self, *, match_id):
+    if match_id not in self.matches:
+      raise RuntimeError('Match ids must be of live matches.')
+
+    self._write(_REMOVE, match_id, b'')
+    del self._since_checkpoint[match_id]
+    return self.matches.pop(match_id)
+
+  '''
+  Rewrites the log with only a checkpoint of each live match, replacing the log atomically.
+  '''
+  def compact(self):
+    with self._lock:
+      self._file.close()
+      temporary = self.path + '.compact'
+      with open(temporary, 'wb') as file:
+        self._file = file
+        for match_id, match in self.matches.items():
+          self._checkpoint(match_id, match)
+
+        file.flush()
+        os.fsync(file.fileno())
+
+      os.replace(temporary, self.path)
+      directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+      try:
+        os.fsync(directory)
+      finally:
+        os.close(directory)
+
+      self._file = open(self.path, 'ab')
+      self._unsynced = 0
+      self._dirty = False
+
+  '''
+  Writes the points logged so far to disk.
+  '''
+  def sync(self):
+    self._sync()
+
+  '''
+  Stops the background thread, and syncs and closes the log.
+  '''
+  def close(self):
+    self._closed.set()
+    if self._syncer is not None:
+      self._syncer.join()
+
+    self._sync()
+    self._file.close()
+
+  '''
+  :return: the log
+  '''
+  def __enter__(self):
+    return self
+
+  '''
+  Stops the background thread, and syncs and closes the log.
+  '''
+  def __exit__(self, *args):
+    self.close()
+
+  '''
+  :param str match_id: id of the match
+  :param Match match: match to log a checkpoint of
+  '''
+  def _checkpoint(self, match_id, match):
+    self._write(_CHECKPOINT, match_id, match.to_bytes())
+    self._since_checkpoint[match_id] = 0
+
+  '''
+  :param int kind: type of the record
+  :param str match_id: id of the match
+  :param bytes payload: the rest of the record's body
+  '''
+  def _write(self, kind, match_id, payload):
+    body = bytearray()
+    tennis.codec.write_varint(body, kind)
+    encoded = match_id.encode()
+    tennis.codec.write_varint(body, len(encoded))
+    body += encoded
+    body += payload
+    record = bytearray()
+    tennis.codec.write_varint(record, len(body))
+    record += body
+    record += _CRC.pack(zlib.crc32(body))
+    with self._lock:
+      self._file.write(record)
+      self._dirty = True
+
+  '''
+  Flushes the log and syncs it to disk.
+  '''
+  def _sync(self):
+    with self._lock:
+      self._file.flush()
+      os.fsync(self._file.fileno())
+      self.syncs += 1
+      self._unsynced = 0
+      self._dirty = False
+      self._synced_at = time.monotonic()
+
+  '''
+  Syncs the log every sync_seconds seconds while records have been written since the last sync,
+  until the log is closed.
+  '''
+  def _sync_periodically(self):
+    while not self._closed.wait(self.sync_seconds):
+      with self._lock:
+        if self._dirty:
+          self._sync()
+
+'''
+:param bytes data: contents of the log
+:param int index: index in the data of the start of a record
+:return: a tuple of the record's type, match id, payload and the index of the next record, or None
+         if there is no whole record with a valid checksum at the index
+'''
+def _record(data, index):
+  length = 0
+  shift = 0
+  while True:
+    if index >= len(data) or shift > 63:
+      return None
+
+    byte = data[index]
+    index += 1
+    length |= (byte & 0x7f) << shift
+    shift += 7
+    if byte < 0x80:
+      break
+
+  end = index + length
+  if end + _CRC.size > len(data) or \
+    _CRC.unpack_from(data, end)[0] != zlib.crc32(memoryview(data)[index:end]):
+    return None
+
+  if end - index >= 2 and data[index] < 0x80 and data[index + 1] < 0x80:
+    kind = data[index]
+    match_id_length = data[index + 1]
+    start = index + 2
+  else:
+    reader = tennis.codec.VarintReader(data[index:end])
+    try:
+      kind = reader.read()
+      match_id_length = reader.read()
+    except RuntimeError:
+      return None
+
+    start = index + reader.index
+
+  match_id = data[start:start + match_id_length].decode()
+  return kind, match_id, data[start + match_id_length:end], end + _CRC.size
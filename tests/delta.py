@@ -0,0 +1,129 @@
+import random
+import re
+import unittest
+
+import tennis
+
+class Delta(unittest.TestCase):
+  def test_encode(self):
+    match = tennis.Match()
+    encoder = tennis.DeltaEncoder()
+
+    self.assertEqual(encoder.encode(match=match), b'\x01' + match.to_bytes())
+    match.point(first_server=True)
+    self.assertEqual(encoder.encode(match=match), b'\x00\x01\x00')
+    self.assertEqual(encoder.encode(match=match), b'\x00\x01\x00')
+    match.points(first_servers=[True] * 3)
+    self.assertEqual(encoder.encode(match=match), b'\x02\x04\x00\x00\x00')
+    match.points(first_servers=[True] * 40)
+    self.assertEqual(encoder.encode(match=match)[:1], b'\x14')
+    match.points(first_servers=[True] * 4)
+    self.assertEqual(encoder.encode(match=match), b'\x02\x00\x04')
+    self.assertEqual(encoder.encode(match=match), b'\x00')
+    self.assertEqual(encoder.states, 7)
+    self.assertEqual(encoder.keyframes, 1)
+
+  def test_keyframes(self):
+    match = tennis.Match(record_points=True)
+    encoder = tennis.DeltaEncoder(keyframe_interval=3)
+
+    for i in range(7):
+      match.point(first_server=True)
+      self.assertEqual(encoder.encode(match=match)[:1] == b'\x01', i % 3 == 0)
+
+    self.assertEqual(encoder.encode(match=match, keyframe=True)[:1], b'\x01')
+    match.correct_point(index=6)
+    self.assertEqual(encoder.encode(match=match)[:1], b'\x01')
+    self.assertEqual(encoder.keyframes, 5)
+
+    match = tennis.Match(history=False)
+    encoder = tennis.DeltaEncoder()
+    encoder.encode(match=match)
+    match.points(first_servers=[True] * 3)
+    self.assertEqual(encoder.encode(match=match)[:1], b'\x00')
+    match.point(first_server=True)
+    self.assertEqual(encoder.encode(match=match)[:1], b'\x01')
+
+  def test_decode(self):
+    generator = random.Random(0)
+    for match_format in (tennis.MatchFormat(), tennis.MatchFormat.MATCH_TIEBREAK):
+      for i in range(20):
+        match = tennis.Match(match_format=match_format)
+        encoder = tennis.DeltaEncoder(keyframe_interval=50)
+        decoder = tennis.DeltaDecoder()
+        while match.winner is None:
+          for j in range(generator.choice((1, 1, 3))):
+            if match.winner is None:
+              match.point(first_server=generator.random() < 0.5)
+
+          self.assertEqual(decoder.decode(data=encoder.encode(match=match)), match)
+
+        self.assertIs(decoder.match.match_format, match_format)
+
+  def test_correct_point(self):
+    match = tennis.Match(record_points=True)
+    encoder = tennis.DeltaEncoder()
+    decoder = tennis.DeltaDecoder()
+    decoder.decode(data=encoder.encode(match=match))
+    match.points(first_servers=[True, False, True, True, True, False])
+    decoder.decode(data=encoder.encode(match=match))
+    match.correct_point(index=1)
+
+    data = encoder.encode(match=match)
+    self.assertEqual(data[:1], b'\x01')
+    self.assertEqual(decoder.decode(data=data), match)
+    self.assertEqual(
+      decoder.match.sets[0].games[0],
+      tennis.Game(server_points=4, returner_points=0)
+    )
+
+    generator = random.Random(0)
+    match = tennis.Match(record_points=True)
+    encoder = tennis.DeltaEncoder()
+    decoder = tennis.DeltaDecoder()
+    while match.winner is None:
+      if match.point_log and generator.random() < 0.1:
+        match.correct_point(index=generator.randrange(len(match.point_log)))
+      else:
+        match.point(first_server=generator.random() < 0.6)
+
+      decoder.decode(data=encoder.encode(match=match))
+      self.assertEqual(decoder.match.sets, match.sets)
+
+  def test_decode_events(self):
+    match = tennis.Match.from_scoreline(scoreline='6-5 0-40')
+    encoder = tennis.DeltaEncoder()
+    decoder = tennis.DeltaDecoder()
+    decoder.decode(data=encoder.encode(match=match))
+    events = []
+    decoder.match.subscribe(
+      observer=events.append,
+      events=[tennis.events.GameWon, tennis.events.TiebreakStarted]
+    )
+    match.point(first_server=False)
+    decoder.decode(data=encoder.encode(match=match))
+
+    self.assertEqual(decoder.match, match)
+    self.assertEqual(events, [
+      tennis.events.GameWon(set_index=0, game_index=11, first_server=False),
+      tennis.events.TiebreakStarted(set_index=0, game_index=12, first_server=True)
+    ])
+
+  def test_errors(self):
+    decoder = tennis.DeltaDecoder()
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('A keyframe must be decoded before deltas.'))
+    ):
+      decoder.decode(data=b'\x00\x01\x00')
+
+    decoder.decode(data=tennis.DeltaEncoder().encode(match=tennis.Match()))
+    for data in (b'', b'\x03', b'\x00\x04\x00', b'\x02\x01\x00\x00\x00', b'\x00\x01\x00\x00'):
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Delta must be well-formed.'))
+      ):
+        decoder.decode(data=data)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -130,5 +130,9 @@ class Game(unittest.TestCase):
       tennis.Game(server_points=2, returner_points=1)
     )
 
+  def test_hash(self):
+    with self.assertRaisesRegex(TypeError, '^unhashable type: \'Game\'$'):
+      hash(tennis.Game())
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,82 @@
+import io
+import re
+import unittest
+
+import tennis
+
+_SET = ';'.join(['SSSS'] * 12) + ';S/RR/SS/RR'
+
+class PointReader(unittest.TestCase):
+  def test_init_no_args(self):
+    reader = tennis.PointReader(file=io.StringIO())
+
+    self.assertIs(reader.match_format, tennis.MatchFormat())
+    self.assertEqual(reader.column, 'pbp')
+    self.assertIsNone(reader.errors)
+    self.assertEqual(list(reader), [])
+    self.assertEqual(reader.rows, 0)
+
+  def test_iter(self):
+    reader = tennis.PointReader(file=io.StringIO(
+      'pbp_id,pbp\n'
+      '1,{}.{}\n'
+      '2,AAAA;DDDD;S\n'
+      '3,\n'.format(_SET, _SET)
+    ))
+    rows = [(row['pbp_id'], match.scoreline()) for row, match in reader]
+
+    self.assertEqual(rows, [('1', '7-6(0) 6-7(0) 0-0'), ('2', '2-0 15-0'), ('3', '0-0')])
+    self.assertEqual(reader.rows, 3)
+    self.assertEqual(reader.matches, 3)
+    self.assertEqual(reader.points, 2 * 55 + 9)
+    self.assertEqual(reader.bad_rows, 0)
+    self.assertGreater(reader.elapsed(), 0)
+    self.assertGreater(reader.rows_per_second(), 0)
+    self.assertGreater(reader.points_per_second(), 0)
+
+  def test_iter_match_format(self):
+    reader = tennis.PointReader(
+      file=io.StringIO('points\n' + ';'.join(['SSSS'] * 6) + ';S/RR/SS\n'),
+      match_format=tennis.MatchFormat.FAST4,
+      column='points'
+    )
+
+    self.assertEqual([match.scoreline() for row, match in reader], ['4-3(0) 0-0'])
+
+  def test_iter_bad_rows(self):
+    errors = []
+    reader = tennis.PointReader(file=io.StringIO(
+      'pbp\n'
+      'SSSS;RRR;\n'
+      'SSSS.RRRR\n'
+      'SSSX\n'
+      'S/S\n'
+      'SSSSRRRR\n'
+      '{}.{}.{}.\n'
+      'SSSS\n'.format(_SET, _SET, _SET)
+    ), errors=errors)
+
+    self.assertEqual([match.scoreline() for row, match in reader], ['1-0'])
+    self.assertEqual(errors, [
+      (2, 'Line 2, character 9: \';\' must only follow the last point of a game.'),
+      (3, 'Line 3, character 5: \'.\' must only follow the last point of a set.'),
+      (4, 'Line 4, character 4: Points must be S, A, R or D, not \'X\'.'),
+      (5, 'Line 5, character 2: \'/\' must only be played within a tiebreak.'),
+      (6, 'Line 6, character 5: Games must be followed by a separator.'),
+      (7, 'Line 7, character 213: \'.\' must only follow the last point of a set.')
+    ])
+    self.assertEqual(reader.rows, 7)
+    self.assertEqual(reader.matches, 1)
+    self.assertEqual(reader.bad_rows, 6)
+
+  def test_iter_raise(self):
+    reader = tennis.PointReader(file=io.StringIO('pbp\nSSSS\nSSSS;RRRR;SR?\n'))
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Line 3, character 13: Points must be S, A, R or D, not \'?\'.'))
+    ):
+      list(reader)
+
+if __name__ == '__main__':
+  unittest.main()
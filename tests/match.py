@@ -1,3 +1,5 @@
+import io
+import pickle
 import re
 import unittest
 
@@ -26,6 +28,7 @@ class Match(unittest.TestCase):
     self.assertFalse(match.final_set_deciding_point)
     self.assertEqual(match.final_set_tiebreak_games, 6)
     self.assertEqual(match.final_set_tiebreak_points, 7)
+    self.assertTrue(match.history)
 
   def test_init_args(self):
     with self.assertRaisesRegex(
@@ -45,7 +48,8 @@ class Match(unittest.TestCase):
       deciding_point=True,
       target_games=6,
       target_sets=7,
-      sets=[tennis.Set()]
+      sets=[tennis.Set()],
+      trusted=True
     )
 
     self.assertEqual(match.sets, [tennis.Set()])
@@ -134,6 +138,89 @@ class Match(unittest.TestCase):
     ):
       tennis.Match(target_sets=0)
 
+  def test_init_invalid_sets(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Matches must have at least one set.'))
+    ):
+      tennis.Match(sets=[])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape(
+        'The last set of a match must be unfinished unless the match is over.'
+      ))
+    ):
+      tennis.Match(
+        sets=[tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)],
+        tiebreak_games=0
+      )
+
+    self.assertTrue(tennis.Match(
+      sets=[tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)],
+      target_sets=1,
+      final_set_tiebreak_games=0
+    ).winner)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Only the last set of a match may be unfinished.'))
+    ):
+      tennis.Match(sets=[tennis.Set(), tennis.Set()])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Sets must not be played after the match is over.'))
+    ):
+      tennis.Match(
+        sets=[
+          tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
+          tennis.Set(tiebreak_games=0)
+        ],
+        target_sets=1,
+        final_set_tiebreak_games=0
+      )
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Sets must have the match\'s format.'))
+    ):
+      tennis.Match(sets=[tennis.Set(target_games=4)])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Sets must have the match\'s format.'))
+    ):
+      tennis.Match(sets=[tennis.Set()], target_sets=1, final_set_tiebreak_games=8)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Sets must have the match\'s format.'))
+    ):
+      tennis.Match(
+        sets=[
+          tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
+          tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
+          tennis.Set(tiebreak_games=0)
+        ],
+        tiebreak_games=0
+      )
+
+    match = tennis.Match(
+      sets=[
+        tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
+        tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
+        tennis.Set(games=[tennis.Game(returner_points=3)], target_games=3)
+      ],
+      tiebreak_games=0,
+      final_set_target_games=3
+    )
+    self.assertEqual(match.first_server_sets(), 1)
+    self.assertEqual(match.first_returner_sets(), 1)
+
+    match = tennis.Match(sets=[tennis.Set(), tennis.Set()], trusted=True)
+    self.assertEqual(match.sets, [tennis.Set(), tennis.Set()])
+
   def test_init_first_set(self):
     match = tennis.Match(
       sets=None,
@@ -203,18 +290,18 @@ class Match(unittest.TestCase):
     self.assertEqual(match.final_set_tiebreak_points, 7)
 
   def test_first_server_served_first(self):
-    match = tennis.Match(sets=[
+    match = tennis.Match(trusted=True, sets=[
       tennis.Set(games=[tennis.Game()]),
-      tennis.Set(games=[tennis.Game()] * 2),
-      tennis.Set(games=[tennis.Game()] * 3),
-      tennis.Set(games=[tennis.Game()] * 4)
+      tennis.Set(games=[tennis.Game()] * 2, trusted=True),
+      tennis.Set(games=[tennis.Game()] * 3, trusted=True),
+      tennis.Set(games=[tennis.Game()] * 4, trusted=True)
     ])
 
     self.assertEqual(list(match.first_server_served_first), [True, False, False, True])
 
   def test_sets(self):
     sets = []
-    match = tennis.Match(sets=sets)
+    match = tennis.Match(sets=sets, trusted=True)
 
     self.assertEqual(match.first_server_sets(), 0)
     self.assertEqual(match.first_returner_sets(), 0)
@@ -223,7 +310,7 @@ class Match(unittest.TestCase):
       games=[tennis.Game(server_points=4), tennis.Game(returner_points=4)],
       target_games=2
     ))
-    match = tennis.Match(sets=sets)
+    match = tennis.Match(sets=sets, trusted=True)
 
     self.assertEqual(match.first_server_sets(), 1)
     self.assertEqual(match.first_returner_sets(), 0)
@@ -232,7 +319,7 @@ class Match(unittest.TestCase):
       games=[tennis.Tiebreak(first_returner_points=7)],
       tiebreak_games=0
     ))
-    match = tennis.Match(sets=sets)
+    match = tennis.Match(sets=sets, trusted=True)
 
     self.assertEqual(match.first_server_sets(), 1)
     self.assertEqual(match.first_returner_sets(), 1)
@@ -241,7 +328,7 @@ class Match(unittest.TestCase):
       games=[tennis.Game(server_points=4), tennis.Game(returner_points=4)],
       target_games=2
     ))
-    match = tennis.Match(sets=sets)
+    match = tennis.Match(sets=sets, trusted=True)
 
     self.assertEqual(match.first_server_sets(), 1)
     self.assertEqual(match.first_returner_sets(), 2)
@@ -250,49 +337,51 @@ class Match(unittest.TestCase):
       games=[tennis.Tiebreak(first_returner_points=7)],
       tiebreak_games=0
     ))
-    match = tennis.Match(sets=sets)
+    match = tennis.Match(sets=sets, trusted=True)
 
     self.assertEqual(match.first_server_sets(), 2)
     self.assertEqual(match.first_returner_sets(), 2)
 
     sets.append(tennis.Set())
-    match = tennis.Match(sets=sets)
+    match = tennis.Match(sets=sets, trusted=True)
 
     self.assertEqual(match.first_server_sets(), 2)
     self.assertEqual(match.first_returner_sets(), 2)
 
     sets.append(tennis.Set())
-    match = tennis.Match(sets=sets)
+    match = tennis.Match(sets=sets, trusted=True)
 
     self.assertEqual(match.first_server_sets(), 2)
     self.assertEqual(match.first_returner_sets(), 2)
 
   def test_winner(self):
-    self.assertIsNone(tennis.Match(sets=[]).winner)
-    self.assertIsNone(tennis.Match(sets=[
+    self.assertIsNone(tennis.Match(sets=[], trusted=True).winner)
+    self.assertIsNone(tennis.Match(trusted=True, sets=[
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)
     ]).winner)
-    self.assertIsNone(tennis.Match(sets=[
+    self.assertIsNone(tennis.Match(trusted=True, sets=[
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)
     ]).winner)
-    self.assertTrue(tennis.Match(sets=[
+    self.assertTrue(tennis.Match(trusted=True, sets=[
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)
     ]).winner)
-    self.assertFalse(tennis.Match(sets=[
+    self.assertFalse(tennis.Match(trusted=True, sets=[
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
       tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0),
       tennis.Set(games=[tennis.Tiebreak(first_returner_points=7)], tiebreak_games=0)
     ]).winner)
     self.assertTrue(tennis.Match(
       sets=[tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)],
-      target_sets=1
+      target_sets=1,
+      trusted=True
     ).winner)
     self.assertFalse(tennis.Match(
       sets=[tennis.Set(games=[tennis.Tiebreak(first_returner_points=7)], tiebreak_games=0)],
-      target_sets=1
+      target_sets=1,
+      trusted=True
     ).winner)
 
   def test_first_server_to_serve(self):
@@ -303,7 +392,8 @@ class Match(unittest.TestCase):
       tennis.Match(
         sets=[tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)],
         target_sets=1,
-        tiebreak_games=0
+        tiebreak_games=0,
+        trusted=True
       ).first_server_to_serve()
 
     self.assertTrue(
@@ -345,7 +435,8 @@ class Match(unittest.TestCase):
       tennis.Match(
         sets=[tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)],
         target_sets=1,
-        tiebreak_games=0
+        tiebreak_games=0,
+        trusted=True
       ).point(first_server=True)
 
     match = tennis.Match(tiebreak_games=0, tiebreak_points=2)
@@ -430,7 +521,8 @@ class Match(unittest.TestCase):
       )],
       target_sets=1,
       tiebreak_games=0,
-      tiebreak_points=2
+      tiebreak_points=2,
+      trusted=True
     )
     self.assertTrue(match.point(first_server=True))
     self.assertEqual(
@@ -443,7 +535,8 @@ class Match(unittest.TestCase):
         )],
         target_sets=1,
         tiebreak_games=0,
-        tiebreak_points=2
+        tiebreak_points=2,
+        trusted=True
       )
     )
     match = tennis.Match(
@@ -579,7 +672,8 @@ class Match(unittest.TestCase):
       )],
       target_sets=1,
       tiebreak_games=0,
-      tiebreak_points=2
+      tiebreak_points=2,
+      trusted=True
     )
     self.assertFalse(match.point(first_server=False))
     self.assertEqual(
@@ -592,7 +686,8 @@ class Match(unittest.TestCase):
         )],
         target_sets=1,
         tiebreak_games=0,
-        tiebreak_points=2
+        tiebreak_points=2,
+        trusted=True
       )
     )
     match = tennis.Match(
@@ -647,6 +742,292 @@ class Match(unittest.TestCase):
       )
     )
 
+  def test_points(self):
+    match = tennis.Match(tiebreak_games=0, tiebreak_points=2)
+    self.assertIsNone(match.points(first_servers=[]))
+    self.assertIsNone(match.points(first_servers=[True, True, True]))
+    self.assertEqual(
+      match,
+      tennis.Match(
+        sets=[
+          tennis.Set(
+            games=[tennis.Tiebreak(first_server_points=2, target_points=2)],
+            tiebreak_games=0,
+            tiebreak_points=2
+          ),
+          tennis.Set(
+            games=[tennis.Tiebreak(first_returner_points=1, target_points=2)],
+            tiebreak_games=0,
+            tiebreak_points=2
+          )
+        ],
+        tiebreak_games=0,
+        tiebreak_points=2
+      )
+    )
+    self.assertTrue(match.points(first_servers=iter([True])))
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      match.points(first_servers=[True])
+
+  def test_record_points(self):
+    self.assertIsNone(tennis.Match().point_log)
+
+    match = tennis.Match(record_points=True)
+    self.assertEqual(match.point_log, [])
+
+    match.points(first_servers=[True, False, True])
+    self.assertEqual(match.point_log, [True, False, True])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      tennis.Match(
+        sets=[tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0)],
+        target_sets=1,
+        record_points=True,
+        trusted=True
+      ).point(first_server=True)
+
+  def test_correct_point(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot correct a point because points are not being recorded.'))
+    ):
+      tennis.Match().correct_point(index=0)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Point index must be in the point log.'))
+    ):
+      tennis.Match(record_points=True).correct_point(index=0)
+
+    first_servers = [True] * 4 + [False] * 4 + [True] * 4 + [False] * 4 + [True] * 9
+    match = tennis.Match(
+      target_games=2,
+      tiebreak_games=None,
+      tiebreak_points=None,
+      record_points=True
+    )
+    match.points(first_servers=first_servers)
+    self.assertEqual(
+      match.correct_point(index=4),
+      ([(0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (1, 0), (1, 1), (1, 2)], [])
+    )
+
+    first_servers[4] = True
+    expected = tennis.Match(
+      target_games=2,
+      tiebreak_games=None,
+      tiebreak_points=None,
+      record_points=True
+    )
+    expected.points(first_servers=first_servers)
+    self.assertEqual(match, expected)
+
+    match = tennis.Match(
+      target_sets=1,
+      final_set_target_games=2,
+      final_set_tiebreak_games=None,
+      final_set_tiebreak_points=None,
+      record_points=True
+    )
+    self.assertTrue(match.points(first_servers=[True] * 4 + [False] * 4 + [True] * 8))
+    self.assertEqual(match.correct_point(index=12), ([(0, 3)], [0]))
+    self.assertIsNone(match.winner)
+    self.assertEqual(match.sets[0].games[3], tennis.Game(server_points=1, returner_points=3))
+
+    match = tennis.Match(
+      target_sets=1,
+      final_set_target_games=1,
+      final_set_tiebreak_games=None,
+      final_set_tiebreak_points=None,
+      record_points=True
+    )
+    self.assertTrue(match.points(first_servers=[False] + [True] * 8))
+    self.assertEqual(match.correct_point(index=0), ([], []))
+    self.assertEqual(match.point_log, [True] * 8)
+    self.assertTrue(match.winner)
+
+  def test_history(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Points cannot be recorded if history is not being kept.'))
+    ):
+      tennis.Match(record_points=True, history=False)
+
+    match = tennis.Match(target_sets=2, tiebreak_games=0, tiebreak_points=2, history=False)
+    self.assertFalse(match.history)
+    self.assertFalse(match.sets[0].history)
+
+    self.assertIsNone(match.points(first_servers=[True, True]))
+    self.assertEqual(
+      match.sets,
+      [tennis.Set(
+        games=[tennis.Tiebreak(target_points=2)],
+        tiebreak_games=0,
+        tiebreak_points=2,
+        history=False
+      )]
+    )
+    self.assertEqual(match.first_server_served_first, (False,))
+    self.assertEqual(match.first_server_sets(), 1)
+    self.assertEqual(match.first_returner_sets(), 0)
+    self.assertFalse(match.first_server_to_serve())
+
+    self.assertIsNone(match.points(first_servers=[False, False]))
+    self.assertEqual(match.first_server_served_first, (True,))
+    self.assertEqual(match.first_server_sets(), 1)
+    self.assertEqual(match.first_returner_sets(), 1)
+    self.assertEqual(len(match.sets), 1)
+    self.assertEqual(
+      match.sets[0],
+      tennis.Set(
+        games=[tennis.Game()],
+        target_games=6,
+        deciding_point=False,
+        tiebreak_games=6,
+        tiebreak_points=7,
+        history=False
+      )
+    )
+
+    full = tennis.Match(target_sets=2, tiebreak_games=0, tiebreak_points=2)
+    full.points(first_servers=[True, True, False, False])
+    i = 0
+    while match.winner is None:
+      first_server = bool(i % 3)
+      i += 1
+      self.assertEqual(full.first_server_to_serve(), match.first_server_to_serve())
+      self.assertEqual(
+        full.point(first_server=first_server),
+        match.point(first_server=first_server)
+      )
+
+    self.assertEqual(match.winner, full.winner)
+    self.assertEqual(match.first_server_sets(), full.first_server_sets())
+    self.assertEqual(match.first_returner_sets(), full.first_returner_sets())
+    self.assertEqual(len(match.sets), 1)
+    self.assertEqual(len(match.sets[0].games), 1)
+
+  def test_from_scoreline(self):
+    self.assertEqual(tennis.Match.from_scoreline(scoreline=''), tennis.Match())
+    self.assertEqual(
+      tennis.Match.from_scoreline(scoreline='0-0', target_sets=3),
+      tennis.Match(target_sets=3)
+    )
+
+    match = tennis.Match.from_scoreline(scoreline='6-4 3-6 7-6(5) 2-1 30-15', target_sets=3)
+    self.assertEqual(match.target_sets, 3)
+    self.assertEqual(match.first_server_served_first, (True, True, False, True))
+    self.assertEqual(
+      [(s.first_server_games(), s.first_returner_games()) for s in match.sets],
+      [(6, 4), (3, 6), (6, 7), (2, 1)]
+    )
+    self.assertEqual([s.winner for s in match.sets], [True, False, False, None])
+    self.assertEqual(
+      match.sets[2].games[-1],
+      tennis.Tiebreak(first_server_points=5, first_returner_points=7)
+    )
+    self.assertEqual(match.sets[3].games[-1], tennis.Game(server_points=1, returner_points=2))
+    self.assertEqual(match.first_server_sets(), 2)
+    self.assertEqual(match.first_returner_sets(), 1)
+    self.assertFalse(match.first_server_to_serve())
+    self.assertIsNone(match.winner)
+
+    match = tennis.Match.from_scoreline(
+      scoreline='6-4 3-6 7-6(5) 2-1 30-15',
+      target_sets=3,
+      history=False
+    )
+    self.assertEqual(match.scoreline(), '[2-1] 2-1 30-15')
+    self.assertEqual(len(match.sets), 1)
+    self.assertEqual(match.sets[0].games, [tennis.Game(server_points=1, returner_points=2)])
+    self.assertEqual((match.first_server_sets(), match.first_returner_sets()), (2, 1))
+    self.assertEqual(
+      (match.sets[0].first_server_games(), match.sets[0].first_returner_games()),
+      (2, 1)
+    )
+    self.assertFalse(match.first_server_to_serve())
+
+    other = tennis.Match(history=False)
+    other.points(first_servers=[True] * 28)
+    self.assertEqual(tennis.Match.from_scoreline(scoreline='6-0 1-0', history=False), other)
+    other.points(first_servers=[True] * 20)
+    self.assertEqual(tennis.Match.from_scoreline(scoreline='6-0 6-0', history=False), other)
+
+    match = tennis.Match.from_scoreline(scoreline='6-4 7-6(12)')
+    self.assertTrue(match.winner)
+    self.assertEqual(
+      match.sets[1].games[-1],
+      tennis.Tiebreak(first_server_points=14, first_returner_points=12)
+    )
+
+    match = tennis.Match.from_scoreline(scoreline='4-6 6-6 2-3')
+    self.assertEqual(
+      match.sets[1].games[-1],
+      tennis.Tiebreak(first_server_points=2, first_returner_points=3)
+    )
+    self.assertFalse(match.first_server_to_serve())
+
+    match = tennis.Match.from_scoreline(scoreline='6-4 0-0 40-AD')
+    self.assertEqual(len(match.sets), 2)
+    self.assertEqual(match.sets[1].games, [tennis.Game(server_points=3, returner_points=4)])
+
+    match = tennis.Match.from_scoreline(
+      scoreline='6-3 3-6 8-6',
+      target_sets=2,
+      final_set_tiebreak_games=0,
+      final_set_tiebreak_points=10
+    )
+    self.assertEqual(
+      match.sets[2].games,
+      [tennis.Tiebreak(first_server_points=8, first_returner_points=6, target_points=10)]
+    )
+    self.assertIsNone(match.winner)
+
+    for scoreline in ('6-4 6-4 1-0', '6-4 2-1 30-15 0-0', '6-3 3-6 8-6 0-0'):
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Set scores must be reachable.'))
+      ):
+        tennis.Match.from_scoreline(
+          scoreline=scoreline,
+          final_set_tiebreak_games=0,
+          final_set_tiebreak_points=10
+        )
+
+    for scoreline in ('8-2', '6-0 7-0'):
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Game scores must be reachable.'))
+      ):
+        tennis.Match.from_scoreline(scoreline=scoreline, tiebreak_games=None, tiebreak_points=None)
+
+    for scoreline in ('6-4 2-1 AD-15', '6-4 6-6 7-3'):
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Point scores must be reachable.'))
+      ):
+        tennis.Match.from_scoreline(scoreline=scoreline)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Point score must be reachable.'))
+    ):
+      tennis.Match.from_scoreline(scoreline='6-4 6-6 9-3')
+
+    for scoreline in ('x', '6-4(3)', '6-6(5)', '6-4 2-1 40-40-0', '6-4 2-1 AD-AD', '6-4 6-6 AD-0'):
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Scoreline must be well-formed.'))
+      ):
+        tennis.Match.from_scoreline(scoreline=scoreline)
+
   def test_str(self):
     self.assertEqual(
       str(tennis.Match(
@@ -707,14 +1088,8 @@ class Match(unittest.TestCase):
         final_set_tiebreak_games=8,
         final_set_tiebreak_points=9
       )),
-      'Match('
-        'sets=[Set('
-          'games=[Game(server_points=1, returner_points=2, deciding_point=True)], '
-          'target_games=3, '
-          'deciding_point=True, '
-          'tiebreak_games=4, '
-          'tiebreak_points=5'
-        ')], '
+      'Match.from_scoreline('
+        'scoreline=\'0-0 15-30\', '
         'target_sets=6, '
         'target_games=3, '
         'deciding_point=True, '
@@ -727,6 +1102,56 @@ class Match(unittest.TestCase):
       ')'
     )
 
+    match = tennis.Match.from_scoreline(scoreline='6-4 3-6 7-6(5) 2-1 30-15', target_sets=3)
+    self.assertEqual(eval(repr(match), {'Match': tennis.Match}), match)
+
+    match = tennis.Match(target_sets=3, history=False)
+    match.points(first_servers=[True] * 24 + [False] * 24 + [True] * 5)
+    self.assertTrue(repr(match).startswith('Match.from_bytes(data=b\''))
+    self.assertEqual(eval(repr(match), {'Match': tennis.Match}), match)
+
+  def test_scoreline(self):
+    self.assertEqual(tennis.Match().scoreline(), '0-0')
+    self.assertEqual(tennis.Match(sets=[], trusted=True).scoreline(), '')
+
+    match = tennis.Match(target_sets=3, history=False)
+    match.points(first_servers=[True] * 24 + [False] * 24 + [True] * 5)
+    self.assertEqual(match.scoreline(), '[1-1] 1-0 15-0')
+
+    for scoreline in (
+      '6-4 3-6 7-6(5) 2-1 30-15',
+      '4-6 6-6 2-3',
+      '6-4 0-0 40-AD',
+      '6-4 0-0 AD-40',
+      '6-4 0-0 40-40',
+      '7-6(12) 6-7(3) 0-6 0-0',
+      '6-3 3-6 6-3 3-6 8-6'
+    ):
+      self.assertEqual(
+        tennis.Match.from_scoreline(
+          scoreline=scoreline,
+          target_sets=3,
+          final_set_tiebreak_games=0,
+          final_set_tiebreak_points=10
+        ).scoreline(),
+        scoreline
+      )
+
+    match = tennis.Match()
+    match.points(first_servers=[True] * 3 + [False] * 4)
+    self.assertEqual(match.scoreline(), '0-0 40-AD')
+    match.points(first_servers=[True, True])
+    self.assertEqual(match.scoreline(), '0-0 AD-40')
+    match.point(first_server=True)
+    self.assertEqual(match.scoreline(), '1-0')
+
+  def test_write(self):
+    match = tennis.Match.from_scoreline(scoreline='6-4 3-6 7-6(5) 2-1 30-15', target_sets=3)
+    output = io.StringIO()
+    match.write(file=output)
+
+    self.assertEqual(output.getvalue(), str(match))
+
   def test_eq(self):
     self.assertEqual(
       tennis.Match(
@@ -766,7 +1191,7 @@ class Match(unittest.TestCase):
         final_set_tiebreak_points=8
       )
     )
-    self.assertNotEqual(tennis.Match(sets=None), tennis.Match(sets=[]))
+    self.assertNotEqual(tennis.Match(sets=None), tennis.Match(sets=[], trusted=True))
     self.assertNotEqual(tennis.Match(target_sets=1), tennis.Match(target_sets=2))
     self.assertNotEqual(tennis.Match(target_games=3), tennis.Match(target_games=4))
     self.assertNotEqual(tennis.Match(deciding_point=True), tennis.Match(deciding_point=False))
@@ -789,5 +1214,221 @@ class Match(unittest.TestCase):
       tennis.Match(final_set_tiebreak_points=14)
     )
 
+  def test_eq_same_aggregates(self):
+    match = tennis.Match()
+    match.points(first_servers=[True] * 4)
+    other = tennis.Match()
+    other.points(first_servers=[True, False, True, True, True])
+
+    self.assertEqual(match.first_server_served_first, other.first_server_served_first)
+    self.assertNotEqual(match, other)
+
+    other = tennis.Match()
+    other.points(first_servers=[True] * 4)
+    self.assertEqual(match, other)
+    self.assertEqual(match, match)
+    self.assertNotEqual(match, match.sets)
+
+  def test_hash(self):
+    match = tennis.Match()
+    match.points(first_servers=[True] * 5)
+    other = tennis.Match()
+    other.points(first_servers=[True] * 5)
+
+    with self.assertRaisesRegex(TypeError, '^unhashable type: \'Match\'$'):
+      hash(match)
+
+    self.assertEqual({match.to_bytes(): 1}[other.to_bytes()], 1)
+    self.assertEqual(len({match.to_bytes(), other.to_bytes(), tennis.Match().to_bytes()}), 2)
+    self.assertEqual(len({match.match_format, tennis.MatchFormat(), tennis.MatchFormat.FAST4}), 2)
+
+  def test_to_bytes(self):
+    match = tennis.Match(target_sets=3, tiebreak_games=None, tiebreak_points=None)
+    match.points(first_servers=[True, False, False, True] * 60)
+    data = match.to_bytes()
+
+    self.assertEqual(tennis.Match.from_bytes(data=data), match)
+    self.assertEqual(tennis.Match.from_bytes(data=data, trusted=True), match)
+
+    for data in (b'', data[:-1], data + b'\x00', b'\x02' + data[1:]):
+      with self.assertRaisesRegex(RuntimeError, '^Encoded match must be well-formed.$'):
+        tennis.Match.from_bytes(data=data)
+
+    with self.assertRaisesRegex(RuntimeError, '^Point scores must be reachable.$'):
+      tennis.Match.from_bytes(data=tennis.Match(trusted=True, sets=[
+        tennis.Set(trusted=True, games=[tennis.Game(server_points=9, returner_points=0)])
+      ]).to_bytes())
+
+    with self.assertRaisesRegex(RuntimeError, '^Only the last set of a match may be unfinished.$'):
+      tennis.Match.from_bytes(data=tennis.Match(trusted=True, sets=[
+        tennis.Set(),
+        tennis.Set()
+      ]).to_bytes())
+
+    with self.assertRaisesRegex(RuntimeError, '^Matches must have at least one set.$'):
+      tennis.Match.from_bytes(data=tennis.Match(sets=[], trusted=True).to_bytes())
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^The last game of a set must be unfinished unless the set is over.$'
+    ):
+      tennis.Match.from_bytes(data=tennis.Match(trusted=True, sets=[
+        tennis.Set(trusted=True, games=[tennis.Game(server_points=4)])
+      ]).to_bytes())
+
+    with self.assertRaisesRegex(RuntimeError, '^Games must not be played after the set is over.$'):
+      tennis.Match.from_bytes(data=tennis.Match(trusted=True, sets=[
+        tennis.Set(trusted=True, games=[
+          tennis.Game(server_points=4),
+          tennis.Game(returner_points=4)
+        ] * 4)
+      ]).to_bytes())
+
+    corrupted = []
+    match = tennis.Match(record_points=True)
+    match.points(first_servers=[True] * 5)
+    match._checkpoints.append((5, 0, 3, tennis.Game()))
+    corrupted.append(match)
+    match = tennis.Match(record_points=True)
+    match.point_log = [True] * 5
+    corrupted.append(match)
+    match = tennis.Match(history=False)
+    match._sets = 1
+    corrupted.append(match)
+    match = tennis.Match(history=False)
+    match.sets[0]._games = match.sets[0]._first_returner_games = 6
+    corrupted.append(match)
+    match = tennis.Match(target_sets=1, final_set_tiebreak_games=0, history=False)
+    match.sets[0]._games = match.sets[0]._first_returner_games = 5
+    corrupted.append(match)
+    match = tennis.Match()
+    match.sets[0].games = []
+    corrupted.append(match)
+
+    for match in corrupted:
+      with self.assertRaisesRegex(RuntimeError, '^Encoded match must be well-formed.$'):
+        tennis.Match.from_bytes(data=match.to_bytes())
+
+  def test_pickle(self):
+    match = tennis.Match(deciding_point=True, final_set_tiebreak_games=None,
+                         final_set_tiebreak_points=None, record_points=True)
+    match.points(first_servers=[True] * 30 + [False, False])
+    other = pickle.loads(pickle.dumps(match))
+
+    self.assertEqual(other, match)
+    self.assertEqual(other.point_log, match.point_log)
+    self.assertEqual(other.correct_point(index=30), match.correct_point(index=30))
+    self.assertEqual(other, match)
+
+    match = tennis.Match(history=False)
+    match.points(first_servers=[True, True, True, False, True] * 8)
+    other = pickle.loads(pickle.dumps(match))
+
+    self.assertEqual(other, match)
+    self.assertEqual(other.scoreline(), match.scoreline())
+    self.assertEqual(other.point(first_server=True), match.point(first_server=True))
+    self.assertEqual(other, match)
+
+  def test_match_format(self):
+    match = tennis.Match(target_sets=3, deciding_point=True)
+    other = tennis.Match(target_sets=3, deciding_point=True)
+
+    self.assertIs(match.match_format, other.match_format)
+    self.assertIs(match.sets[0].set_format, match.match_format.set_format)
+    self.assertEqual(match.target_sets, 3)
+    self.assertTrue(match.deciding_point)
+
+    match = tennis.Match(match_format=tennis.MatchFormat.BEST_OF_FIVE, target_sets=1)
+    self.assertEqual(match.target_sets, 3)
+    self.assertEqual(match, tennis.Match(target_sets=3))
+
+  def test_subscribe(self):
+    match = tennis.Match()
+    events = []
+    match.subscribe(observer=events.append)
+    match.points(first_servers=[True] * 8)
+
+    self.assertEqual(events, [
+      tennis.events.PointWon(set_index=0, game_index=0, first_server=True)
+    ] * 4 + [
+      tennis.events.GameWon(set_index=0, game_index=0, first_server=True)
+    ] + [
+      tennis.events.PointWon(set_index=0, game_index=1, first_server=True)
+    ] * 4 + [
+      tennis.events.GameWon(set_index=0, game_index=1, first_server=True),
+      tennis.events.Break(set_index=0, game_index=1, first_server=True)
+    ])
+
+    match.points(first_servers=[True] * 40)
+
+    self.assertEqual(events[-4:], [
+      tennis.events.GameWon(set_index=1, game_index=5, first_server=True),
+      tennis.events.Break(set_index=1, game_index=5, first_server=True),
+      tennis.events.SetWon(set_index=1, game_index=5, first_server=True),
+      tennis.events.MatchWon(set_index=1, game_index=5, first_server=True)
+    ])
+
+    for history in (True, False):
+      match = tennis.Match(history=history)
+      other = []
+      match.subscribe(observer=other.append)
+      match.points(first_servers=[True] * 48)
+
+      self.assertEqual(other, events)
+
+  def test_subscribe_events(self):
+    match = tennis.Match.from_scoreline(scoreline='6-5')
+    events = []
+    match.subscribe(
+      observer=events.append,
+      events=[tennis.events.GameWon, tennis.events.TiebreakStarted]
+    )
+    match.points(first_servers=[False] * 4)
+
+    self.assertEqual(events, [
+      tennis.events.GameWon(set_index=0, game_index=11, first_server=False),
+      tennis.events.TiebreakStarted(set_index=0, game_index=12, first_server=True)
+    ])
+
+    match = tennis.Match(match_format=tennis.MatchFormat.MATCH_TIEBREAK)
+    events = []
+    match.subscribe(
+      observer=events.append,
+      events=[tennis.events.SetWon, tennis.events.TiebreakStarted]
+    )
+    match.points(first_servers=[True] * 24 + [False] * 24)
+
+    self.assertEqual(events, [
+      tennis.events.SetWon(set_index=0, game_index=5, first_server=True),
+      tennis.events.SetWon(set_index=1, game_index=5, first_server=False),
+      tennis.events.TiebreakStarted(set_index=2, game_index=0, first_server=True)
+    ])
+
+  def test_unsubscribe(self):
+    match = tennis.Match(record_points=True)
+    other = tennis.Match(record_points=True)
+    events = []
+    match.subscribe(observer=events.append)
+    match.subscribe(observer=len)
+    match.unsubscribe(observer=len)
+    match.points(first_servers=[True] * 4)
+    other.points(first_servers=[True] * 4)
+
+    self.assertEqual(len(events), 5)
+    self.assertEqual(match, other)
+
+    match.correct_point(index=0)
+    self.assertEqual(len(events), 5)
+
+    match.unsubscribe(observer=events.append)
+    match.point(first_server=True)
+    self.assertEqual(len(events), 5)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Observer must be subscribed to the match.'))
+    ):
+      match.unsubscribe(observer=events.append)
+
 if __name__ == '__main__':
   unittest.main()
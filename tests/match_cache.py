@@ -0,0 +1,76 @@
+import os
+import re
+import tempfile
+import unittest
+
+import tennis
+
+class MatchCache(unittest.TestCase):
+  def setUp(self):
+    self.directory = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.directory.name, 'matches.db')
+
+  def tearDown(self):
+    self.directory.cleanup()
+
+  def test_init(self):
+    with tennis.MatchCache(store=tennis.MatchStore(path=self.path), capacity=2) as cache:
+      self.assertEqual(len(cache), 0)
+      self.assertIs(cache.match_format, tennis.MatchFormat())
+      self.assertEqual((cache.hits, cache.misses, cache.spills), (0, 0, 0))
+      self.assertEqual(cache.hit_latencies, [0] * 32)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('capacity must be at least 1.'))
+    ):
+      tennis.MatchCache(store=tennis.MatchStore(path=self.path), capacity=0)
+
+  def test_point(self):
+    store = tennis.MatchStore(path=self.path)
+    with tennis.MatchCache(store=store, capacity=2, match_format=tennis.MatchFormat.FAST4) as cache:
+      cache.point(match_id='a', first_server=True)
+      cache.point(match_id='b', first_server=False)
+      cache.point(match_id='a', first_server=True)
+      self.assertEqual((cache.hits, cache.misses, cache.spills), (1, 2, 0))
+
+      cache.point(match_id='c', first_server=True)
+      self.assertEqual(cache.spills, 1)
+      self.assertNotIn('b', cache)
+      self.assertIn('a', cache)
+      self.assertEqual(store.get(match_id='b').scoreline(), '0-0 0-15')
+
+      self.assertIsNone(cache.point(match_id='b', first_server=False))
+      self.assertEqual((cache.hits, cache.misses, cache.spills), (1, 4, 2))
+      self.assertNotIn('a', cache)
+      self.assertEqual(cache.get(match_id='b').scoreline(), '0-0 0-30')
+      self.assertIs(cache.get(match_id='a').match_format, tennis.MatchFormat.FAST4)
+      self.assertEqual(cache.get(match_id='a').scoreline(), '0-0 30-0')
+
+      self.assertEqual(sum(cache.hit_latencies), cache.hits)
+      self.assertEqual(sum(cache.miss_latencies), cache.misses)
+      self.assertEqual(sum(cache.spill_latencies), cache.spills)
+
+      cache.add(match_id='d', match=tennis.Match.from_scoreline(scoreline='6-0 6-0'))
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^Points must not be played after the match is over\\.$'
+      ):
+        cache.point(match_id='d', first_server=True)
+
+      self.assertEqual(cache.remove(match_id='c').scoreline(), '0-0 15-0')
+      self.assertIsNone(cache.remove(match_id='c'))
+
+    with tennis.MatchCache(store=tennis.MatchStore(path=self.path), capacity=1) as cache:
+      self.assertEqual(len(cache), 0)
+      self.assertEqual(cache.get(match_id='a').scoreline(), '0-0 30-0')
+      self.assertEqual(cache.get(match_id='b').scoreline(), '0-0 0-30')
+      self.assertTrue(cache.get(match_id='d').winner)
+      self.assertIsNone(cache.get(match_id='c'))
+      self.assertNotIn('c', cache)
+      self.assertEqual(cache.misses, 4)
+
+    self.assertIsNone(tennis.MatchStore(path=self.path).get(match_id='c'))
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,103 @@
+import copy
+import pickle
+import re
+import unittest
+
+import tennis
+
+class MatchFormat(unittest.TestCase):
+  def test_init_no_args(self):
+    match_format = tennis.MatchFormat()
+
+    self.assertEqual(match_format.target_sets, 2)
+    self.assertIs(match_format.set_format, tennis.SetFormat())
+    self.assertIs(match_format.final_set_format, tennis.SetFormat())
+    self.assertIs(match_format, tennis.MatchFormat.BEST_OF_THREE)
+
+  def test_init_kwargs(self):
+    match_format = tennis.MatchFormat(
+      final_set_tiebreak_points=10,
+      final_set_tiebreak_games=0,
+      final_set_deciding_point=True,
+      final_set_target_games=1,
+      tiebreak_points=5,
+      tiebreak_games=3,
+      deciding_point=True,
+      target_games=4,
+      target_sets=3
+    )
+
+    self.assertEqual(match_format.target_sets, 3)
+    self.assertIs(
+      match_format.set_format,
+      tennis.SetFormat(target_games=4, deciding_point=True, tiebreak_games=3, tiebreak_points=5)
+    )
+    self.assertIs(
+      match_format.final_set_format,
+      tennis.SetFormat(target_games=1, deciding_point=True, tiebreak_games=0, tiebreak_points=10)
+    )
+
+  def test_init_interned(self):
+    match_format = tennis.MatchFormat(target_sets=3)
+
+    self.assertIs(match_format, tennis.MatchFormat.BEST_OF_FIVE)
+    self.assertIs(tennis.MatchFormat(**match_format.kwargs()), match_format)
+    self.assertIs(copy.deepcopy(match_format), match_format)
+    self.assertIs(pickle.loads(pickle.dumps(match_format)), match_format)
+
+  def test_init_invalid(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('target_sets must be at least 1.'))
+    ):
+      tennis.MatchFormat(target_sets=0)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape(
+        'final_set_tiebreak_games and final_set_tiebreak_points must both be None or non-None.'
+      ))
+    ):
+      tennis.MatchFormat(final_set_tiebreak_points=None)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Point scores must be non-negative.'))
+    ):
+      tennis.MatchFormat(final_set_tiebreak_games=-1)
+
+  def test_immutable(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Formats cannot be modified.'))
+    ):
+      tennis.MatchFormat.NO_AD.target_sets = 3
+
+    self.assertEqual(tennis.MatchFormat.NO_AD.target_sets, 2)
+
+  def test_presets(self):
+    match = tennis.Match(match_format=tennis.MatchFormat.NO_AD)
+    match.points(first_servers=[True, True, True, False, False, False, True])
+    self.assertEqual(match.scoreline(), '1-0')
+
+    match = tennis.Match(match_format=tennis.MatchFormat.FAST4)
+    match.points(first_servers=([True] * 4 + [False] * 4) * 3)
+    self.assertEqual(match.scoreline(), '3-3')
+    self.assertEqual(type(match.sets[0].games[-1]), tennis.Tiebreak)
+
+    match = tennis.Match(match_format=tennis.MatchFormat.MATCH_TIEBREAK)
+    match.points(first_servers=[True] * 24 + [False] * 24)
+    self.assertEqual(type(match.sets[-1].games[-1]), tennis.Tiebreak)
+    self.assertIsNone(match.points(first_servers=[True] * 9))
+    self.assertTrue(match.point(first_server=True))
+
+  def test_repr(self):
+    self.assertEqual(
+      repr(tennis.MatchFormat.BEST_OF_FIVE),
+      'MatchFormat(target_sets=3, target_games=6, deciding_point=False, tiebreak_games=6, '
+      'tiebreak_points=7, final_set_target_games=6, final_set_deciding_point=False, '
+      'final_set_tiebreak_games=6, final_set_tiebreak_points=7)'
+    )
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,98 @@
+import copy
+import re
+import unittest
+
+import tennis
+
+class MatchHistory(unittest.TestCase):
+  def test_init_no_args(self):
+    history = tennis.MatchHistory()
+
+    self.assertEqual(history.match, tennis.Match())
+    self.assertEqual(history.checkpoint_interval, 64)
+    self.assertEqual(len(history), 0)
+
+  def test_init_kwargs(self):
+    match = tennis.Match(target_sets=3)
+    history = tennis.MatchHistory(checkpoint_interval=5, match=match)
+
+    self.assertEqual(history.match, match)
+    self.assertIsNot(history.match, match)
+    self.assertEqual(history.checkpoint_interval, 5)
+
+  def test_init_zero_checkpoint_interval(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('checkpoint_interval must be at least 1.'))
+    ):
+      tennis.MatchHistory(checkpoint_interval=0)
+
+  def test_point(self):
+    history = tennis.MatchHistory(checkpoint_interval=3)
+    match = tennis.Match()
+
+    first_servers = [True, False, False, True, True, True, False, True, False, True, True]
+    for first_server in first_servers:
+      self.assertEqual(
+        history.point(first_server=first_server),
+        match.point(first_server=first_server)
+      )
+
+    self.assertEqual(history.match, match)
+    self.assertEqual(len(history), len(first_servers))
+    self.assertEqual([history[i] for i in range(len(history))], first_servers)
+
+    with self.assertRaisesRegex(
+      IndexError,
+      '^{}$'.format(re.escape('Point index must be in the history.'))
+    ):
+      history[len(first_servers)]
+
+  def test_points(self):
+    history = tennis.MatchHistory(match=tennis.Match(target_sets=1, final_set_tiebreak_games=0))
+    self.assertTrue(history.points(first_servers=[True] * 7))
+    self.assertEqual(len(history), 7)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      history.point(first_server=True)
+
+    self.assertEqual(len(history), 7)
+
+  def test_state_at(self):
+    first_servers = [True] * 4 + [False] * 4 + [True, False] * 96
+    history = tennis.MatchHistory(checkpoint_interval=16)
+    history.points(first_servers=first_servers)
+
+    for index in (0, 1, 15, 16, 17, 100, 200):
+      match = tennis.Match(history=False)
+      match.points(first_servers=first_servers[:index])
+      self.assertEqual(history.state_at(index=index), match)
+
+    self.assertLess(max(len(checkpoint) for checkpoint in history._checkpoints), 32)
+
+    self.assertIsNot(history.state_at(index=200), history.match)
+
+    with self.assertRaisesRegex(
+      IndexError,
+      '^{}$'.format(re.escape('Point index must be between 0 and the length of the history.'))
+    ):
+      history.state_at(index=201)
+
+  def test_states(self):
+    first_servers = [True] * 4 + [False] * 4 + [True, False] * 21
+    history = tennis.MatchHistory(checkpoint_interval=7)
+    history.points(first_servers=first_servers)
+
+    states = [copy.deepcopy(match) for match in history.states()]
+    self.assertEqual(len(states), 51)
+    self.assertEqual(len({id(match) for match in history.states()}), 1)
+
+    for index, match in enumerate(states):
+      self.assertTrue(match.history)
+      self.assertEqual(match._without_history(), history.state_at(index=index))
+
+if __name__ == '__main__':
+  unittest.main()
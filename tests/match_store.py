@@ -0,0 +1,90 @@
+import os
+import re
+import tempfile
+import unittest
+
+import tennis
+
+class MatchStore(unittest.TestCase):
+  def setUp(self):
+    self.directory = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.directory.name, 'matches.db')
+
+  def tearDown(self):
+    self.directory.cleanup()
+
+  def test_init(self):
+    with tennis.MatchStore(path=self.path) as store:
+      self.assertEqual(len(store), 0)
+      self.assertEqual(store.batch_size, 1000)
+      self.assertIsNone(store.get(match_id='a'))
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('batch_size must be at least 1.'))
+    ):
+      tennis.MatchStore(path=self.path, batch_size=0)
+
+  def test_put(self):
+    match = tennis.Match(match_format=tennis.MatchFormat.FAST4)
+    with tennis.MatchStore(path=self.path, batch_size=3) as store:
+      for i in range(5):
+        match.point(first_server=True)
+        store.put(match_id='live', match=match)
+
+      self.assertEqual(store.get(match_id='live'), match)
+      self.assertEqual(store.transactions, 0)
+      store.put_many(matches=[
+        ('a', tennis.Match.from_scoreline(scoreline='6-0 6-0')),
+        ('b', tennis.Match.from_scoreline(scoreline='0-6 6-4 6-7(5)'))
+      ])
+      self.assertEqual(store.transactions, 1)
+      self.assertEqual(store.get(match_id='live').scoreline(), '1-0 15-0')
+      self.assertEqual(len(store), 3)
+
+      self.assertTrue(store.remove(match_id='a'))
+      self.assertFalse(store.remove(match_id='a'))
+
+    with tennis.MatchStore(path=self.path) as store:
+      self.assertEqual(store.get(match_id='live'), match)
+      self.assertIs(store.get(match_id='live').match_format, tennis.MatchFormat.FAST4)
+      self.assertEqual(store.get(match_id='b').scoreline(), '0-6 6-4 6-7(5)')
+      self.assertIsNone(store.get(match_id='a'))
+
+  def test_query(self):
+    with tennis.MatchStore(path=self.path) as store:
+      store.put_many(matches=[
+        ('a', tennis.Match.from_scoreline(scoreline='6-0 6-0')),
+        ('b', tennis.Match.from_scoreline(scoreline='0-6 6-4 6-7(5)')),
+        ('c', tennis.Match.from_scoreline(scoreline='6-0 6-0')),
+        ('d', tennis.Match.from_scoreline(scoreline='6-0 5-5')),
+        ('e', tennis.Match(match_format=tennis.MatchFormat.NO_AD))
+      ])
+
+      self.assertEqual([stored.match_id for stored in store.query()], ['a', 'b', 'c', 'd', 'e'])
+      self.assertEqual(
+        [stored.match_id for stored in store.query(scoreline='6-0 6-0', winner=True)],
+        ['a', 'c']
+      )
+      self.assertEqual([stored.match_id for stored in store.query(winner=False)], ['b'])
+      self.assertEqual([stored.match_id for stored in store.query(live=True)], ['d', 'e'])
+      self.assertEqual(
+        [stored.match_id for stored in store.query(match_format=tennis.MatchFormat.NO_AD)],
+        ['e']
+      )
+      self.assertEqual(store.count(live=False), 3)
+      self.assertEqual(store.count(match_format=tennis.MatchFormat(), live=True), 1)
+
+      stored = store.query(live=True)[0]
+      self.assertEqual(
+        repr(stored),
+        'StoredMatch(match_id=\'d\', winner=None, scoreline=\'6-0 5-5\')'
+      )
+      self.assertIs(stored.match_format, tennis.MatchFormat())
+      self.assertIsNone(stored._match)
+      self.assertEqual(stored.match.scoreline(), '6-0 5-5')
+      self.assertIs(stored.match, stored.match)
+      self.assertIs(store.query(live=True)[1].match_format, tennis.MatchFormat.NO_AD)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,85 @@
+import random
+import re
+import unittest
+
+import tennis
+
+class PointCoding(unittest.TestCase):
+  def test_round_trip(self):
+    generator = random.Random(0)
+    for match_format in (tennis.MatchFormat(), tennis.MatchFormat.MATCH_TIEBREAK):
+      for i in range(50):
+        match = tennis.Match(match_format=match_format)
+        first_servers = []
+        while match.winner is None and (i or len(first_servers) < 37):
+          first_server = generator.random() < (0.64 if match.first_server_to_serve() else 0.36)
+          match.point(first_server=first_server)
+          first_servers.append(first_server)
+
+        data = tennis.encode_points(first_servers=first_servers, match_format=match_format)
+        decoded = tennis.decode_points(data=data, match_format=match_format)
+
+        self.assertIs(decoded.match_format, match_format)
+        self.assertEqual(decoded, match)
+
+  def test_empty(self):
+    self.assertEqual(tennis.encode_points(first_servers=[]), b'\x00')
+    self.assertEqual(tennis.decode_points(data=b'\x00'), tennis.Match())
+
+  def test_model(self):
+    model = lambda match: 0.9 if match.sets[-1].games[-1].server_points else 0.6
+    first_servers = [True] * 12 + [False] * 12
+    data = tennis.encode_points(first_servers=first_servers, model=model)
+    match = tennis.Match()
+    match.points(first_servers=first_servers)
+
+    self.assertEqual(tennis.decode_points(data=data, model=model), match)
+    self.assertLess(
+      len(data),
+      len(tennis.encode_points(first_servers=first_servers, model=lambda match: 0.5))
+    )
+
+  def test_structural_model(self):
+    model = lambda match: 0.9 if len(match.sets) > 1 else 0.6
+    first_servers = [True, True, True, True, False, False, False, False] * 10 + [True] * 12
+    data = tennis.encode_points(first_servers=first_servers, model=model)
+
+    for history in (True, False):
+      match = tennis.Match(history=history)
+      match.points(first_servers=first_servers)
+      self.assertEqual(tennis.decode_points(data=data, model=model, history=history), match)
+
+  def test_size(self):
+    match = tennis.Match()
+    first_servers = []
+    for i in range(60):
+      first_servers.append(match.first_server_to_serve() == (i % 5 != 4))
+      match.point(first_server=first_servers[-1])
+
+    data = tennis.encode_points(first_servers=first_servers)
+
+    self.assertLess(len(data), 1 + (len(first_servers) + 7) // 8)
+
+  def test_history(self):
+    match = tennis.decode_points(data=tennis.encode_points(first_servers=[True] * 8), history=False)
+
+    self.assertEqual(len(match.sets[-1].games), 1)
+    self.assertEqual(match.sets[-1].first_server_games(), 2)
+
+  def test_errors(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Points must not be played after the match is over.'))
+    ):
+      tennis.encode_points(first_servers=[True] * 49)
+
+    coded = tennis.encode_points(first_servers=[True] * 48)
+    for data in (b'', b'\x80', bytes([49]) + coded[1:]):
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Coded points must be well-formed.'))
+      ):
+        tennis.decode_points(data=data)
+
+if __name__ == '__main__':
+  unittest.main()
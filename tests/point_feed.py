@@ -0,0 +1,95 @@
+import re
+import unittest
+
+import tennis
+
+class PointFeed(unittest.TestCase):
+  def test_init(self):
+    feed = tennis.PointFeed()
+
+    self.assertEqual(feed.match, tennis.Match())
+    self.assertEqual(feed.next_sequence_number, 0)
+    self.assertEqual(feed.window, 64)
+    self.assertEqual(feed.buffered, 0)
+    self.assertEqual(feed.duplicates, 0)
+    self.assertEqual(feed.conflicts, 0)
+
+    match = tennis.Match()
+    feed = tennis.PointFeed(match=match, first_sequence_number=10, window=4)
+    self.assertIs(feed.match, match)
+    self.assertEqual(feed.next_sequence_number, 10)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('window must be at least 1.'))
+    ):
+      tennis.PointFeed(window=0)
+
+  def test_point(self):
+    feed = tennis.PointFeed(first_sequence_number=1, window=4)
+
+    self.assertEqual(feed.point(sequence_number=1, first_server=True), 1)
+    self.assertEqual(feed.point(sequence_number=1, first_server=True), 0)
+    self.assertEqual(feed.point(sequence_number=3, first_server=False), 0)
+    self.assertEqual(feed.point(sequence_number=4, first_server=True), 0)
+    self.assertEqual(feed.point(sequence_number=3, first_server=True), 0)
+    self.assertEqual(feed.buffered, 2)
+    self.assertEqual(feed.match.scoreline(), '0-0 15-0')
+    self.assertEqual(feed.point(sequence_number=2, first_server=True), 3)
+    self.assertEqual(feed.point(sequence_number=2, first_server=False), 0)
+    self.assertEqual(feed.point(sequence_number=0, first_server=False), 0)
+
+    self.assertEqual(feed.next_sequence_number, 5)
+    self.assertEqual(feed.buffered, 0)
+    self.assertEqual(feed.duplicates, 4)
+    self.assertEqual(feed.conflicts, 2)
+    self.assertEqual(feed.match.scoreline(), '0-0 40-15')
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Sequence numbers must be within the window after the next one.'))
+    ):
+      feed.point(sequence_number=9, first_server=True)
+
+  def test_points(self):
+    first_servers = [True] * 24 + [False] * 30
+    match = tennis.Match()
+    match.points(first_servers=first_servers)
+    events = list(enumerate(first_servers))
+    feeds = [events, events[::2] + events[1::2], [events[i ^ 1] for i in range(len(events))]]
+    feed = tennis.PointFeed(window=len(events))
+
+    self.assertEqual(
+      sum(feed.points(events=feed_events) for feed_events in feeds),
+      len(first_servers)
+    )
+    self.assertEqual(feed.match, match)
+    self.assertEqual(feed.duplicates, 2 * len(first_servers))
+    self.assertEqual(feed.conflicts, 0)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      tennis.PointFeed().points(events=enumerate([True] * 49))
+
+  def test_match_over(self):
+    feed = tennis.PointFeed(window=4)
+    feed.points(events=enumerate([True] * 47))
+    feed.point(sequence_number=48, first_server=True)
+    feed.point(sequence_number=49, first_server=True)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      feed.point(sequence_number=47, first_server=True)
+
+    self.assertTrue(feed.match.winner)
+    self.assertEqual(feed.next_sequence_number, 48)
+    self.assertEqual(feed.buffered, 1)
+    self.assertEqual(feed._pending, [None, True, None, None])
+    self.assertEqual(feed.duplicates, 0)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,92 @@
+import os
+import re
+import tempfile
+import unittest
+
+import tennis.point_states
+
+class PointStates(unittest.TestCase):
+  def test_write_point_states(self):
+    with tempfile.TemporaryDirectory() as directory:
+      length = tennis.point_states.write_point_states(
+        sequences=[[True] * 3 + [False] * 3 + [True, True], [], [False] * 2],
+        directory=directory,
+        chunk_points=3
+      )
+      columns = tennis.point_states.read_point_states(directory=directory)
+
+      self.assertEqual(length, 10)
+      self.assertEqual(
+        sorted(os.listdir(directory)),
+        sorted(name + '.npy' for name, descr, code in tennis.point_states.COLUMNS)
+      )
+      self.assertEqual({name: column.tolist() for name, column in columns.items()}, {
+        'match': [0] * 8 + [2] * 2,
+        'point': list(range(8)) + [0, 1],
+        'first_server_sets': [0] * 10,
+        'first_returner_sets': [0] * 10,
+        'first_server_games': [0] * 8 + [0] * 2,
+        'first_returner_games': [0] * 10,
+        'first_server_points': [0, 1, 2, 3, 3, 3, 3, 4, 0, 0],
+        'first_returner_points': [0, 0, 0, 0, 1, 2, 3, 3, 0, 1],
+        'tiebreak': [0] * 10,
+        'first_server_to_serve': [1] * 10,
+        'break_point': [0] * 10,
+        'set_point': [0] * 10,
+        'match_point': [0] * 10
+      })
+
+  def test_write_point_states_flags(self):
+    with tempfile.TemporaryDirectory() as directory:
+      tennis.point_states.write_point_states(
+        sequences=[[True] * 48],
+        directory=directory
+      )
+      columns = tennis.point_states.read_point_states(directory=directory)
+
+      self.assertEqual(columns['first_server_games'][23], 5)
+      self.assertEqual(columns['first_returner_games'][23], 0)
+      self.assertEqual(columns['first_server_points'][23], 3)
+      self.assertEqual(columns['first_server_to_serve'][23], False)
+      self.assertEqual(columns['break_point'][20:24].tolist(), [0, 0, 0, 1])
+      self.assertEqual(columns['set_point'][16:24].tolist(), [0] * 7 + [1])
+      self.assertEqual(columns['match_point'][16:24].tolist(), [0] * 8)
+      self.assertEqual(columns['first_server_sets'][24], 1)
+      self.assertEqual(columns['first_server_games'][24], 0)
+      self.assertEqual(columns['match_point'][40:48].tolist(), [0] * 7 + [1])
+      self.assertEqual(columns['tiebreak'].tolist(), [0] * 48)
+
+  def test_point_state(self):
+    match = tennis.Match()
+    match.points(first_servers=[True] * 23)
+
+    self.assertEqual(
+      tennis.point_state(match=match),
+      (0, 0, 5, 0, 3, 0, False, False, True, True, False)
+    )
+
+  def test_write_point_states_match_over(self):
+    with tempfile.TemporaryDirectory() as directory:
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Match 1: Points must not be played after the match is over.'))
+      ):
+        tennis.point_states.write_point_states(
+          sequences=[[True], [True] * 49],
+          directory=directory
+        )
+
+  def test_read_point_states_invalid(self):
+    with tempfile.TemporaryDirectory() as directory:
+      tennis.point_states.write_point_states(sequences=[[True]], directory=directory)
+      with open(os.path.join(directory, 'point.npy'), 'ab') as file:
+        file.write(b'\x00')
+
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('point.npy must be a .npy file of type <u4.'))
+      ):
+        tennis.point_states.read_point_states(directory=directory)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,92 @@
+import io
+import re
+import unittest
+
+import tennis
+
+class Reader(unittest.TestCase):
+  def test_read_match(self):
+    match = tennis.Match.from_scoreline(
+      scoreline='6-4 3-6 7-6(5) 2-1 30-15',
+      target_sets=3,
+      final_set_tiebreak_games=None,
+      final_set_tiebreak_points=None
+    )
+    self.assertEqual(tennis.read_match(string=str(match)), match)
+    self.assertEqual(tennis.read_match(string=str(match) + '\n'), match)
+    self.assertEqual(tennis.read_match(string=str(tennis.Match())), tennis.Match())
+    self.assertEqual(
+      tennis.read_match(string=str(tennis.Match(sets=[], trusted=True)), trusted=True),
+      tennis.Match(sets=[], trusted=True)
+    )
+
+    match = tennis.Match(
+      sets=[tennis.Set(
+        games=[tennis.Game(server_points=1, returner_points=2, deciding_point=True)],
+        target_games=3,
+        deciding_point=True,
+        tiebreak_games=4,
+        tiebreak_points=5
+      )],
+      target_sets=6,
+      target_games=3,
+      deciding_point=True,
+      tiebreak_games=4,
+      tiebreak_points=5,
+      final_set_target_games=7,
+      final_set_deciding_point=False,
+      final_set_tiebreak_games=8,
+      final_set_tiebreak_points=9
+    )
+    self.assertEqual(tennis.read_match(string=str(match)), match)
+
+  def test_read_match_malformed(self):
+    string = str(tennis.Match.from_scoreline(scoreline='6-4 2-1'))
+    for malformed in (
+      '',
+      string[:-1],
+      string.replace('Game(', 'Games('),
+      string.replace('), Game(', '),Game('),
+      string.replace('target_sets=2', 'target_sets=two'),
+      string.replace(')], target_games=6', '), ], target_games=6', 1)
+    ):
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Match string must be well-formed.'))
+      ):
+        tennis.read_match(string=malformed)
+
+  def test_read_match_trusted(self):
+    string = str(tennis.Match(sets=[tennis.Set(), tennis.Set()], trusted=True))
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Only the last set of a match may be unfinished.'))
+    ):
+      tennis.read_match(string=string)
+
+    self.assertEqual(
+      tennis.read_match(string=string, trusted=True),
+      tennis.Match(sets=[tennis.Set(), tennis.Set()], trusted=True)
+    )
+
+  def test_read_matches(self):
+    matches = [
+      tennis.Match.from_scoreline(scoreline='6-4 6-7(3) 2-1 30-15', target_sets=3),
+      tennis.Match.from_scoreline(scoreline='6-0 6-0'),
+      tennis.Match()
+    ]
+    file = io.StringIO('{}\n\n{}\n{}\n'.format(*matches))
+    self.assertEqual(list(tennis.read_matches(file=file)), matches)
+
+    file = io.StringIO('{}\n\nMatch()\n'.format(matches[0]))
+    matches = tennis.read_matches(file=file)
+    next(matches)
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Line 3: Match string must be well-formed.'))
+    ):
+      next(matches)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,51 @@
+import re
+import unittest
+
+import tennis
+
+class Corpus(unittest.TestCase):
+  def test_init(self):
+    with tennis.Corpus(sequences=[[True] * 3, [], [False] * 9]) as corpus:
+      self.assertEqual(len(corpus), 3)
+      self.assertTrue(corpus.name)
+
+  def test_replay(self):
+    sequences = [
+      [True] * 48,
+      [False] * 4 + [True] * 4,
+      [],
+      [True, False] * 20,
+      [True] * 24 + [False] * 24 + [True] * 8
+    ]
+    expected = []
+    for sequence in sequences:
+      match = tennis.Match(match_format=tennis.MatchFormat.MATCH_TIEBREAK)
+      match.points(first_servers=sequence)
+      expected.append((
+        2 if match.winner is None else match.winner,
+        match.first_server_sets(),
+        match.first_returner_sets()
+      ))
+
+    with tennis.Corpus(sequences=sequences) as corpus:
+      for workers, slices in ((1, None), (2, 3), (3, 10)):
+        winners, first_server_sets, first_returner_sets = corpus.replay(
+          match_format=tennis.MatchFormat.MATCH_TIEBREAK,
+          workers=workers,
+          slices=slices
+        )
+
+        self.assertEqual(list(zip(winners, first_server_sets, first_returner_sets)), expected)
+
+  def test_replay_match_over(self):
+    with tennis.Corpus(sequences=[[True] * 4, [True] * 49]) as corpus:
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape(
+          'Match 1: Cannot advance this match\'s score because the match is over.'
+        ))
+      ):
+        corpus.replay(workers=1)
+
+if __name__ == '__main__':
+  unittest.main()
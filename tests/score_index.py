@@ -0,0 +1,65 @@
+import re
+import unittest
+
+import tennis
+
+_HOLDS = [True] * 4 + [False] * 4
+_RETURNER_HOLDS = [False] * 4 + [True] * 4
+
+class ScoreIndex(unittest.TestCase):
+  def test_init(self):
+    index = tennis.ScoreIndex(sequences=[[True] * 5, [], [False] * 2])
+
+    self.assertEqual(index.matches, 3)
+    self.assertEqual(index.points, 7)
+    self.assertEqual(
+      index.query(),
+      [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (2, 0), (2, 1)]
+    )
+
+  def test_init_match_over(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Match 0: Points must not be played after the match is over.'))
+    ):
+      tennis.ScoreIndex(sequences=[[True] * 49])
+
+  def test_query(self):
+    index = tennis.ScoreIndex(sequences=[[True] * 48, [True, True, True, False, False] * 2])
+
+    self.assertEqual(index.query(points=(3, 2)), [(1, 5)])
+    self.assertEqual(index.query(points=(2, 3)), [])
+    self.assertEqual(index.query(server_points=(1, 2)), [(1, 9)])
+    self.assertEqual(
+      index.query(points=(3, 0), flags=['break_point'])[:3],
+      [(0, 7), (0, 15), (0, 23)]
+    )
+    self.assertEqual(index.query(sets=(0, 0), flags=['set_point']), [(0, 23)])
+    self.assertEqual(index.query(flags=['set_won']), [(0, 23), (0, 47)])
+    self.assertEqual(index.query(flags=['match_point', 'break_point']), [(0, 47)])
+    self.assertEqual(index.query(flags=['match_won']), [(0, 47)])
+    self.assertEqual(index.query(games=(5, 0), sets=(1, 0), points=(0, 0)), [(0, 44)])
+    self.assertEqual(index.query(flags=['deciding_set']), [])
+
+  def test_query_tiebreak_comeback(self):
+    index = tennis.ScoreIndex(
+      sequences=[[False] * 24 + _HOLDS * 6 + [True] * 7 + _RETURNER_HOLDS * 6 + [True] * 7],
+      match_format=tennis.MatchFormat.BEST_OF_THREE
+    )
+
+    self.assertEqual(len(index.query(flags=['deciding_set'])), 55)
+    self.assertEqual(index.query(flags=['tiebreak', 'deciding_set'])[0], (0, 127))
+    self.assertEqual(index.query(flags=['comeback']), [(0, 133)])
+    self.assertEqual(index.query(flags=['comeback', 'tiebreak', 'match_won']), [(0, 133)])
+
+  def test_query_invalid_flag(self):
+    index = tennis.ScoreIndex(sequences=[])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Flags must be in ScoreIndex.FLAGS.'))
+    ):
+      index.query(flags=['ace'])
+
+if __name__ == '__main__':
+  unittest.main()
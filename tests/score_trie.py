@@ -0,0 +1,87 @@
+import re
+import unittest
+
+import tennis
+
+class ScoreTrie(unittest.TestCase):
+  def test_init(self):
+    trie = tennis.ScoreTrie()
+
+    self.assertIs(trie.match_format, tennis.MatchFormat())
+    self.assertEqual(trie.matches, 0)
+    self.assertEqual(len(trie), 1)
+    self.assertEqual(trie.outcomes(match=tennis.Match()), (0, 0, 0))
+    self.assertIsNone(trie.win_probability(match=tennis.Match()))
+
+  def test_add(self):
+    trie = tennis.ScoreTrie()
+
+    self.assertTrue(trie.add(first_servers=[True] * 48))
+    self.assertEqual(len(trie), 49)
+    self.assertIsNone(trie.add(first_servers=[True] * 24 + [False]))
+    self.assertEqual(len(trie), 50)
+    self.assertFalse(trie.add(first_servers=[True] * 24 + [False] * 48))
+    self.assertEqual(len(trie), 50 + 47)
+    self.assertEqual(trie.matches, 3)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      trie.add(first_servers=[True] * 49)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      trie.add(first_servers=[True] * 24 + [False] * 49)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Cannot advance this match\'s score because the match is over.'))
+    ):
+      trie.add(first_servers=[False] * 49)
+
+    self.assertEqual(len(trie), 50 + 47)
+    self.assertEqual(trie.matches, 3)
+    self.assertEqual(trie._children[0], -1)
+    self.assertEqual(trie.outcomes(match=tennis.Match()), (3, 1, 1))
+
+  def test_outcomes(self):
+    trie = tennis.ScoreTrie()
+    trie.add(first_servers=[True] * 48)
+    trie.add(first_servers=[True] * 24 + [False] * 48)
+    trie.add(first_servers=[True] * 24 + [False] * 30)
+    trie.add(first_servers=[True, False, False, True])
+
+    self.assertEqual(trie.outcomes(match=tennis.Match()), (4, 1, 1))
+    self.assertEqual(trie.win_probability(match=tennis.Match()), 0.5)
+
+    match = tennis.Match.from_scoreline(scoreline='6-0')
+    self.assertEqual(trie.outcomes(match=match), (3, 1, 1))
+
+    match = tennis.Match.from_scoreline(scoreline='6-0 0-1')
+    self.assertEqual(trie.outcomes(match=match), (2, 0, 1))
+    self.assertEqual(trie.win_probability(match=match), 0.0)
+
+    match = tennis.Match.from_scoreline(scoreline='0-0 30-30')
+    self.assertEqual(trie.outcomes(match=match), (1, 0, 0))
+    self.assertIsNone(trie.win_probability(match=match))
+
+    match = tennis.Match.from_scoreline(scoreline='6-0 6-0')
+    self.assertEqual(trie.outcomes(match=match), (1, 1, 0))
+    self.assertEqual(trie.outcomes(match=tennis.Match.from_scoreline(scoreline='0-6')), (0, 0, 0))
+
+  def test_outcomes_shared_state(self):
+    trie = tennis.ScoreTrie()
+    trie.add(first_servers=[True, False] + [True] * 47)
+    trie.add(first_servers=[False, True] + [False] * 4)
+
+    self.assertEqual(len(trie), 1 + 49 + 6)
+    self.assertEqual(
+      trie.outcomes(match=tennis.Match.from_scoreline(scoreline='0-0 15-15')),
+      (2, 1, 0)
+    )
+
+if __name__ == '__main__':
+  unittest.main()
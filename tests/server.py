@@ -0,0 +1,213 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+import tennis
+import tennis.server
+
+'''
+:param asyncio.StreamReader reader: stream of a client's messages
+:param bytes message: message to wait for
+:return: a list of the messages read up to and including the input message
+'''
+async def read_until(reader, message):
+  messages = []
+  while not messages or messages[-1] != message:
+    messages.append(await asyncio.wait_for(reader.readline(), 5))
+
+  return messages
+
+class Server(unittest.TestCase):
+  def test_point(self):
+    server = tennis.server.Server()
+
+    self.assertIsNone(server.point(match_id='a', server=True))
+    self.assertEqual(server.matches['a'].scoreline(), '0-0 15-0')
+    self.assertEqual(server.points, 1)
+
+    for i in range(47):
+      server.point(match_id='a', server=(i + 1) % 8 < 4)
+
+    self.assertNotIn('a', server.matches)
+    self.assertEqual(server.finished, {'a': '6-0 6-0'})
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^Points must not be played after the match is over\\.$'
+    ):
+      server.point(match_id='a', server=True)
+
+  def test_finished_capacity(self):
+    server = tennis.server.Server(finished_capacity=1)
+    for match_id in ('a', 'b'):
+      for i in range(48):
+        server.point(match_id=match_id, server=i % 8 < 4)
+
+    self.assertEqual(server.matches, {})
+    self.assertEqual(list(server.finished), ['b'])
+    self.assertEqual(server.ended, {'a', 'b'})
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^Points must not be played after the match is over\\.$'
+    ):
+      server.point(match_id='a', server=True)
+
+    self.assertEqual(server.matches, {})
+
+    server = tennis.server.Server(finished_capacity=0)
+    for i in range(48):
+      server.point(match_id='a', server=i % 8 < 4)
+
+    self.assertEqual(server.finished, {})
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^Points must not be played after the match is over\\.$'
+    ):
+      server.point(match_id='a', server=True)
+
+    with self.assertRaisesRegex(RuntimeError, '^finished_capacity must be non-negative\\.$'):
+      tennis.server.Server(finished_capacity=-1)
+
+  def test_start(self):
+    with self.assertRaisesRegex(RuntimeError, '^A port or a path must be given\\.$'):
+      asyncio.run(tennis.server.Server().start())
+
+  def test_subscribe(self):
+    async def run():
+      server = tennis.server.Server()
+      listener = await server.start(host='127.0.0.1', port=0)
+      port = listener.sockets[0].getsockname()[1]
+      subscriber_reader, subscriber_writer = await asyncio.open_connection('127.0.0.1', port)
+      scorer_reader, scorer_writer = await asyncio.open_connection('127.0.0.1', port)
+
+      subscriber_writer.write(b'subscribe a\nsubscribe b\n')
+      self.assertEqual(await read_until(subscriber_reader, b'score b 0-0\n'), [
+        b'score a 0-0\n',
+        b'score b 0-0\n'
+      ])
+
+      scorer_writer.write(b'point a S\npoint a A\npoint a R\npoint a S\n')
+      messages = await read_until(subscriber_reader, b'score a 0-0 40-15\n')
+      self.assertTrue(all(message.startswith(b'score a 0-0 ') for message in messages))
+      self.assertEqual(server.connections, 2)
+
+      subscriber_writer.write(b'unsubscribe a\nsubscribe c\n')
+      self.assertEqual(await read_until(subscriber_reader, b'score c 0-0\n'), [b'score c 0-0\n'])
+      scorer_writer.write(b'point a S\npoint b D\n')
+      self.assertEqual(await read_until(subscriber_reader, b'score b 0-0 0-15\n'), [
+        b'score b 0-0 0-15\n'
+      ])
+      self.assertEqual(server.matches['a'].scoreline(), '1-0')
+
+      subscriber_writer.close()
+      scorer_writer.close()
+      listener.close()
+      await listener.wait_closed()
+
+    asyncio.run(run())
+
+  def test_errors(self):
+    async def run():
+      server = tennis.server.Server()
+      listener = await server.start(host='127.0.0.1', port=0)
+      port = listener.sockets[0].getsockname()[1]
+      reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+      writer.write(b'serve a\npoint a X\nunsubscribe a\n' + b''.join(
+        b'point a S\n' if i % 8 < 4 else b'point a R\n' for i in range(49)
+      ))
+      self.assertEqual(
+        await read_until(
+          reader,
+          b'error a Points must not be played after the match is over.\n'
+        ),
+        [
+          b'error - Commands must be point, subscribe or unsubscribe with their arguments.\n',
+          b'error a Points must be S, A, R or D, not \'X\'.\n',
+          b'error a Matches must be subscribed to before they are unsubscribed from.\n',
+          b'error a Points must not be played after the match is over.\n'
+        ]
+      )
+      self.assertEqual(server.points, 48)
+
+      writer.close()
+      listener.close()
+      await listener.wait_closed()
+
+    asyncio.run(run())
+
+  def test_long_command(self):
+    async def run():
+      server = tennis.server.Server()
+      listener = await server.start(host='127.0.0.1', port=0)
+      port = listener.sockets[0].getsockname()[1]
+      reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+      writer.write(b'subscribe ' + b'a' * tennis.server._LIMIT + b'\nsubscribe b\n')
+      self.assertEqual(
+        await asyncio.wait_for(reader.read(), 5),
+        'error - Commands must be at most {} bytes long.\n'.format(tennis.server._LIMIT).encode()
+      )
+      self.assertEqual(server.connections, 0)
+      self.assertEqual(server._subscribers, {})
+
+      writer.close()
+      listener.close()
+      await listener.wait_closed()
+
+    asyncio.run(run())
+
+  def test_unix(self):
+    async def run(path):
+      server = tennis.server.Server(match_format=tennis.MatchFormat.FAST4)
+      listener = await server.start(path=path)
+      reader, writer = await asyncio.open_unix_connection(path)
+
+      writer.write(b'point a S\nsubscribe a\n')
+      self.assertEqual(await read_until(reader, b'score a 0-0 15-0\n'), [b'score a 0-0 15-0\n'])
+      self.assertIs(server.matches['a'].match_format, tennis.MatchFormat.FAST4)
+
+      writer.close()
+      listener.close()
+      await listener.wait_closed()
+
+    with tempfile.TemporaryDirectory() as directory:
+      asyncio.run(run(os.path.join(directory, 'socket')))
+
+  def test_conflation(self):
+    class Writer:
+      def __init__(self):
+        self.data = []
+        self.readable = asyncio.Event()
+
+      def write(self, data):
+        self.data.append(data)
+
+      async def drain(self):
+        await self.readable.wait()
+
+    async def run():
+      writer = Writer()
+      connection = tennis.server._Connection(writer)
+      sender = asyncio.get_running_loop().create_task(connection.run())
+      connection.send('a', b'1')
+      await asyncio.sleep(0)
+      for i in range(2, 100):
+        connection.send('a', str(i).encode())
+        connection.send('b', str(i).encode())
+        await asyncio.sleep(0)
+
+      connection.send(None, b'x')
+      connection.send(None, b'y')
+      self.assertEqual(writer.data, [b'1'])
+
+      writer.readable.set()
+      await asyncio.wait_for(connection.flushed(), 5)
+      self.assertEqual(writer.data, [b'1', b'9999xy'])
+      sender.cancel()
+
+    asyncio.run(run())
+
+if __name__ == '__main__':
+  unittest.main()
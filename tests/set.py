@@ -1,3 +1,4 @@
+import io
 import re
 import unittest
 
@@ -12,6 +13,7 @@ class Set(unittest.TestCase):
     self.assertFalse(zet.deciding_point)
     self.assertEqual(zet.tiebreak_games, 6)
     self.assertEqual(zet.tiebreak_points, 7)
+    self.assertTrue(zet.history)
 
   def test_init_args(self):
     with self.assertRaisesRegex(
@@ -26,7 +28,8 @@ class Set(unittest.TestCase):
       tiebreak_games=2,
       deciding_point=True,
       target_games=3,
-      games=[tennis.Game(server_points=3, returner_points=4)]
+      games=[tennis.Game(server_points=3, returner_points=4)],
+      trusted=True
     )
 
     self.assertEqual(zet.games, [tennis.Game(server_points=3, returner_points=4)])
@@ -67,6 +70,81 @@ class Set(unittest.TestCase):
     ):
       tennis.Set(tiebreak_games=1, tiebreak_points=-1)
 
+  def test_init_invalid_games(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Sets must have at least one game.'))
+    ):
+      tennis.Set(games=[])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('The last game of a set must be unfinished unless the set is over.'))
+    ):
+      tennis.Set(games=[tennis.Game(server_points=4)])
+
+    self.assertTrue(
+      tennis.Set(games=[tennis.Tiebreak(first_server_points=7)], tiebreak_games=0).winner
+    )
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Only the last game of a set may be unfinished.'))
+    ):
+      tennis.Set(games=[tennis.Game(), tennis.Game()])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Games must not be played after the set is over.'))
+    ):
+      tennis.Set(
+        games=[tennis.Game(server_points=4), tennis.Game(returner_points=4), tennis.Game()],
+        target_games=2
+      )
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape(
+        'Tiebreaks must be played exactly when each player has won tiebreak_games games.'
+      ))
+    ):
+      tennis.Set(games=[tennis.Tiebreak()])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape(
+        'Tiebreaks must be played exactly when each player has won tiebreak_games games.'
+      ))
+    ):
+      tennis.Set(games=[tennis.Game()], tiebreak_games=0)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Games must have the set\'s format.'))
+    ):
+      tennis.Set(games=[tennis.Game(deciding_point=True)])
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Games must have the set\'s format.'))
+    ):
+      tennis.Set(games=[tennis.Tiebreak(target_points=10)], tiebreak_games=0)
+
+    zet = tennis.Set(
+      games=[
+        tennis.Game(server_points=4),
+        tennis.Game(server_points=4),
+        tennis.Tiebreak(first_server_points=1)
+      ],
+      target_games=2,
+      tiebreak_games=1
+    )
+    self.assertEqual(zet.first_server_games(), 1)
+    self.assertEqual(zet.first_returner_games(), 1)
+
+    zet = tennis.Set(games=[tennis.Game(), tennis.Game()], trusted=True)
+    self.assertEqual(zet.games, [tennis.Game(), tennis.Game()])
+
   def test_init_first_game(self):
     zet = tennis.Set(games=None, deciding_point=False, tiebreak_games=1, tiebreak_points=2)
 
@@ -93,11 +171,17 @@ class Set(unittest.TestCase):
   def test_first_server_games(self):
     self.assertEqual(tennis.Set().first_server_games(), 0)
     self.assertEqual(
-      tennis.Set(games=[tennis.Game(server_points=0, returner_points=4)]).first_server_games(),
+      tennis.Set(
+        games=[tennis.Game(server_points=0, returner_points=4)],
+        trusted=True
+      ).first_server_games(),
       0
     )
     self.assertEqual(
-      tennis.Set(games=[tennis.Game(server_points=4, returner_points=0)]).first_server_games(),
+      tennis.Set(
+        games=[tennis.Game(server_points=4, returner_points=0)],
+        trusted=True
+      ).first_server_games(),
       1
     )
 
@@ -112,7 +196,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=0, returner_points=4)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       1
     )
@@ -121,7 +206,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       0
     )
@@ -132,7 +218,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       0
     )
@@ -142,7 +229,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=7, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       0
     )
@@ -152,7 +240,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=7, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       1
     )
@@ -168,7 +257,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=0, returner_points=4)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       2
     )
@@ -177,7 +267,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       1
     )
@@ -188,7 +279,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       1
     )
@@ -198,7 +290,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=7, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       1
     )
@@ -208,7 +301,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=7, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_server_games(),
       2
     )
@@ -216,11 +310,17 @@ class Set(unittest.TestCase):
   def test_first_returner_games(self):
     self.assertEqual(tennis.Set().first_returner_games(), 0)
     self.assertEqual(
-      tennis.Set(games=[tennis.Game(server_points=0, returner_points=4)]).first_returner_games(),
+      tennis.Set(
+        games=[tennis.Game(server_points=0, returner_points=4)],
+        trusted=True
+      ).first_returner_games(),
       1
     )
     self.assertEqual(
-      tennis.Set(games=[tennis.Game(server_points=4, returner_points=0)]).first_returner_games(),
+      tennis.Set(
+        games=[tennis.Game(server_points=4, returner_points=0)],
+        trusted=True
+      ).first_returner_games(),
       0
     )
 
@@ -235,7 +335,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=0, returner_points=4)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       1
     )
@@ -244,7 +345,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       2
     )
@@ -255,7 +357,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       2
     )
@@ -265,7 +368,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=7, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       3
     )
@@ -275,7 +379,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=0, returner_points=4),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=7, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       2
     )
@@ -291,7 +396,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=0, returner_points=4)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       0
     )
@@ -300,7 +406,8 @@ class Set(unittest.TestCase):
         games=[
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       1
     )
@@ -311,7 +418,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       1
     )
@@ -321,7 +429,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=0, first_returner_points=7, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       2
     )
@@ -331,7 +440,8 @@ class Set(unittest.TestCase):
           tennis.Game(server_points=4, returner_points=0),
           tennis.Game(server_points=4, returner_points=0),
           tennis.Tiebreak(first_server_points=7, first_returner_points=0, target_points=7)
-        ]
+        ],
+        trusted=True
       ).first_returner_games(),
       1
     )
@@ -431,21 +541,33 @@ class Set(unittest.TestCase):
       ).first_server_to_serve()
 
     self.assertTrue(
-      tennis.Set(games=[tennis.Tiebreak(first_server_points=0)]).first_server_to_serve()
+      tennis.Set(
+        games=[tennis.Tiebreak(first_server_points=0)],
+        trusted=True
+      ).first_server_to_serve()
     )
     self.assertFalse(
-      tennis.Set(games=[tennis.Tiebreak(first_server_points=1)]).first_server_to_serve()
+      tennis.Set(
+        games=[tennis.Tiebreak(first_server_points=1)],
+        trusted=True
+      ).first_server_to_serve()
     )
     self.assertFalse(
-      tennis.Set(games=[tennis.Tiebreak(first_server_points=2)]).first_server_to_serve()
+      tennis.Set(
+        games=[tennis.Tiebreak(first_server_points=2)],
+        trusted=True
+      ).first_server_to_serve()
     )
     self.assertTrue(
-      tennis.Set(games=[tennis.Tiebreak(first_server_points=3)]).first_server_to_serve()
+      tennis.Set(
+        games=[tennis.Tiebreak(first_server_points=3)],
+        trusted=True
+      ).first_server_to_serve()
     )
 
     self.assertTrue(tennis.Set(games=[tennis.Game()]).first_server_to_serve())
-    self.assertFalse(tennis.Set(games=[tennis.Game()] * 2).first_server_to_serve())
-    self.assertTrue(tennis.Set(games=[tennis.Game()] * 3).first_server_to_serve())
+    self.assertFalse(tennis.Set(games=[tennis.Game()] * 2, trusted=True).first_server_to_serve())
+    self.assertTrue(tennis.Set(games=[tennis.Game()] * 3, trusted=True).first_server_to_serve())
 
   def test_point(self):
     with self.assertRaisesRegex(
@@ -1061,6 +1183,33 @@ class Set(unittest.TestCase):
       )
     )
 
+  def test_history(self):
+    zet = tennis.Set(target_games=3, tiebreak_games=2, tiebreak_points=3, history=False)
+    self.assertFalse(zet.history)
+
+    self.assertIsNone(zet.point(first_server=True))
+    self.assertEqual(zet.games, [tennis.Game(server_points=1)])
+
+    for first_server in [True] * 3 + [False] * 4 + [True] * 4:
+      self.assertIsNone(zet.point(first_server=first_server))
+    self.assertEqual(zet.games, [tennis.Game()])
+    self.assertEqual(zet.first_server_games(), 2)
+    self.assertEqual(zet.first_returner_games(), 1)
+    self.assertFalse(zet.first_server_to_serve())
+
+    for first_server in [False] * 4:
+      self.assertIsNone(zet.point(first_server=first_server))
+    self.assertEqual(zet.games, [tennis.Tiebreak(target_points=3)])
+    self.assertEqual(zet.first_server_games(), 2)
+    self.assertEqual(zet.first_returner_games(), 2)
+    self.assertTrue(zet.first_server_to_serve())
+
+    for first_server in [False] * 2:
+      self.assertIsNone(zet.point(first_server=first_server))
+    self.assertFalse(zet.point(first_server=False))
+    self.assertEqual(zet.games, [tennis.Tiebreak(first_returner_points=3, target_points=3)])
+    self.assertEqual(zet.first_returner_games(), 3)
+
   def test_str(self):
     self.assertEqual(
       str(tennis.Set(
@@ -1071,7 +1220,8 @@ class Set(unittest.TestCase):
         target_games=8,
         deciding_point=True,
         tiebreak_games=5,
-        tiebreak_points=7
+        tiebreak_points=7,
+        trusted=True
       )),
       'Set('
         'games=['
@@ -1095,7 +1245,8 @@ class Set(unittest.TestCase):
         target_games=8,
         deciding_point=True,
         tiebreak_games=5,
-        tiebreak_points=7
+        tiebreak_points=7,
+        trusted=True
       )),
       'Set('
         'games=['
@@ -1109,6 +1260,23 @@ class Set(unittest.TestCase):
       ')'
     )
 
+  def test_write(self):
+    zet = tennis.Set(
+      games=[
+        tennis.Game(server_points=1, returner_points=2, deciding_point=True),
+        tennis.Tiebreak(first_server_points=3, first_returner_points=4, target_points=7)
+      ],
+      target_games=8,
+      deciding_point=True,
+      tiebreak_games=5,
+      tiebreak_points=7,
+      trusted=True
+    )
+    output = io.StringIO()
+    zet.write(file=output)
+
+    self.assertEqual(output.getvalue(), str(zet))
+
   def test_eq(self):
     self.assertEqual(
       tennis.Set(
@@ -1126,11 +1294,15 @@ class Set(unittest.TestCase):
         tiebreak_points=3
       )
     )
-    self.assertNotEqual(tennis.Set(games=None), tennis.Set(games=[tennis.Tiebreak()]))
+    self.assertNotEqual(tennis.Set(games=None), tennis.Set(games=[tennis.Tiebreak()], trusted=True))
     self.assertNotEqual(tennis.Set(target_games=5), tennis.Set(target_games=6))
     self.assertNotEqual(tennis.Set(deciding_point=True), tennis.Set(deciding_point=False))
     self.assertNotEqual(tennis.Set(tiebreak_games=1), tennis.Set(tiebreak_games=2))
     self.assertNotEqual(tennis.Set(tiebreak_points=3), tennis.Set(tiebreak_points=4))
 
+  def test_hash(self):
+    with self.assertRaisesRegex(TypeError, '^unhashable type: \'Set\'$'):
+      hash(tennis.Set())
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,62 @@
+import copy
+import pickle
+import re
+import unittest
+
+import tennis
+
+class SetFormat(unittest.TestCase):
+  def test_init_no_args(self):
+    set_format = tennis.SetFormat()
+
+    self.assertEqual(set_format.target_games, 6)
+    self.assertFalse(set_format.deciding_point)
+    self.assertEqual(set_format.tiebreak_games, 6)
+    self.assertEqual(set_format.tiebreak_points, 7)
+
+  def test_init_interned(self):
+    set_format = tennis.SetFormat(target_games=4, tiebreak_games=3, tiebreak_points=5)
+
+    self.assertIs(tennis.SetFormat(tiebreak_points=5, tiebreak_games=3, target_games=4), set_format)
+    self.assertIsNot(tennis.SetFormat(target_games=4), set_format)
+    self.assertIs(copy.deepcopy(set_format), set_format)
+    self.assertIs(pickle.loads(pickle.dumps(set_format)), set_format)
+
+  def test_init_invalid(self):
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('tiebreak_games and tiebreak_points must both be None or non-None.'))
+    ):
+      tennis.SetFormat(tiebreak_games=None)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Point scores must be non-negative.'))
+    ):
+      tennis.SetFormat(tiebreak_points=-1)
+
+  def test_immutable(self):
+    set_format = tennis.SetFormat()
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Formats cannot be modified.'))
+    ):
+      set_format.target_games = 4
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('Formats cannot be modified.'))
+    ):
+      del set_format.target_games
+
+    self.assertEqual(set_format.target_games, 6)
+
+  def test_repr(self):
+    self.assertEqual(
+      repr(tennis.SetFormat(deciding_point=True, tiebreak_games=None, tiebreak_points=None)),
+      'SetFormat(target_games=6, deciding_point=True, tiebreak_games=None, tiebreak_points=None)'
+    )
+
+if __name__ == '__main__':
+  unittest.main()
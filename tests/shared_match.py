@@ -0,0 +1,133 @@
+import random
+import threading
+import unittest
+
+import tennis
+
+class SharedMatch(unittest.TestCase):
+  def test_init(self):
+    shared = tennis.SharedMatch()
+    self.assertEqual(shared.version, 0)
+    self.assertEqual(shared.snapshot().match, tennis.Match())
+    self.assertEqual(repr(shared.snapshot()), 'MatchSnapshot(version=0, scoreline=\'0-0\')')
+
+    match = tennis.Match.from_scoreline(scoreline='6-4 2-1', match_format=tennis.MatchFormat.NO_AD)
+    snapshot = tennis.SharedMatch(match=match).snapshot()
+    self.assertEqual(snapshot.scoreline, '6-4 2-1')
+    self.assertIs(snapshot.match.match_format, tennis.MatchFormat.NO_AD)
+
+  def test_eq(self):
+    shared = tennis.SharedMatch()
+    first = shared.snapshot()
+    self.assertEqual(first, first)
+    self.assertEqual(first, tennis.SharedMatch().snapshot())
+    self.assertNotEqual(first, tennis.SharedMatch(match=tennis.Match(target_sets=3)).snapshot())
+    self.assertNotEqual(first, first.match)
+
+    second = shared.points(first_servers=[True] * 3 + [False] * 4)
+    self.assertNotEqual(second, first)
+
+    match = tennis.Match()
+    for first_server in [True] * 3 + [False] * 4:
+      match.point(first_server=first_server)
+
+    other = tennis.SharedMatch(match=match).snapshot()
+    self.assertEqual(other.version, 0)
+    self.assertEqual(other.match == second.match, other == second)
+    self.assertEqual(other, second)
+    self.assertEqual(hash(other), hash(second))
+    self.assertEqual(len({first, second, other}), 2)
+
+    generator = random.Random(0)
+    for i in range(100):
+      first_servers = [generator.random() < 0.5 for j in range(40)]
+      matches = [tennis.Match(), tennis.Match()]
+      for match in matches:
+        for first_server in first_servers[:generator.randrange(36, 41)]:
+          match.point(first_server=first_server)
+
+      snapshots = [tennis.SharedMatch(match=match).snapshot() for match in matches]
+      self.assertEqual(snapshots[0] == snapshots[1], matches[0] == matches[1])
+      if matches[0] == matches[1]:
+        self.assertEqual(hash(snapshots[0]), hash(snapshots[1]))
+
+  def test_point(self):
+    shared = tennis.SharedMatch()
+    first = shared.snapshot()
+    second = shared.point(first_server=True)
+    self.assertIs(shared.snapshot(), second)
+    self.assertEqual((second.version, second.scoreline), (1, '0-0 15-0'))
+    self.assertEqual(first.scoreline, '0-0')
+    self.assertIs(second.match, second.match)
+
+    third = shared.points(first_servers=[True] * 3 + [False] * 4)
+    self.assertEqual((third.version, third.scoreline), (2, '1-1'))
+    self.assertEqual(second.scoreline, '0-0 15-0')
+    self.assertIsNone(third.winner)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^Cannot advance this match\'s score because the match is over\\.$'
+    ):
+      shared.points(first_servers=[True] * 200)
+
+    self.assertEqual((shared.version, shared.snapshot().scoreline), (3, '6-1 6-0'))
+    self.assertTrue(shared.snapshot().winner)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^Points must not be played after the match is over\\.$'
+    ):
+      shared.point(first_server=True)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^Cannot advance this match\'s score because the match is over\\.$'
+    ):
+      shared.points(first_servers=[True])
+
+    self.assertEqual(shared.version, 3)
+
+    shared = tennis.SharedMatch()
+    first = shared.snapshot()
+    self.assertIs(shared.points(first_servers=[]), first)
+    self.assertIs(shared.points(first_servers=iter([])), first)
+    self.assertEqual(shared.version, 0)
+
+  def test_threads(self):
+    generator = random.Random(0)
+    match = tennis.Match()
+    first_servers = []
+    scorelines = [match.scoreline()]
+    while match.winner is None:
+      first_servers.append(generator.random() < 0.5)
+      match.point(first_server=first_servers[-1])
+      scorelines.append(match.scoreline())
+
+    shared = tennis.SharedMatch()
+    errors = []
+
+    def read():
+      version = 0
+      while version < len(first_servers):
+        snapshot = shared.snapshot()
+        if snapshot.version < version or snapshot.scoreline != scorelines[snapshot.version]:
+          errors.append(snapshot)
+
+        version = snapshot.version
+
+    readers = [threading.Thread(target=read) for i in range(4)]
+    for reader in readers:
+      reader.start()
+
+    for first_server in first_servers:
+      shared.point(first_server=first_server)
+
+    for reader in readers:
+      reader.join()
+
+    self.assertEqual(errors, [])
+    self.assertEqual(shared.snapshot().match, match)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,167 @@
+import asyncio
+import unittest
+
+import tennis
+import tennis.events
+
+'''
+:param list groups: lists of points, each of which is fed without suspending
+:return: an asynchronous iterator of the points, which suspends between groups
+'''
+async def feed(groups):
+  for group in groups:
+    for first_server in group:
+      yield first_server
+
+    await asyncio.sleep(0)
+
+'''
+:param Match match: match to stream
+:param feed: asynchronous iterable of the points
+:param dict kwargs: other keyword arguments of stream
+:return: a list of the updates yielded
+'''
+async def updates(match, feed, **kwargs):
+  return [update async for update in tennis.stream(match=match, feed=feed, **kwargs)]
+
+'''
+:param Match match: match to stream
+:param feed: asynchronous iterable of the points
+:param list result: list to append the updates to as they are yielded, so that they are kept if
+                    the stream raises
+'''
+async def collect(match, feed, result):
+  async for update in tennis.stream(match=match, feed=feed):
+    result.append(update)
+
+class Stream(unittest.TestCase):
+  def test_stream(self):
+    match = tennis.Match()
+    result = asyncio.run(updates(match, feed([[True] * 4, [True, False], [False] * 3])))
+
+    self.assertEqual([update.points for update in result], [4, 2, 3])
+    self.assertEqual([update.scoreline for update in result], ['1-0', '1-0 15-15', '1-1'])
+    self.assertEqual(result[0].events, [
+      tennis.events.GameWon(set_index=0, game_index=0, first_server=True)
+    ])
+    self.assertEqual(result[1].events, [])
+    self.assertEqual(result[2].events, [
+      tennis.events.GameWon(set_index=0, game_index=1, first_server=False)
+    ])
+    self.assertIsNone(result[2].winner)
+    self.assertIsNone(match._observers)
+    self.assertEqual(
+      repr(result[1]),
+      'ScoreUpdate(points=2, scoreline=\'1-0 15-15\', winner=None, events=[])'
+    )
+
+  def test_match_over(self):
+    match = tennis.Match()
+    result = asyncio.run(updates(match, feed([[True] * 44, [True] * 4])))
+
+    self.assertEqual([update.points for update in result], [44, 4])
+    self.assertTrue(result[-1].winner)
+    self.assertEqual(result[-1].scoreline, '6-0 6-0')
+    self.assertEqual(
+      [type(event) for event in result[-1].events],
+      [tennis.events.GameWon, tennis.events.Break, tennis.events.SetWon, tennis.events.MatchWon]
+    )
+
+    for batches in ([[True] * 49], [[True] * 48, [True]], [[True] * 44, [True] * 4, [True] * 4]):
+      match = tennis.Match()
+      result = []
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^Cannot advance this match\'s score because the match is over\\.$'
+      ):
+        asyncio.run(collect(match, feed(batches), result))
+
+      self.assertEqual(sum(update.points for update in result), 48)
+      self.assertTrue(result[-1].winner)
+      self.assertEqual(match.scoreline(), '6-0 6-0')
+
+  def test_max_batch(self):
+    result = asyncio.run(updates(tennis.Match(), feed([[True] * 5]), max_batch=2))
+
+    self.assertEqual(sum(update.points for update in result), 5)
+    self.assertTrue(all(update.points <= 2 for update in result))
+
+    with self.assertRaisesRegex(RuntimeError, '^max_batch must be at least 1\\.$'):
+      asyncio.run(updates(tennis.Match(), feed([]), max_batch=0))
+
+  def test_feed_error(self):
+    async def failing():
+      yield True
+      yield True
+      raise ValueError('feed failed')
+
+    async def run(match):
+      result = []
+      with self.assertRaisesRegex(ValueError, '^feed failed$'):
+        async for update in tennis.stream(match=match, feed=failing()):
+          result.append(update)
+
+      return result
+
+    match = tennis.Match()
+    self.assertEqual([update.scoreline for update in asyncio.run(run(match))], ['0-0 30-0'])
+    self.assertIsNone(match._observers)
+
+  def test_feed_cancelled(self):
+    async def cancelled(points):
+      for i in range(points):
+        yield True
+
+      await asyncio.sleep(0)
+      future = asyncio.get_running_loop().create_future()
+      future.cancel()
+      await future
+
+    async def run(match, points, result):
+      consumer = asyncio.get_running_loop().create_task(collect(match, cancelled(points), result))
+      await asyncio.wait([consumer], timeout=5)
+      return consumer.cancelled()
+
+    for points in (0, 2):
+      match = tennis.Match()
+      result = []
+      self.assertTrue(asyncio.run(run(match, points, result)))
+      self.assertEqual(sum(update.points for update in result), points)
+      self.assertIsNone(match._observers)
+
+  def test_cancel(self):
+    closed = []
+
+    async def endless():
+      try:
+        yield True
+        await asyncio.Event().wait()
+      finally:
+        closed.append(True)
+
+    async def consume(match, started):
+      async for update in tennis.stream(match=match, feed=endless()):
+        started.set()
+
+    async def run(match):
+      started = asyncio.Event()
+      task = asyncio.get_running_loop().create_task(consume(match, started))
+      await started.wait()
+      task.cancel()
+      with self.assertRaises(asyncio.CancelledError):
+        await task
+
+      self.assertEqual(closed, [True])
+
+      closed.clear()
+      iterator = tennis.stream(match=match, feed=endless())
+      self.assertEqual((await iterator.__anext__()).scoreline, '0-0 30-0')
+      await iterator.aclose()
+      self.assertEqual(closed, [True])
+
+    match = tennis.Match()
+    asyncio.run(run(match))
+    self.assertIsNone(match._observers)
+
+if __name__ == '__main__':
+  unittest.main()
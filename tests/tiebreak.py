@@ -194,5 +194,9 @@ class Tiebreak(unittest.TestCase):
       tennis.Tiebreak(first_server_points=2, first_returner_points=1)
     )
 
+  def test_hash(self):
+    with self.assertRaisesRegex(TypeError, '^unhashable type: \'Tiebreak\'$'):
+      hash(tennis.Tiebreak())
+
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,156 @@
+import os
+import re
+import tempfile
+import time
+import unittest
+
+import tennis
+
+class BrokenMatch(tennis.Match):
+  '''
+  Python class for matches in which every point fails to be played.
+  '''
+  def point(self, *, first_server):
+    raise RuntimeError('Points cannot be played.')
+
+class WriteAheadLog(unittest.TestCase):
+  def setUp(self):
+    self.directory = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.directory.name, 'log')
+
+  def tearDown(self):
+    self.directory.cleanup()
+
+  def test_init(self):
+    with tennis.WriteAheadLog(path=self.path) as log:
+      self.assertEqual(log.matches, {})
+      self.assertIs(log.match_format, tennis.MatchFormat())
+      self.assertEqual(log.points, 0)
+      self.assertEqual(log.recovered_points, 0)
+
+    self.assertEqual(os.path.getsize(self.path), 0)
+
+    with self.assertRaisesRegex(
+      RuntimeError,
+      '^{}$'.format(re.escape('checkpoint_points must be at least 1.'))
+    ):
+      tennis.WriteAheadLog(path=self.path, checkpoint_points=0)
+
+  def test_recover(self):
+    with tennis.WriteAheadLog(path=self.path, checkpoint_points=10) as log:
+      log.add(match_id='fast4', match=tennis.Match(match_format=tennis.MatchFormat.FAST4))
+      for i in range(25):
+        log.point(match_id='a', first_server=i % 3 != 0)
+        log.point(match_id='fast4', first_server=i % 2 == 0)
+
+      log.point(match_id='b', first_server=False)
+      log.point(match_id='c', first_server=True)
+      log.remove(match_id='c')
+      expected = {match_id: match.to_bytes() for match_id, match in log.matches.items()}
+
+    with tennis.WriteAheadLog(path=self.path, checkpoint_points=10) as log:
+      self.assertEqual(
+        {match_id: match.to_bytes() for match_id, match in log.matches.items()},
+        expected
+      )
+      self.assertEqual(log.recovered_points, 5 + 5 + 1)
+      self.assertIs(log.matches['fast4'].match_format, tennis.MatchFormat.FAST4)
+      self.assertEqual(log.matches['b'].scoreline(), '0-0 0-15')
+
+      log.point(match_id='b', first_server=False)
+      log.compact()
+
+    with tennis.WriteAheadLog(path=self.path) as log:
+      self.assertEqual(log.recovered_points, 0)
+      self.assertEqual(log.matches['b'].scoreline(), '0-0 0-30')
+      self.assertEqual(sorted(log.matches), ['a', 'b', 'fast4'])
+
+  def test_torn_write(self):
+    with tennis.WriteAheadLog(path=self.path) as log:
+      for i in range(3):
+        log.point(match_id='a', first_server=True)
+
+    size = os.path.getsize(self.path)
+    with open(self.path, 'ab') as file:
+      file.write(b'\x0c\x00\x01a')
+
+    with tennis.WriteAheadLog(path=self.path) as log:
+      self.assertEqual(log.matches['a'].scoreline(), '0-0 40-0')
+      self.assertEqual(os.path.getsize(self.path), size)
+      log.point(match_id='a', first_server=True)
+
+    with open(self.path, 'r+b') as file:
+      file.seek(size + 5)
+      file.write(b'\xff')
+
+    with tennis.WriteAheadLog(path=self.path) as log:
+      self.assertEqual(log.matches['a'].scoreline(), '0-0 40-0')
+
+  def test_sync(self):
+    with tennis.WriteAheadLog(path=self.path, sync_points=4) as log:
+      for i in range(10):
+        log.point(match_id='a', first_server=True)
+
+      self.assertEqual(log.syncs, 2)
+
+    with tennis.WriteAheadLog(path=self.path, sync_points=None, sync_seconds=3600) as log:
+      for i in range(10):
+        log.point(match_id='a', first_server=True)
+
+      self.assertEqual(log.syncs, 0)
+      log.sync()
+      self.assertEqual(log.syncs, 1)
+
+    with tennis.WriteAheadLog(path=self.path, sync_points=None, sync_seconds=0) as log:
+      log.point(match_id='a', first_server=True)
+      self.assertEqual(log.syncs, 1)
+
+    with tennis.WriteAheadLog(path=self.path, sync_points=None, sync_seconds=0.01) as log:
+      log.point(match_id='a', first_server=True)
+      deadline = time.monotonic() + 5
+      while log._dirty and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+      self.assertFalse(log._dirty)
+      self.assertGreaterEqual(log.syncs, 1)
+      syncs = log.syncs
+      time.sleep(0.05)
+      self.assertEqual(log.syncs, syncs)
+
+  def test_errors(self):
+    with tennis.WriteAheadLog(path=self.path) as log:
+      log.add(match_id='a')
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Match ids must be unique among live matches.'))
+      ):
+        log.add(match_id='a')
+
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Match ids must be of live matches.'))
+      ):
+        log.remove(match_id='b')
+
+      for i in range(48):
+        log.point(match_id='a', first_server=True)
+
+      with self.assertRaisesRegex(
+        RuntimeError,
+        '^{}$'.format(re.escape('Points must not be played after the match is over.'))
+      ):
+        log.point(match_id='a', first_server=True)
+
+    with tennis.WriteAheadLog(path=self.path) as log:
+      self.assertTrue(log.matches['a'].winner)
+      recovered_points = log.recovered_points
+      log.add(match_id='b', match=BrokenMatch())
+      with self.assertRaisesRegex(RuntimeError, '^Points cannot be played\\.$'):
+        log.point(match_id='b', first_server=True)
+
+    with tennis.WriteAheadLog(path=self.path) as log:
+      self.assertEqual(log.recovered_points, recovered_points)
+      self.assertEqual(log.matches['b'].scoreline(), '0-0')
+
+if __name__ == '__main__':
+  unittest.main()